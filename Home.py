@@ -1,32 +1,29 @@
 import streamlit as st
-from PIL import Image
-import base64
-
-# Carrega a imagem da logo
-logo = Image.open('img/logo.png')
+from portfolio.assets import image_data_uri, page_icon
+from portfolio.warmup import start_warmup
 
 # Configurações da página, incluindo o ícone da aba do navegador
 st.set_page_config(
     page_title="Victor Hugo de Paula - Portfólio",
-    page_icon=logo,
+    page_icon=page_icon("logo.png"),
     layout="wide"
 )
 
-def get_image_base64(path):
-    with open(path, "rb") as img_file: return base64.b64encode(img_file.read()).decode()
+# Prepara em segundo plano, uma vez por processo, os dados e imagens das outras páginas (ver portfolio/warmup.py)
+start_warmup()
 
 # streamlit run Home.py / python -m streamlit run Home.py
 def home_page():
 
     # Adiciona a logo na sidebar
     with st.sidebar:
-        st.image(logo, width=30)
+        st.image(image_data_uri("logo.png", 30), width=30)
 
     col1, col2 = st.columns([1, 9])
 
     with col1:
         # Coloca a logo na primeira coluna
-        st.image(logo, width=100)
+        st.image(image_data_uri("logo.png", 100), width=100)
 
     with col2:
         # Título
@@ -49,10 +46,9 @@ def home_page():
         """)
     
     with col3:
-        image_path = 'img/pfp.jpg' # Substitua 'sua_foto.jpg' pelo nome do seu arquivo
-        image_base64 = get_image_base64(image_path)
+        # Foto já redimensionada e convertida em WebP, codificada uma vez por processo
         st.markdown(f"""
-            <img src="data:image/png;base64,{image_base64}" 
+            <img src="{image_data_uri('pfp.jpg', 320)}" 
                  style="border: 2px solid #FDEBE2; border-radius: 7px; width: 320px; height: auto;">
         """, unsafe_allow_html=True)
 
@@ -0,0 +1,94 @@
+import argparse
+import ast
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from portfolio.data import PROJECT_ROOT
+
+# --- TEMPO DE IMPORT DE CADA PÁGINA ---
+# Executa, num subprocesso novo com "python -X importtime", os imports de nível de módulo de cada página (extraídos
+# com ast, sem rodar o resto do script) e soma o tempo cumulativo dos imports de primeiro nível. Falha se uma
+# página importar na carga algum módulo que deveria ser adiado (DEFERRED_MODULES; o que o próprio streamlit já
+# importa não conta) ou, com --baseline, se o tempo crescer acima do limiar em relação a um resultado anterior.
+# Uso, a partir da raiz do projeto:
+#   python -m benchmarks.import_time --out benchmarks/results/imports.json
+#   python -m benchmarks.import_time --baseline benchmarks/results/imports.json
+
+PAGES = [PROJECT_ROOT / "Home.py", *sorted((PROJECT_ROOT / "pages").glob("*.py"))]
+
+# Módulos que não podem ser carregados no import da página: ficam para quando a aba ou o recurso é usado
+DEFERRED_MODULES = ["scipy", "plotly.express", "statsmodels", "PIL"]
+# As páginas sem dados também não devem carregar a pilha de análise
+LIGHT_PAGES = ["Home.py", "1_Formação_e_experiências.py", "2_Minhas_skills.py"]
+LIGHT_DEFERRED_MODULES = ["pandas", "numpy", "pyarrow", "plotly"]
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+def page_imports(page):
+    source = page.read_text(encoding="utf-8")
+    nodes = [node for node in ast.parse(source).body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.get_source_segment(source, node) for node in nodes)
+
+def measure_imports(code):
+    # Devolve {módulo de primeiro nível: segundos cumulativos} e o conjunto de todos os módulos importados
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True).stderr
+    top_level, modules = {}, set()
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules.add(name)
+        if len(indent) == 1:
+            top_level[name] = int(cumulative) / 1e6
+    return top_level, modules
+
+def deferred_for(page):
+    return DEFERRED_MODULES + (LIGHT_DEFERRED_MODULES if page.name in LIGHT_PAGES else [])
+
+def check_page(page, repeat, framework_modules):
+    code = page_imports(page)
+    runs = [measure_imports(code) for _ in range(repeat)]
+    totals = [sum(top_level.values()) for top_level, _ in runs]
+    best_top_level, modules = runs[totals.index(min(totals))]
+    page_modules = modules - framework_modules
+    eager = sorted(name for name in deferred_for(page)
+                   if any(module == name or module.startswith(name + ".") for module in page_modules))
+    heaviest = sorted(best_top_level.items(), key=lambda item: -item[1])[:5]
+    return {"seconds": min(totals), "modules": len(modules), "heaviest": dict(heaviest), "eager": eager}
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o tempo de import de cada página e aponta regressões.")
+    parser.add_argument("--repeat", type=int, default=3, help="execuções por página (vale a menor)")
+    parser.add_argument("--baseline", type=Path, help="resultado anterior para comparar")
+    parser.add_argument("--threshold", type=float, default=0.25, help="variação relativa tolerada (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="variação absoluta mínima, em segundos")
+    parser.add_argument("--out", type=Path)
+    args = parser.parse_args()
+
+    _, framework_modules = measure_imports("import streamlit")
+    results = {page.name: check_page(page, args.repeat, framework_modules) for page in PAGES}
+    base = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else {}
+    failures = 0
+    print(f"{'página':<38} {'import (ms)':>11} {'base (ms)':>10} {'módulos':>8}  situação")
+    for name, result in results.items():
+        before = base.get(name, {}).get("seconds")
+        problems = [f"import antecipado de {', '.join(result['eager'])}"] if result["eager"] else []
+        if before and result["seconds"] > before * (1 + args.threshold) and result["seconds"] - before > args.min_delta:
+            problems.append("REGRESSÃO")
+        failures += bool(problems)
+        base_text = f"{before * 1e3:.0f}" if before else "-"
+        print(f"{name:<38} {result['seconds'] * 1e3:>11.0f} {base_text:>10} {result['modules']:>8}  {'; '.join(problems) or 'ok'}")
+        print("    " + ", ".join(f"{module} {seconds * 1e3:.0f} ms" for module, seconds in result["heaviest"].items()))
+
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
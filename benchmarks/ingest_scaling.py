@@ -0,0 +1,43 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from portfolio.data import CSV_PATH, build_store, build_store_parallel
+
+# --- BENCHMARK DE ESCALABILIDADE DA INGESTÃO ---
+# Mede o tempo de construção do store com 1..N processos (build_store_parallel) e compara com a ingestão
+# em um único DataFrame (build_store). Uso, a partir da raiz do projeto:
+#   python -m benchmarks.ingest_scaling --csv dataset/games.csv --max-workers 8
+
+def time_build(build, csv_path, repeat, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        store_dir = Path(tempfile.mkdtemp(prefix="ingest-bench-"))
+        try:
+            start = time.perf_counter()
+            df, _ = build(csv_path, store_dir, **kwargs)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            shutil.rmtree(store_dir, ignore_errors=True)
+    return best, len(df)
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalabilidade da ingestão de games.csv em 1..N processos.")
+    parser.add_argument("--csv", type=Path, default=CSV_PATH)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3, help="repetições por configuração (vale a melhor)")
+    args = parser.parse_args()
+
+    baseline, rows = time_build(build_store, args.csv, args.repeat, workers=1)
+    print(f"{args.csv.name}: {args.csv.stat().st_size / 2**20:.0f} MB, {rows} linhas, {os.cpu_count()} núcleos disponíveis")
+    print(f"{'processos':>9} {'tempo (s)':>10} {'speedup':>8}")
+    print(f"{'DataFrame':>9} {baseline:>10.2f} {1:>8.2f}")
+    for workers in range(1, args.max_workers + 1):
+        elapsed, _ = time_build(build_store_parallel, args.csv, args.repeat, workers=workers)
+        print(f"{workers:>9} {elapsed:>10.2f} {baseline / elapsed:>8.2f}")
+
+if __name__ == "__main__":
+    main()
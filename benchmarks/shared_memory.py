@@ -0,0 +1,61 @@
+import argparse
+import multiprocessing
+import pickle
+from pathlib import Path
+
+from portfolio.aggregates import build_cube
+from portfolio.data import CSV_PATH, STORE_DIR, load_games, read_store
+from portfolio.genres import build_genre_index
+from portfolio.memory import process_memory
+
+# --- MEMÓRIA COM VÁRIAS RÉPLICAS E SESSÕES ---
+# Sobe N processos (réplicas do dashboard) que carregam o store e atendem S sessões cada, e mostra a memória
+# de cada processo. No modo "shared" as sessões recebem o mesmo DataFrame (st.cache_resource) e o frame é uma
+# view do arquivo mapeado; no modo "cache_data" cada sessão recebe uma cópia desserializada, como st.cache_data
+# faria. Uso, a partir da raiz do projeto:
+#   python -m benchmarks.shared_memory --processes 4 --sessions 8
+
+def replica(store_dir, mode, sessions, barrier, results):
+    df = read_store(store_dir)
+    genre_index = build_genre_index(df['Genres'])
+    cube = build_cube(df, genre_index)
+    session_frames = [df if mode == "shared" else pickle.loads(pickle.dumps(df)) for _ in range(sessions)]
+    # Mede só depois que todas as réplicas carregaram, para que o PSS reflita as páginas compartilhadas
+    barrier.wait()
+    results.put(process_memory())
+    barrier.wait()
+    return len(session_frames), cube
+
+def run(store_dir, mode, processes, sessions):
+    context = multiprocessing.get_context("spawn")
+    barrier, results = context.Barrier(processes), context.Queue()
+    workers = [context.Process(target=replica, args=(store_dir, mode, sessions, barrier, results)) for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    memories = sorted((results.get() for _ in workers), key=lambda memory: memory["pid"])
+    for worker in workers:
+        worker.join()
+    return memories
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória por processo com réplicas e sessões simultâneas.")
+    parser.add_argument("--csv", type=Path, default=CSV_PATH)
+    parser.add_argument("--store-dir", type=Path, default=STORE_DIR)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--sessions", type=int, default=8, help="sessões atendidas por processo")
+    parser.add_argument("--mode", choices=["shared", "cache_data", "both"], default="both")
+    args = parser.parse_args()
+
+    df, _ = load_games(args.csv, args.store_dir)
+    print(f"Store: {len(df)} linhas, {args.processes} processos x {args.sessions} sessões")
+    for mode in (["shared", "cache_data"] if args.mode == "both" else [args.mode]):
+        memories = run(args.store_dir, mode, args.processes, args.sessions)
+        print(f"\nmodo {mode}")
+        print(f"{'pid':>8} {'RSS MB':>8} {'privado':>8} {'mapeado':>8} {'PSS MB':>8}")
+        for memory in memories:
+            mb = {key: value / 2**20 for key, value in memory.items() if key != "pid"}
+            print(f"{memory['pid']:>8} {mb.get('rss', 0):>8.0f} {mb.get('anon', 0):>8.0f} {mb.get('file', 0):>8.0f} {mb.get('pss', 0):>8.0f}")
+        print(f"{'total':>8} {'':>8} {sum(m.get('anon', 0) for m in memories) / 2**20:>8.0f} {'':>8} {sum(m.get('pss', 0) for m in memories) / 2**20:>8.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+import argparse
+import json
+import os
+import platform
+import runpy
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from portfolio.aggregates import build_cube
+from benchmarks.synthetic import INGEST_COLUMNS, generate_games_csv
+from portfolio.data import CSV_PATH, PROJECT_ROOT, load_games, load_search_index
+from portfolio.genres import build_genre_index
+from portfolio.explorer import EXPLORER_COLUMNS, export_chunks, ordered_rows, page_frame, sort_permutation
+from portfolio.owners import format_numbers, parse_owner_ranges
+from portfolio.search import build_search_index, search
+
+# --- SUÍTE DE BENCHMARKS DA PÁGINA DE ANÁLISE ---
+# Mede, sem rede e sem navegador, os caminhos quentes de pages/3_Análise_de_dados.py: carga fria (CSV -> store),
+# carga quente (store já processado), filtros de gênero/ano, as faixas de donos, o índice de busca, o explorador
+# paginado, os cálculos de cada aba e a serialização das figuras.
+# As funções da página são chamadas diretamente; com --apptest, a página inteira também é executada pelo AppTest
+# do Streamlit, uma vez por aba. Os datasets são o games.csv (quando disponível) e arquivos gerados por
+# benchmarks/synthetic.py com 1x, 10x e 100x o tamanho do dataset original.
+# Uso, a partir da raiz do projeto:
+#   python -m benchmarks.suite run --scales 1 10 --out benchmarks/results/atual.json
+#   python -m benchmarks.suite compare benchmarks/results/base.json benchmarks/results/atual.json
+
+PAGE_PATH = PROJECT_ROOT / "pages" / "3_Análise_de_dados.py"
+TABS = ["📊 Popularidade e Gêneros", "📈 Tendências de Mercado", "🔬 Inferência Estatística"]
+DEFAULT_WORK_DIR = Path(tempfile.gettempdir()) / "portfolio-bench"
+BASE_ROWS = 70_000
+
+# --- DATASETS ---
+
+def is_lfs_pointer(path):
+    with open(path, "rb") as file:
+        return file.read(40).startswith(b"version https://git-lfs")
+
+def synthetic_csv(rows, seed, work_dir):
+    # Só as colunas de ingestão (arquivos menores); o arquivo é reaproveitado entre execuções com os mesmos parâmetros
+    target = work_dir / f"synthetic-{rows}-s{seed}.csv"
+    if not target.exists():
+        work_dir.mkdir(parents=True, exist_ok=True)
+        generate_games_csv(target, rows, seed, columns=INGEST_COLUMNS)
+    return target
+
+# --- MEDIÇÃO ---
+
+def measure(fn, repeat, warmup=1, setup=None):
+    # Devolve as estatísticas de tempo e o resultado da última execução
+    result = None
+    for _ in range(warmup):
+        if setup: setup()
+        result = fn()
+    runs = []
+    for _ in range(repeat):
+        if setup: setup()
+        start = time.perf_counter()
+        result = fn()
+        runs.append(time.perf_counter() - start)
+    return {"median": statistics.median(runs), "min": min(runs), "max": max(runs), "runs": runs}, result
+
+def load_page_functions():
+    # Executa o módulo da página sem rodar data_analysis_page() (que só roda como __main__) e devolve suas funções.
+    # O aquecimento em segundo plano (portfolio/warmup.py) fica desligado para não competir com as medições.
+    os.environ["PORTFOLIO_WARMUP"] = "0"
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        return runpy.run_path(str(PAGE_PATH), run_name="benchmark")
+    finally:
+        os.chdir(cwd)
+
+def filter_keys(genre_index, df):
+    # Combinações de filtro fixas e reproduzíveis: os gêneros mais frequentes do próprio dataset
+    counts = genre_index.membership.sum(axis=0)
+    top = [genre_index.genres[i] for i in np.argsort(-counts, kind='stable')[:2]]
+    min_year, max_year = int(df['Release Year'].min()), int(df['Release Year'].max())
+    full = (min_year, max_year)
+    return {
+        "all": ((), 'any', full),
+        "one_genre": ((top[0],), 'any', full),
+        "two_genres_any": (tuple(sorted(top)), 'any', full),
+        "two_genres_all": (tuple(sorted(top)), 'all', full),
+        "year_window": ((), 'any', (max(min_year, max_year - 5), max_year)),
+    }
+
+# Buscas típicas: termo exato, prefixo curto (o caso mais caro) e vários termos com o último incompleto
+SEARCH_QUERIES = {"exact": "strategy ", "prefix_short": "s", "multi_term": "action rpg adv"}
+
+def bench_dataset(csv_path, work_dir, repeat, page):
+    results = {}
+    store_dir = work_dir / "stores" / csv_path.stem
+
+    def clear_store():
+        shutil.rmtree(store_dir, ignore_errors=True)
+
+    def load():
+        df, _ = load_games(csv_path, store_dir)
+        genre_index = build_genre_index(df['Genres'])
+        return df, genre_index, build_cube(df, genre_index)
+
+    results["cold_load"], _ = measure(load, max(1, repeat // 2), warmup=0, setup=clear_store)
+    results["warm_load"], (df, genre_index, cube) = measure(load, repeat)
+    results["warm_load"]["rows"] = len(df)
+
+    # Faixas de donos como lidas do CSV: coluna de texto e categórica (esquema de ingestão)
+    raw_owners = pd.read_csv(csv_path, usecols=['Estimated owners'], dtype={'Estimated owners': 'category'})['Estimated owners']
+    results["owners.parse_object"], _ = measure(lambda: parse_owner_ranges(raw_owners.astype(object)), repeat)
+    results["owners.parse_categorical"], _ = measure(lambda: parse_owner_ranges(raw_owners), repeat)
+    results["owners.format_numbers"], _ = measure(lambda: format_numbers(df['Total_Reviews'].to_numpy()), repeat)
+
+    results["search.build"], _ = measure(lambda: build_search_index(df), max(1, repeat // 2))
+    results["search.load"], search_index = measure(lambda: load_search_index(df, store_dir), repeat)
+    popularity = df['Total_Reviews'].to_numpy()
+    for name, text in SEARCH_QUERIES.items():
+        results[f"search.{name}"], _ = measure(lambda: search(search_index, text, limit=50, popularity=popularity), repeat)
+
+    selections = {}
+    for name, key in filter_keys(genre_index, df).items():
+        results[f"filter.{name}"], selections[name] = measure(lambda: page["select_games"](df, genre_index, cube, key), repeat)
+    frame, cells = selections["all"]["frame"], selections["all"]["cells"]
+
+    # Explorador: permutação de uma coluna (uma vez por versão dos dados), uma página da seleção e a exportação
+    results["explorer.sort_permutation"], permutation = measure(lambda: sort_permutation(df, 'Total_Reviews', True), repeat)
+    mask = selections["two_genres_any"]["mask"]
+    results["explorer.page"], _ = measure(lambda: page_frame(df, ordered_rows(mask, permutation), 10, 50, EXPLORER_COLUMNS), repeat)
+    for fmt in ("csv", "parquet"):
+        results[f"explorer.export_{fmt}"], size = measure(lambda: sum(len(chunk) for chunk in export_chunks(df, ordered_rows(mask, permutation), EXPLORER_COLUMNS, fmt)), max(1, repeat // 2))
+        results[f"explorer.export_{fmt}"]["bytes"] = size
+
+    tab_cases = {
+        "tab.popularity": lambda: page["build_popularity_figures"](frame, cube, cells),
+        "tab.market": lambda: page["build_market_figures"](frame, cube, cells),
+        "tab.price_trend": lambda: page["build_price_trend_figure"](cube, cells, 3),
+        "tab.inference": lambda: page["build_inference_results"](frame, cube, cells),
+        "tab.metacritic_scatter": lambda: page["build_metacritic_scatter"](frame, 1000, False),
+        "tab.metacritic_ci_t": lambda: page["metacritic_interval"](frame, cube, cells, 95, 't'),
+        "tab.metacritic_ci_bootstrap": lambda: page["metacritic_interval"](frame, cube, cells, 95, 'bootstrap'),
+        "tab.achievements_permutation": lambda: page["achievements_permutation"](frame),
+    }
+    figures = {}
+    for name, case in tab_cases.items():
+        results[name], output = measure(case, repeat)
+        figures.update(collect_figures(name.split(".", 1)[1], output))
+
+    for name, figure in figures.items():
+        results[f"serialize.{name}"], payload = measure(figure.to_json, repeat)
+        results[f"serialize.{name}"]["bytes"] = len(payload)
+    return results
+
+def collect_figures(prefix, output):
+    if hasattr(output, "to_json"):
+        return {prefix: output}
+    if isinstance(output, dict):
+        return {f"{prefix}.{key}": value for key, value in output.items() if hasattr(value, "to_json")}
+    return {}
+
+# --- EXECUÇÃO DA PÁGINA INTEIRA (APPTEST) ---
+
+def apptest_worker(repeat):
+    # Roda num subprocesso, com PORTFOLIO_CSV_PATH/PORTFOLIO_STORE_DIR apontando para o dataset
+    from streamlit.testing.v1 import AppTest
+    os.chdir(PROJECT_ROOT)
+    results = {}
+    for i, tab in enumerate(TABS):
+        runs = []
+        for _ in range(repeat + 1):
+            at = AppTest.from_file(str(PAGE_PATH), default_timeout=600)
+            at.session_state['analysis_tab'] = tab
+            start = time.perf_counter()
+            at.run()
+            runs.append(time.perf_counter() - start)
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+        # A primeira execução carrega o store e monta o cubo (cache_resource); as demais mostram o rerun típico
+        results[f"apptest.tab{i + 1}.first"] = {"median": runs[0], "min": runs[0], "max": runs[0], "runs": runs[:1]}
+        rest = runs[1:]
+        results[f"apptest.tab{i + 1}.rerun"] = {"median": statistics.median(rest), "min": min(rest), "max": max(rest), "runs": rest}
+    print(json.dumps(results))
+
+def bench_apptest(csv_path, work_dir, repeat):
+    env = dict(os.environ, PORTFOLIO_WARMUP="0", PORTFOLIO_CSV_PATH=str(csv_path), PORTFOLIO_STORE_DIR=str(work_dir / "stores" / csv_path.stem))
+    output = subprocess.run([sys.executable, "-m", "benchmarks.suite", "apptest-worker", "--repeat", str(repeat)],
+                            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+# --- RESULTADOS E COMPARAÇÃO ---
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    import plotly
+    import streamlit
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "versions": {"pandas": pd.__version__, "numpy": np.__version__, "plotly": plotly.__version__, "streamlit": streamlit.__version__},
+    }
+
+def run(args):
+    page = load_page_functions()
+    datasets = {}
+    if not args.skip_base:
+        if args.csv.exists() and not is_lfs_pointer(args.csv):
+            datasets["games"] = args.csv
+        else:
+            print(f"'{args.csv}' ausente ou ponteiro do Git LFS; medindo só os datasets sintéticos.", file=sys.stderr)
+    for factor in args.scales:
+        datasets[f"synthetic-{factor}x"] = synthetic_csv(factor * args.base_rows, args.seed, args.work_dir / "datasets")
+
+    report = {"environment": environment(), "repeat": args.repeat, "datasets": {}}
+    for name, csv_path in datasets.items():
+        print(f"[{name}] {csv_path.stat().st_size / 2**20:.0f} MB", file=sys.stderr)
+        results = bench_dataset(csv_path, args.work_dir, args.repeat, page)
+        if args.apptest:
+            results.update(bench_apptest(csv_path, args.work_dir, args.repeat))
+        report["datasets"][name] = {"csv_bytes": csv_path.stat().st_size, "results": results}
+        for case, stats in results.items():
+            print(f"  {case:<40} {stats['median'] * 1e3:>10.1f} ms", file=sys.stderr)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+def compare(args):
+    # Compara medianas caso a caso; só conta como regressão/melhora a variação acima do limiar relativo E do absoluto
+    base = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    regressions = 0
+    print(f"{'dataset':<18} {'caso':<40} {'base (ms)':>10} {'atual (ms)':>10} {'razão':>7}  situação")
+    for dataset, entry in current["datasets"].items():
+        base_results = base["datasets"].get(dataset, {}).get("results", {})
+        for case, stats in entry["results"].items():
+            if case not in base_results:
+                print(f"{dataset:<18} {case:<40} {'-':>10} {stats['median'] * 1e3:>10.1f} {'-':>7}  novo")
+                continue
+            before, after = base_results[case]["median"], stats["median"]
+            ratio = after / before if before else float("inf")
+            delta = after - before
+            if ratio > 1 + args.threshold and delta > args.min_delta:
+                status, regressions = "REGRESSÃO", regressions + 1
+            elif ratio < 1 - args.threshold and -delta > args.min_delta:
+                status = "melhora"
+            else:
+                status = "ok"
+            print(f"{dataset:<18} {case:<40} {before * 1e3:>10.1f} {after * 1e3:>10.1f} {ratio:>7.2f}  {status}")
+    print(f"\n{regressions} regressão(ões) acima de {args.threshold:.0%} e {args.min_delta * 1e3:.0f} ms.")
+    sys.exit(1 if regressions else 0)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks da página de análise de dados.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="executa a suíte e grava os resultados em JSON")
+    run_parser.add_argument("--csv", type=Path, default=CSV_PATH, help="CSV base (games.csv)")
+    run_parser.add_argument("--scales", type=int, nargs="*", default=[1, 10, 100], help="fatores dos datasets sintéticos")
+    run_parser.add_argument("--base-rows", type=int, default=BASE_ROWS, help="linhas do dataset sintético 1x")
+    run_parser.add_argument("--seed", type=int, default=0, help="semente dos datasets sintéticos")
+    run_parser.add_argument("--skip-base", action="store_true", help="não mede o CSV base, só os sintéticos")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--apptest", action="store_true", help="também executa a página inteira pelo AppTest")
+    run_parser.add_argument("--work-dir", type=Path, default=DEFAULT_WORK_DIR, help="onde ficam os datasets sintéticos e os stores")
+    run_parser.add_argument("--out", type=Path)
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="compara dois resultados e aponta regressões")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.15, help="variação relativa tolerada (0.15 = 15%%)")
+    compare_parser.add_argument("--min-delta", type=float, default=0.002, help="variação absoluta mínima, em segundos")
+    compare_parser.set_defaults(func=compare)
+
+    worker_parser = commands.add_parser("apptest-worker")
+    worker_parser.add_argument("--repeat", type=int, default=3)
+    worker_parser.set_defaults(func=lambda args: apptest_worker(args.repeat))
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+# --- GERADOR DE games.csv SINTÉTICO ---
+# Gera arquivos com o mesmo cabeçalho e formatos do games.csv original (datas "%b %d, %Y", faixas de donos
+# "20000 - 50000", gêneros separados por vírgula...), com distribuições próximas às da Steam: muitos jogos
+# gratuitos e preços terminados em .99, anos de lançamento concentrados nos mais recentes, contagens de
+# avaliações de cauda longa e proporcionais à faixa de donos, poucos jogos com nota do Metacritic.
+# Também inclui, em taxas pequenas, o que o pré-processamento precisa tratar: nulos, datas inválidas,
+# preços extremos e linhas duplicadas. A escrita é feita em pedaços, sem manter o arquivo em memória.
+# Uso, a partir da raiz do projeto:
+#   python -m benchmarks.synthetic --rows 1000000 --out /tmp/games-1m.csv
+
+COLUMNS = [
+    'AppID', 'Name', 'Release date', 'Estimated owners', 'Peak CCU', 'Required age', 'Price', 'DLC count',
+    'About the game', 'Supported languages', 'Full audio languages', 'Reviews', 'Header image', 'Website',
+    'Support url', 'Support email', 'Windows', 'Mac', 'Linux', 'Metacritic score', 'Metacritic url', 'User score',
+    'Positive', 'Negative', 'Score rank', 'Achievements', 'Recommendations', 'Notes', 'Average playtime forever',
+    'Average playtime two weeks', 'Median playtime forever', 'Median playtime two weeks', 'Developers',
+    'Publishers', 'Categories', 'Genres', 'Tags', 'Screenshots', 'Movies',
+]
+# Apenas as colunas lidas pela ingestão (ver INGEST_SCHEMA em portfolio/data.py), para arquivos menores
+INGEST_COLUMNS = ['AppID', 'Name', 'Release date', 'Estimated owners', 'Price', 'Genres', 'Positive', 'Negative',
+                  'Metacritic score', 'Recommendations', 'Achievements', 'Average playtime forever', 'Developers',
+                  'Publishers', 'Tags']
+
+# Gêneros e pesos aproximados da frequência na Steam
+GENRES = {
+    'Indie': 40, 'Casual': 22, 'Action': 22, 'Adventure': 21, 'Simulation': 11, 'Strategy': 10, 'RPG': 9,
+    'Early Access': 6, 'Free to Play': 5, 'Sports': 2.5, 'Racing': 2, 'Massively Multiplayer': 1.5,
+    'Education': 0.3, 'Utilities': 0.5, 'Design & Illustration': 0.4, 'Animation & Modeling': 0.2,
+    'Video Production': 0.15, 'Audio Production': 0.1, 'Photo Editing': 0.1, 'Software Training': 0.1,
+    'Game Development': 0.1, 'Web Publishing': 0.05, 'Accounting': 0.02, 'Violent': 0.5, 'Gore': 0.3,
+    'Nudity': 0.2, 'Sexual Content': 0.2,
+}
+EXTRA_TAGS = ['Singleplayer', 'Multiplayer', '2D', '3D', 'Pixel Graphics', 'Puzzle', 'Platformer', 'Shooter', 'Horror',
+              'Story Rich', 'Atmospheric', 'Open World', 'Co-op', 'Sci-fi', 'Fantasy', 'Retro', 'Survival', 'Roguelike',
+              'Visual Novel', 'Anime', 'Arcade', 'Exploration', 'Funny', 'Difficult', 'Turn-Based', 'First-Person']
+# Faixas de donos estimados da Steam e sua frequência aproximada
+OWNER_RANGES = {
+    '0 - 0': 0.04, '0 - 20000': 0.66, '20000 - 50000': 0.12, '50000 - 100000': 0.07, '100000 - 200000': 0.05,
+    '200000 - 500000': 0.035, '500000 - 1000000': 0.013, '1000000 - 2000000': 0.006, '2000000 - 5000000': 0.004,
+    '5000000 - 10000000': 0.0012, '10000000 - 20000000': 0.0005, '20000000 - 50000000': 0.0002,
+    '50000000 - 100000000': 0.00005, '100000000 - 200000000': 0.00001,
+}
+MONTHS = pa.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+FIRST_YEAR, LAST_YEAR = 1997, 2025
+WORDS = pa.array(['Dark', 'Lost', 'Super', 'Little', 'Eternal', 'Pixel', 'Hidden', 'Iron', 'Neon', 'Last', 'Wild',
+                  'Silent', 'Crystal', 'Shadow', 'Space', 'Dungeon', 'Kingdom', 'Legend', 'Tales', 'Quest', 'Hero',
+                  'Farm', 'City', 'Empire', 'Island', 'Knight', 'Racer', 'Tactics', 'Rogue', 'Chronicles'])
+STUDIO_SUFFIXES = pa.array(['Games', 'Studio', 'Interactive', 'Entertainment', 'Software', 'Works', 'Labs'])
+LANGUAGES = pa.array(["['English']", "['English', 'French', 'German', 'Spanish - Spain']", "['English', 'Russian']",
+                      "['English', 'Simplified Chinese', 'Japanese']", "['English', 'Portuguese - Brazil']"])
+CATEGORIES = pa.array(['Single-player', 'Single-player,Steam Achievements', 'Single-player,Multi-player,Steam Cloud',
+                       'Single-player,Steam Achievements,Full controller support', 'Multi-player,Online PvP,Co-op'])
+LOREM = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore "
+         "magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo. ") * 200
+
+# Taxas dos casos que o pré-processamento precisa tratar
+NULL_RATE = 0.0005
+INVALID_DATE_RATE = 0.003
+DUPLICATE_RATE = 0.001
+
+# As colunas de texto são montadas com os kernels do pyarrow.compute (take, junções elemento a elemento e de
+# listas), sem laços em Python por linha
+
+def _join(*parts, separator=''):
+    return pc.binary_join_element_wise(*parts, separator)
+
+def _names(rng, rows, vocabulary, min_count, max_count, weights=None, mask=None):
+    # Valores múltiplos separados por vírgula, sem repetição na mesma linha (amostragem ponderada via Gumbel-top-k)
+    log_weights = np.log(np.asarray(weights, dtype=np.float64)) if weights is not None else np.zeros(len(vocabulary))
+    keys = log_weights + rng.gumbel(size=(rows, len(vocabulary)))
+    top = np.argsort(-keys, axis=1)[:, :max_count]
+    counts = rng.integers(min_count, max_count + 1, rows)
+    chosen = top[np.arange(max_count) < counts[:, None]]
+    offsets = pa.array(np.concatenate([[0], np.cumsum(counts)]).astype(np.int32))
+    lists = pa.ListArray.from_arrays(offsets, pa.array(vocabulary).take(pa.array(chosen)), mask=mask)
+    return pc.binary_join(lists, ",")
+
+def _studios(rng, rows, pool):
+    # Poucos estúdios com muitos jogos e uma cauda longa de estúdios pequenos (Zipf)
+    ids = (rng.zipf(1.3, rows) - 1) % pool
+    return _join(WORDS.take(ids % len(WORDS)), STUDIO_SUFFIXES.take((ids // len(WORDS)) % len(STUDIO_SUFFIXES)), separator=' ')
+
+def _texts(rng, rows, text_bytes, variants=256):
+    # Descrições de tamanho variável em torno de text_bytes, sorteadas de um conjunto fixo de trechos
+    starts = rng.integers(0, 200, variants)
+    lengths = rng.integers(text_bytes // 2, text_bytes * 3 // 2 + 1, variants)
+    return pa.array([LOREM[start:start + length] for start, length in zip(starts, lengths)]).take(rng.integers(0, variants, rows))
+
+def _urls(ids, suffix):
+    return _join(pa.scalar('https://cdn.akamai.steamstatic.com/steam/apps/'), pc.cast(pa.array(ids), pa.string()), pa.scalar(suffix))
+
+def _with_nulls(rng, values, rate=NULL_RATE):
+    return pa.array(values, mask=rng.random(len(values)) < rate)
+
+def generate_chunk(rng, first_id, rows, columns=COLUMNS, text_bytes=300):
+    ids = first_id + np.cumsum(rng.integers(1, 20, rows))
+
+    # Anos concentrados nos mais recentes (o número de lançamentos cresce ~20% ao ano)
+    years = np.arange(FIRST_YEAR, LAST_YEAR + 1)
+    year_weights = np.exp(0.2 * (years - FIRST_YEAR))
+    year = rng.choice(years, rows, p=year_weights / year_weights.sum())
+    month_day = _join(MONTHS.take(rng.integers(0, 12, rows)), pc.cast(pa.array(rng.integers(1, 29, rows)), pa.string()), separator=' ')
+    dates = _join(month_day, pc.cast(pa.array(year), pa.string()), separator=', ')
+    dates = pc.if_else(pa.array(rng.random(rows) < INVALID_DATE_RATE), pa.scalar('Coming soon'), dates)
+
+    owner_labels = np.array(list(OWNER_RANGES))
+    owner_probs = np.array(list(OWNER_RANGES.values()))
+    owner_level = rng.choice(len(owner_labels), rows, p=owner_probs / owner_probs.sum())
+
+    free = rng.random(rows) < 0.2
+    price = np.clip(np.floor(rng.lognormal(np.log(7), 0.8, rows)) + 0.99, 0.99, 69.99)
+    extreme = rng.random(rows) < 0.005
+    price = np.where(extreme, rng.choice([99.99, 199.99, 999.98], rows), price)
+    price = np.where(free, 0.0, price).round(2)
+
+    # Avaliações de cauda longa, crescendo com a faixa de donos; parte negativa vem de uma proporção Beta
+    total_reviews = np.floor(rng.lognormal(1.0 + 1.1 * owner_level, 1.0)).astype(np.int64)
+    negative_share = rng.beta(2, 6, rows)
+    negative = np.floor(total_reviews * negative_share).astype(np.int64)
+    positive = total_reviews - negative
+    recommendations = np.where(rng.random(rows) < 0.6, 0, np.floor(positive * rng.uniform(0.05, 0.4, rows))).astype(np.int64)
+    metacritic = np.where(rng.random(rows) < 0.95, 0, np.clip(rng.normal(72, 10, rows), 20, 97)).astype(np.int64)
+    achievements = np.where(rng.random(rows) < 0.5, 0, np.ceil(rng.lognormal(3, 1, rows))).astype(np.int64)
+    playtime = np.where(rng.random(rows) < 0.75, 0, np.ceil(rng.lognormal(5, 1.3, rows))).astype(np.int64)
+
+    names = _join(WORDS.take(rng.integers(0, len(WORDS), rows)), WORDS.take(rng.integers(0, len(WORDS), rows)), separator=' ')
+    sequel = _join(names, pc.cast(pa.array(rng.integers(2, 5, rows)), pa.string()), separator=' ')
+    names = pc.if_else(pa.array(rng.random(rows) < 0.3), sequel, names)
+    genres = _names(rng, rows, list(GENRES), 1, 4, list(GENRES.values()), mask=pa.array(rng.random(rows) < 2 * NULL_RATE))
+
+    data = {
+        'AppID': pa.array(ids),
+        'Name': names,
+        'Release date': dates,
+        'Estimated owners': _with_nulls(rng, owner_labels[owner_level]),
+        'Price': _with_nulls(rng, price),
+        'Genres': genres,
+        'Positive': _with_nulls(rng, positive),
+        'Negative': pa.array(negative),
+        'Metacritic score': _with_nulls(rng, metacritic),
+        'Recommendations': pa.array(recommendations),
+        'Achievements': pa.array(achievements),
+        'Average playtime forever': pa.array(playtime),
+        'Developers': _studios(rng, rows, 5000),
+        'Publishers': _studios(rng, rows, 2000),
+        'Tags': _names(rng, rows, list(GENRES) + EXTRA_TAGS, 3, 10),
+    }
+    if 'About the game' in columns:
+        data.update({
+            'Peak CCU': pa.array(np.floor(positive * rng.uniform(0, 0.05, rows)).astype(np.int64)),
+            'Required age': pa.array(np.where(rng.random(rows) < 0.95, 0, rng.choice([13, 16, 17, 18], rows))),
+            'DLC count': pa.array(np.where(rng.random(rows) < 0.85, 0, rng.integers(1, 30, rows))),
+            'About the game': _texts(rng, rows, text_bytes),
+            'Supported languages': LANGUAGES.take(rng.integers(0, len(LANGUAGES), rows)),
+            'Full audio languages': pa.array(np.where(rng.random(rows) < 0.8, "[]", "['English']")),
+            'Reviews': pa.nulls(rows, pa.string()),
+            'Header image': _urls(ids, '/header.jpg'),
+            'Website': pa.nulls(rows, pa.string()),
+            'Support url': pa.nulls(rows, pa.string()),
+            'Support email': pa.nulls(rows, pa.string()),
+            'Windows': pa.array(np.ones(rows, dtype=bool)),
+            'Mac': pa.array(rng.random(rows) < 0.2),
+            'Linux': pa.array(rng.random(rows) < 0.15),
+            'Metacritic url': pa.nulls(rows, pa.string()),
+            'User score': pa.array(np.zeros(rows, dtype=np.int64)),
+            'Score rank': pa.nulls(rows, pa.string()),
+            'Notes': pa.nulls(rows, pa.string()),
+            'Average playtime two weeks': pa.array(np.where(playtime > 0, playtime // 10, 0)),
+            'Median playtime forever': pa.array(playtime * 2 // 3),
+            'Median playtime two weeks': pa.array(np.where(playtime > 0, playtime // 15, 0)),
+            'Categories': CATEGORIES.take(rng.integers(0, len(CATEGORIES), rows)),
+            'Screenshots': _urls(ids, '/ss_1.jpg'),
+            'Movies': pa.nulls(rows, pa.string()),
+        })
+    table = pa.table({column: data[column] for column in columns})
+
+    # Linhas duplicadas idênticas, no fim do pedaço
+    duplicates = rng.random(rows) < DUPLICATE_RATE
+    if duplicates.any():
+        table = pa.concat_tables([table, table.filter(pa.array(duplicates))])
+    return table, int(ids[-1])
+
+def generate_games_csv(path, rows, seed=0, chunk_rows=100_000, columns=COLUMNS, text_bytes=300):
+    # Grava 'rows' jogos (mais ~0.1% de duplicatas) em 'path'; a saída depende só de (rows, seed, chunk_rows, colunas)
+    path = Path(path)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    written, last_id, chunk_index = 0, 0, 0
+    writer = None
+    try:
+        while written < rows:
+            rng = np.random.default_rng([seed, chunk_index])
+            table, last_id = generate_chunk(rng, last_id, min(chunk_rows, rows - written), columns, text_bytes)
+            if writer is None:
+                writer = pa_csv.CSVWriter(tmp_path, table.schema, write_options=pa_csv.WriteOptions(quoting_style="needed"))
+            writer.write_table(table)
+            written += min(chunk_rows, rows - written)
+            chunk_index += 1
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp_path, path)
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera um games.csv sintético com o esquema do dataset da Steam.")
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-rows", type=int, default=100_000)
+    parser.add_argument("--ingest-only", action="store_true", help="grava só as colunas lidas pela ingestão")
+    parser.add_argument("--text-bytes", type=int, default=300, help="tamanho médio de 'About the game' (simula dumps maiores)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    generate_games_csv(args.out, args.rows, args.seed, args.chunk_rows, INGEST_COLUMNS if args.ingest_only else COLUMNS, args.text_bytes)
+    elapsed = time.perf_counter() - start
+    size = args.out.stat().st_size
+    print(f"{args.rows} linhas, {size / 2**20:.0f} MB em {elapsed:.1f} s ({args.rows / elapsed:,.0f} linhas/s, {size / 2**20 / elapsed:.0f} MB/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,25 @@
 import streamlit as st
-from PIL import Image
-from pathlib import Path
-
-# Carrega a imagem da logo
-logo = Image.open('img/logo.png')
+from portfolio.assets import image_data_uri, page_icon
+from portfolio.warmup import start_warmup
+from portfolio.certificates import certificate_bytes, list_certificates
 
 # Configurações da página
 st.set_page_config(
     page_title="Formação e experiências",
-    page_icon=logo,
+    page_icon=page_icon("logo.png"),
     layout="wide"
 )
 
-def education_experience_page():
-    # Define o caminho raiz do projeto de forma confiável
-    PROJECT_ROOT = Path(__file__).parent.parent
-    CERTIFICADOS_DIR = PROJECT_ROOT / "certificados"
+start_warmup()
 
+def education_experience_page():
     # Adiciona a logo na sidebar
     with st.sidebar:
-        st.image(logo, width=30)
+        st.image(image_data_uri("logo.png", 30), width=30)
 
     col1, col2 = st.columns([1, 9])
     with col1:
-        st.image(logo, width=100)
+        st.image(image_data_uri("logo.png", 100), width=100)
     with col2:
         st.title("Formação e Experiências")
     
@@ -67,61 +63,15 @@ def education_experience_page():
     """, unsafe_allow_html=True)
 
     with col2:
-
-        # Certificado 1
-        cert_path_1 = CERTIFICADOS_DIR / "Algoritmos - Aprenda a programar.pdf"
-        with open(cert_path_1, "rb") as file:
-            pdf_bytes_1 = file.read() # Lê o conteúdo para uma variável
-        st.download_button(
-            label="Certificado - Algoritmos",
-            data=pdf_bytes_1, # Passa os bytes diretamente
-            file_name="certificado_de_algoritmos.pdf",
-            mime="application/pdf"
-        )
-        
-        # Certificado 2
-        cert_path_2 = CERTIFICADOS_DIR / "Design Thinking - Process.pdf"
-        with open(cert_path_2, "rb") as file:
-            pdf_bytes_2 = file.read()
-        st.download_button(
-            label="Certificado - Design Thinking",
-            data=pdf_bytes_2,
-            file_name="certificado_de_design_thinking.pdf",
-            mime="application/pdf"
-        )
-        
-        # Certificado 3
-        cert_path_3 = CERTIFICADOS_DIR / "Estruturas de Computadores.pdf"
-        with open(cert_path_3, "rb") as file:
-            pdf_bytes_3 = file.read()
-        st.download_button(
-            label="Certificado - Estruturas de Computadores",
-            data=pdf_bytes_3,
-            file_name="certificado_de_estrutura_de_computadores.pdf",
-            mime="application/pdf"
-        )
-        
-        # Certificado 4
-        cert_path_4 = CERTIFICADOS_DIR / "Formação Social e Sustentabilidade.pdf"
-        with open(cert_path_4, "rb") as file:
-            pdf_bytes_4 = file.read()
-        st.download_button(
-            label="Certificado - Formação Social e Sustentabilidade",
-            data=pdf_bytes_4,
-            file_name="certificado_de_formação_social_e_sustentabilidade.pdf",
-            mime="application/pdf"
-        )
-        
-        # Certificado 5
-        cert_path_5 = CERTIFICADOS_DIR / "Trilha de Treinamentos Comportamentais.pdf"
-        with open(cert_path_5, "rb") as file:
-            pdf_bytes_5 = file.read()
-        st.download_button(
-            label="Certificado - Trilha de Treinamentos Comportamentais",
-            data=pdf_bytes_5,
-            file_name="certificado_de_trilha_de_treinamentos_comportamentais.pdf",
-            mime="application/pdf"
-        )
+        # Os PDFs só são lidos quando o botão é clicado (dados sob demanda), e ficam em cache no processo
+        for certificate in list_certificates():
+            st.download_button(
+                label=certificate.label,
+                data=lambda certificate=certificate: certificate_bytes(certificate),
+                file_name=certificate.file_name,
+                mime="application/pdf",
+                on_click="ignore",
+            )
     
     st.subheader("Projetos Acadêmicos")
     st.markdown("""
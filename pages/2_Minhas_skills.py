@@ -1,26 +1,26 @@
 import streamlit as st
-from PIL import Image
-
-# Carrega a imagem da logo
-logo = Image.open('img/logo.png')
+from portfolio.assets import image_data_uri, page_icon
+from portfolio.warmup import start_warmup
 
 # Configurações da página, incluindo o ícone da aba do navegador
 st.set_page_config(
     page_title="Skills",
-    page_icon=logo,
+    page_icon=page_icon("logo.png"),
     layout="wide"
 )
 
+start_warmup()
+
 def skills_page():
     # Adiciona a logo na sidebar
     with st.sidebar:
-        st.image(logo, width=30)
+        st.image(image_data_uri("logo.png", 30), width=30)
 
     col1, col2 = st.columns([1, 9])
 
     with col1:
         # Coloca a logo na primeira coluna
-        st.image(logo, width=100)
+        st.image(image_data_uri("logo.png", 100), width=100)
 
     with col2:
         # Título
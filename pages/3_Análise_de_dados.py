@@ -1,126 +1,388 @@
+import time
 import streamlit as st
-from PIL import Image
-import pandas as pd
 import numpy as np
-from scipy import stats
-import plotly.express as px
 import plotly.graph_objects as go
+from portfolio.data import format_number
+from portfolio.aggregates import PRICE_LABELS, price_bin_codes, grouped_stats, selection_totals
+from portfolio.analytics import selection_key, row_mask, cell_mask, price_by_year, reviews_by_price_bin, top_genres_by_playtime, metacritic_recommendations_correlation, metacritic_t_interval, achievement_groups, achievements_ttest
+from portfolio.cache import LRUCache, estimate_nbytes
+from portfolio.memory import process_memory, format_memory
+from portfolio.charts import box_stats, box_figure, figure_nbytes
+from portfolio.metrics import REGISTRY, span, trace
+from portfolio.assets import image_data_uri, page_icon
+from portfolio.state import analysis_data
+from portfolio.warmup import start_warmup
+from portfolio.sampling import sample_games
+from portfolio.inference import ols_line, bootstrap_mean_interval, permutation_test
+from portfolio.search import SEARCH_FIELDS, search, complete
+from portfolio.explorer import EXPLORER_COLUMNS, PAGE_SIZES, EXPORT_FORMATS, sortable_columns, sort_permutation, ordered_rows, page_count, page_frame, export_file
 
 # --- CONFIGURAÇÕES INICIAIS E FUNÇÕES AUXILIARES ---
 
-# Carrega a imagem da logo
-logo = Image.open('img/logo.png')
-
 # Configurações da página
 st.set_page_config(
     page_title="Análise de dados",
-    page_icon=logo,
+    page_icon=page_icon("logo.png"),
     layout="wide"
 )
 
-# Funções auxiliares do script original
-def format_number(n):
-    if n >= 1e9: return f'{n/1e9:.0f}B'
-    if n >= 1e6: return f'{n/1e6:.0f}M'
-    if n >= 1e3: return f'{n/1e3:.0f}K'
-    return str(n)
-
-def format_estimated_owners(owner_range):
-    parts = owner_range.replace(',', '').split(' - ')
-    if len(parts) == 2:
-        start, end = int(parts[0]), int(parts[1])
-        return f"{format_number(start)} - {format_number(end)}"
-    return owner_range.replace(',', '')
-
-def sort_key(s):
-    try:
-        if ' - ' in s:
-            parts = s.split(' - ')
-            start = int(parts[0].replace('K', '000').replace('M', '000000').replace('B', '000000000'))
-            end = int(parts[1].replace('K', '000').replace('M', '000000').replace('B', '000000000'))
-            return (start, end)
-        return (int(s.replace('K', '000').replace('M', '000000').replace('B', '000000000')), 0)
-    except:
-        return (9999999999, 9999999999)
+start_warmup()
 
 # --- MELHORIA DE PERFORMANCE E LOGS: FUNÇÃO DE CACHE PARA CARREGAR E PROCESSAR OS DADOS ---
-@st.cache_data
+# O CSV só é processado quando muda; nas demais inicializações os dados vêm do cache colunar em disco.
+# O índice de gêneros e o cubo de agregados também são montados uma única vez (portfolio/state.py, que o aquecimento
+# em segundo plano pode já ter preenchido) e reaproveitados a cada interação.
+# Todas as sessões recebem os mesmos objetos, sem uma cópia serializada por chamada. Sem st.cache_resource aqui:
+# quando o CSV muda, portfolio/state.py monta a nova versão em segundo plano e troca a versão servida, e cada rerun
+# pega a versão atual. O DataFrame é uma view somente leitura do store mapeado em memória, compartilhado também entre
+# processos; nada nesta página o altera (filtros e amostras sempre geram frames novos).
 def load_and_process_data():
-    log_messages = []
-    log_messages.append("Iniciando carregamento do arquivo 'dataset/games.csv'...")
-    df = pd.read_csv('dataset/games.csv')
-    log_messages.append(f"Arquivo carregado com sucesso. {len(df)} linhas encontradas.")
-
-    duplicatas = df.duplicated().sum()
-    if duplicatas > 0:
-        log_messages.append(f"Encontradas {duplicatas} linhas duplicadas. Removendo...")
-        df.drop_duplicates(inplace=True)
-        log_messages.append("Duplicatas removidas.")
-    else:
-        log_messages.append("Nenhuma linha duplicada encontrada.")
-    
-    log_messages.append("Iniciando tratamento de valores nulos para colunas indispensáveis...")
-    colunas_indispensaveis = ['Price', 'Genres', 'Positive', 'Metacritic score', 'Reviews', 'Estimated owners']
-    for col in colunas_indispensaveis:
-        if df[col].isnull().sum() > 0:
-            if df[col].dtype == 'object':
-                df[col].fillna('Desconhecido', inplace=True)
-            else:
-                df[col].fillna(df[col].median(), inplace=True)
-            log_messages.append(f"-> Valores nulos na coluna '{col}' foram tratados.")
-    log_messages.append("Tratamento de valores nulos concluído.")
-
-    log_messages.append("Iniciando tratamento de outliers para a coluna 'Price'...")
-    Q1, Q3 = df['Price'].quantile(0.25), df['Price'].quantile(0.75)
-    limite_superior = Q3 + 1.5 * (Q3 - Q1)
-    outliers_count = (df['Price'] > limite_superior).sum()
-    df['Price'] = np.where(df['Price'] > limite_superior, limite_superior, df['Price'])
-    log_messages.append(f"{outliers_count} outliers de preço foram ajustados para o limite superior de ${limite_superior:.2f}.")
-
-    log_messages.append("Iniciando engenharia de features...")
-    df['Release date'] = pd.to_datetime(df['Release date'], format='%b %d, %Y', errors='coerce')
-    df['Release Year'] = df['Release date'].dt.year
-    df.dropna(subset=['Release Year'], inplace=True)
-    df['Release Year'] = df['Release Year'].astype(int)
-    log_messages.append("-> Coluna 'Release Year' criada.")
-    df['Total_Reviews'] = df['Positive'] + df['Negative']
-    log_messages.append("-> Coluna 'Total_Reviews' criada.")
-    df['Positive_Percentage'] = np.where(df['Total_Reviews'] > 0, (df['Positive'] / df['Total_Reviews']) * 100, 0)
-    log_messages.append("-> Coluna 'Positive_Percentage' criada.")
-    df['Estimated owners'] = df['Estimated owners'].apply(format_estimated_owners)
-    log_messages.append("-> Coluna 'Estimated owners' formatada.")
-    log_messages.append("Engenharia de features concluída.")
-    
-    log_messages.append("Pré-processamento de dados finalizado com sucesso!")
-    return df, log_messages
+    return analysis_data()
+
+# --- CACHES DE SELEÇÕES FILTRADAS E DE FIGURAS ---
+# Compartilhados entre sessões: combinações de filtro já vistas são servidas da memória.
+# As figuras (várias por seleção, uma por aba e controle) ficam num cache próprio: assim não tiram as seleções,
+# mais caras de refazer, do cache quando o usuário percorre as abas.
+# Acertos, falhas e ocupação aparecem na página de diagnóstico (ver portfolio/metrics.py).
+@st.cache_resource
+def get_selection_cache():
+    selection_cache = LRUCache(max_entries=32, max_bytes=160 * 2**20)
+    REGISTRY.register_collector("selection_cache", selection_cache.stats)
+    return selection_cache
+
+@st.cache_resource
+def get_figure_cache():
+    figure_cache = LRUCache(max_entries=128, max_bytes=96 * 2**20)
+    REGISTRY.register_collector("figure_cache", figure_cache.stats)
+    return figure_cache
+
+def select_games(df, genre_index, cube, key):
+    with span("page.filter.rows"):
+        selection_mask = row_mask(df, genre_index, key)
+        frame = df[selection_mask]
+    with span("page.filter.cube"):
+        cells = cell_mask(cube, key)
+        total_reviews = selection_totals(cube, cells, 'Total_Reviews')[1]
+    # O frame é medido uma única vez (memory_usage profundo percorre os textos): a mesma medida vai para a métrica e,
+    # somada à da máscara e das células, para o cache
+    frame_bytes = estimate_nbytes(frame)
+    REGISTRY.record_size("selection.frame", frame_bytes)
+    selection = {
+        "mask": selection_mask,
+        "cells": cells,
+        "frame": frame,
+        "total_reviews": total_reviews,
+    }
+    return selection, frame_bytes + estimate_nbytes([selection_mask, cells, total_reviews])
+
+# --- ABAS DA ANÁLISE ---
+# Cada aba só é calculada quando está aberta; figuras e resultados ficam no cache LRU de figuras, indexados pelo estado dos filtros.
+# As funções build_* fazem os cálculos e montam as figuras; as render_* apenas desenham a aba.
+# plotly.express é importado dentro das build_* (o import custa ~120 ms e só é necessário quando uma figura é montada).
+
+def build_popularity_figures(filtered_df, cube, selected_cells):
+    import plotly.express as px
+    owner_counts = grouped_stats(cube, selected_cells, 'Estimated owners', 'Price')['count']
+    unique_owners = list(owner_counts.index[owner_counts > 0])
+    owners_box = box_stats(filtered_df['Price'], filtered_df['Estimated owners'], order=unique_owners)
+    fig_price_owners = box_figure(owners_box, 'Distribuição de Preço por Faixa de Donos Estimados', 'Faixa de Donos Estimados', 'Preço (USD)')
+
+    top_genres = top_genres_by_playtime(cube, selected_cells)
+    fig_top_genres = px.bar(top_genres, x='Average playtime forever', y='Genres', orientation='h', title='Top 10 Gêneros por Tempo Médio de Jogo')
+    fig_top_genres.update_xaxes(title_text='Tempo Médio de Jogo (minutos)').update_yaxes(title_text='Gênero')
+    return {'price_owners': fig_price_owners, 'top_genres': fig_top_genres}
+
+def render_popularity_tab(filtered_df, cube, selected_cells, cached):
+    st.subheader("Análise de Popularidade vs. Preço")
+    figures = cached('popularity', lambda: build_popularity_figures(filtered_df, cube, selected_cells))
+    st.plotly_chart(figures['price_owners'], width="stretch")
+    st.markdown("""
+    * **Preço concentrado em faixas baixas:** A maioria dos jogos, em todas as faixas de donos estimados, tem seu preço mediano abaixo de 15 USD. Isso sugere que o preço não é um fator determinante para a quantidade de donos, e que muitos jogos com grandes bases de jogadores são de baixo custo ou gratuitos.
+    * **Jogos gratuitos dominam as faixas mais altas:** O gráfico mostra que as duas faixas de donos mais altas, **`20M - 50M`** e **`50M - 100M`**, têm um preço mediano igual a zero. Isso indica que, para atingir o maior número de donos, o modelo de negócios de jogos gratuitos é uma estratégia predominante.
+    * **Outliers e variação de preços:** As faixas com poucos donos (`0 - 0` e `0 - 20k`) apresentam a maior variabilidade de preços, com muitos outliers que chegam a custar mais de 20 USD. Isso pode refletir jogos de nicho, versões premium ou simplesmente jogos que não alcançaram uma grande popularidade. No caso da faixa de `0 - 0`, é possível concluir que dentro da biblioteca da Steam há muitos jogos que jamais foram comprados, ou têm um número de jogadores irrelevante no dataset.
+    """)
+
+    st.subheader("Análise de Desempenho por Gênero e Tags")
+    col1_g, col2_g = st.columns([1.5, 1])
+    with col1_g:
+        st.plotly_chart(figures['top_genres'], width="stretch")
+    with col2_g:
+        st.markdown("""
+        * **Aplicativos e Ferramentas com Maior Tempo de Jogo:** As categorias com o maior tempo médio de jogo não são jogos tradicionais. O topo da lista é dominado por software de produção de áudio, publicação na web, utilitários, design e edição de vídeo. Isso indica que essas ferramentas, quando disponíveis na plataforma, são utilizadas por longos períodos.
+        * **Gêneros de Jogos com Alto Engajamento:** O único gênero de jogo tradicional a entrar no top 10 é `Massively Multiplayer`, o que reforça a ideia de que jogos que incentivam a interação contínua entre jogadores possuem um alto potencial de engajamento a longo prazo.
+        * **Baixo Tempo de Jogo para Educação e Desenvolvimento:** Categorias como `Education`e `Game Development` aparecem na parte inferior do ranking, com tempo médio de jogo significativamente menor. Isso sugere que, em geral, essas aplicações são usadas por períodos mais curtos do que as ferramentas de produção criativa.
+        """)
+
+def build_market_figures(filtered_df, cube, selected_cells):
+    import plotly.express as px
+    price_bin_labels = np.array(PRICE_LABELS, dtype=object)[price_bin_codes(filtered_df['Price'])]
+    price_bins_box = box_stats(filtered_df['Positive_Percentage'], price_bin_labels, order=PRICE_LABELS)
+    fig_price_pos_pct = box_figure(price_bins_box, 'Distribuição de % de Avaliações Positivas por Faixa de Preço', 'Faixa de Preço', 'Porcentagem de Avaliações Positivas (%)')
+
+    df_by_price_bin = reviews_by_price_bin(cube, selected_cells)
+    fig_price_bin = px.bar(df_by_price_bin, x='Price_Bins', y='Total_Reviews', title='Número Médio de Avaliações por Faixa de Preço')
+    fig_price_bin.update_xaxes(title_text='Faixa de Preço', type='category').update_yaxes(title_text='Número Médio de Avaliações')
+    return {'price_pos_pct': fig_price_pos_pct, 'price_bin': fig_price_bin}
+
+def build_price_trend_figure(cube, selected_cells, selected_window):
+    df_by_year = price_by_year(cube, selected_cells, selected_window)
+    fig_price_trend = go.Figure()
+    fig_price_trend.add_trace(go.Scatter(x=df_by_year['Release Year'], y=df_by_year['Price'], mode='lines+markers', name='Preço Médio Original'))
+    fig_price_trend.add_trace(go.Scatter(x=df_by_year['Release Year'], y=df_by_year['Média Móvel'], mode='lines', name=f'Média Móvel ({selected_window} anos)', line=dict(color='blue', width=3)))
+    fig_price_trend.update_layout(title='Preço Médio dos Jogos ao Longo dos Anos', xaxis_title='Ano de Lançamento', yaxis_title='Preço Médio (USD)', legend_title='Séries')
+    return fig_price_trend
+
+def render_market_tab(filtered_df, cube, selected_cells, cached):
+    st.subheader("Distribuição de Avaliações por Faixa de Preço")
+    figures = cached('market', lambda: build_market_figures(filtered_df, cube, selected_cells))
+    st.plotly_chart(figures['price_pos_pct'], width="stretch")
+    st.markdown("""
+    * **Distribuição de avaliações em jogos pagos:** Jogos com preço acima de zero apresentam uma distribuição de avaliações muito mais consistente e positiva. A mediana da porcentagem de avaliações positivas para todas as faixas de preço pagas está consistentemente alta, por volta de 70-80%, o que sugere que ao pagar por um jogo, os jogadores tendem a ter uma expectativa de qualidade que é frequentemente atendida.
+    * **Os extremos dos jogos gratuitos:** A categoria de jogos gratuitos (`Free`) apresenta a maior dispersão nas avaliações, com uma mediana mais baixa (cerca de 34%) e a maior amplitude interquartil, indicando uma alta volatilidade nos resultados. A presença de um grande número de outliers em 100% reforça a ideia de que muitos jogos gratuitos com poucas avaliações se concentram nos extremos, um fenômeno que não é tão proeminente nas faixas de preço pagas.
+    * **Falta de correlação linear com o preço:** O gráfico não mostra uma tendência clara de que jogos mais caros recebem avaliações percentuais mais altas. As medianas da porcentagem de avaliações positivas permanecem estáveis em todas as faixas de preço pagas, indicando que, após o jogo ter um preço, o valor em si não é o principal fator para avaliações mais altas.
+    """)
+
+    st.subheader("Tendências de Mercado")
+    col1_t, col2_t = st.columns([1.8, 1])
+    with col1_t:
+        selected_window = st.selectbox("Escolha o Período da Média Móvel (em anos):", options=[1, 3, 5, 7], index=1)
+        fig_price_trend = cached(('price_trend', selected_window), lambda: build_price_trend_figure(cube, selected_cells, selected_window))
+        st.plotly_chart(fig_price_trend, width="stretch")
+    with col2_t:
+        st.markdown("""
+        * **Pico Histórico de Preço:** A linha de média móvel confirma que o preço médio dos jogos na Steam atingiu seu pico histórico na década dos anos 2000, superando os 10 USD. Isso pode refletir o período em que jogos de PC eram majoritariamente lançados por grandes estúdios, com preços mais elevados.
+        * **Tendência de Queda Acelerada:** O gráfico suavizado pela média móvel demonstra de forma robusta uma tendência de queda constante no preço médio dos jogos, que se acentuou significativamente a partir de 2022. Essa queda reflete a crescente popularidade e o grande volume de jogos gratuitos e de baixo custo que entram na plataforma, além do fim dos registros do dataset.
+        * **Estabilização Temporária:** A média móvel mostra um período de relativa estabilidade no preço médio entre 2018 e 2022, antes da queda recente. Isso sugere que o mercado se estabilizou por um tempo, mas a tendência de longo prazo de barateamento dos jogos continua.
+        """)
+
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    col1_pb, col2_pb = st.columns([1, 1])
+    with col2_pb:
+        st.plotly_chart(figures['price_bin'], width="stretch")
+    with col1_pb:
+        st.markdown("""
+        * **Relação de Avaliações em Faixas de Preço Baixas:** A faixa de preço `Free` tem um número médio de avaliações significativamente maior do que a faixa de `0.01 - 5` USD. Isso sugere que, embora o modelo gratuito atraia um grande volume de avaliações, a faixa mais baixa de jogos pagos pode ter menos visibilidade e um público menos propenso a deixar feedback.
+        * **Relação Positiva e Acelerada:** Para jogos com preço acima de 5 USD, há uma relação positiva e acelerada: quanto maior a faixa de preço, maior o número médio de avaliações que ele recebe. O número de avaliações cresce consistentemente a cada faixa de preço mais alta.
+        * **Pico de Engajamento em Jogos Mais Caros:** A categoria de jogos com preço `Over 20` USD recebe o maior número médio de avaliações, superando 6.000 por jogo. Isso indica que os jogos mais caros são, em média, os mais populares ou os que mais geram engajamento e feedback dos jogadores na plataforma.
+        """)
+
+def build_inference_results(filtered_df, cube, selected_cells):
+    corr_value = metacritic_recommendations_correlation(cube, selected_cells)
+    achievements_test, fig_achievements_bp = achievements_ttest(filtered_df), None
+    if achievements_test is not None:
+        above = achievement_groups(filtered_df)[0]
+        groups = np.where(above, 'Acima da Mediana', 'Abaixo da Mediana')
+        achievements_box = box_stats(filtered_df['Positive'], groups, order=['Abaixo da Mediana', 'Acima da Mediana'])
+        fig_achievements_bp = box_figure(achievements_box, 'Distribuição de Avaliações Positivas por Grupo de Conquistas', 'Grupo de Conquistas', 'Avaliações Positivas', range_y=[0, 350])
+    return {'corr_value': corr_value, 'achievements_test': achievements_test, 'achievements_bp': fig_achievements_bp}
+
+# Acima deste tamanho de amostra o scatter é desenhado com WebGL (scattergl)
+WEBGL_THRESHOLD = 5000
+
+def build_metacritic_scatter(filtered_df, sample_size, stratified):
+    # Amostra determinística e reta de tendência ficam em cache juntas, por estado de filtro
+    import plotly.express as px
+    sample = sample_games(filtered_df, sample_size, 'Estimated owners' if stratified else None)
+    render_mode = 'webgl' if len(sample) > WEBGL_THRESHOLD else 'svg'
+    fig_metacritic_rec = px.scatter(sample, x='Metacritic score', y='Recommendations', title='Metacritic Score vs. Recomendações', hover_data=['Name'], range_y=[0, 25000], render_mode=render_mode)
+    slope, intercept = ols_line(sample['Metacritic score'], sample['Recommendations'])
+    x_line = np.array([sample['Metacritic score'].min(), sample['Metacritic score'].max()], dtype=np.float64)
+    fig_metacritic_rec.add_trace(go.Scatter(x=x_line, y=intercept + slope * x_line, mode='lines', name='Tendência (MQO)', showlegend=False, hovertemplate=f'y = {slope:.2f}x + {intercept:.2f}<extra></extra>'))
+    return fig_metacritic_rec
+
+def metacritic_interval(filtered_df, cube, selected_cells, selected_confidence, method):
+    if method == 'bootstrap':
+        return bootstrap_mean_interval(filtered_df['Metacritic score'], selected_confidence/100)
+    return metacritic_t_interval(cube, selected_cells, selected_confidence/100)
+
+def achievements_permutation(filtered_df):
+    _, high_ach_data, low_ach_data = achievement_groups(filtered_df)
+    return permutation_test(high_ach_data, low_ach_data)
+
+def render_inference_tab(filtered_df, cube, selected_cells, cached):
+    st.subheader("Comparação de Avaliações e Métrica de Sucesso")
+    results = cached('inference', lambda: build_inference_results(filtered_df, cube, selected_cells))
+    st.metric(label="Correlação entre Metacritic Score e Recomendações", value=f"{results['corr_value']:.3f}")
+    col1_s, col2_s = st.columns([2, 1])
+    sample_size = col1_s.select_slider("Pontos no gráfico (amostra):", options=[1000, 2500, 5000, 10000, 20000], value=1000)
+    stratified = col2_s.checkbox("Estratificar por faixa de donos", value=False)
+    fig_metacritic_rec = cached(('metacritic_scatter', sample_size, stratified), lambda: build_metacritic_scatter(filtered_df, sample_size, stratified))
+    st.plotly_chart(fig_metacritic_rec, width="stretch")
+    st.markdown("""
+    * **Correlação Fraca:** A correlação positiva de `0.124` demonstra uma relação muito fraca entre a pontuação do Metacritic e as recomendações dos usuários. Embora um Metacritic Score mais alto possa ter uma pequena tendência a gerar mais recomendações, a relação não é forte.
+    * **Distribuição de Pontos:** A visualização mostra que a maioria dos jogos tem pontuações e recomendações baixas, com alguns outliers em ambas as variáveis, que podem representar jogos de grande sucesso.
+    """)
+
+    st.subheader("Intervalo de Confiança para a Média do Metacritic Score")
+    st.markdown("""
+        O `Metacritic score` foi escolhido para aplicar o Intervalo de Confiança por ser uma variável quantitativa e um dos indicadores mais importantes da qualidade e recepção crítica de um jogo. Ele nos permite fazer inferências sobre a população inteira de jogos da Steam a partir da sua amostra.
+    """)
+
+    col1_ci, col2_ci = st.columns(2)
+    selected_confidence = col1_ci.selectbox("Escolha o Nível de Confiança (%)", options=[70, 80, 90, 95, 99], index=3)
+    inference_method = col2_ci.radio("Método de inferência:", options=['t', 'bootstrap'], format_func={'t': "Paramétrico (t de Student)", 'bootstrap': "Reamostragem (bootstrap / permutação)"}.get, horizontal=True)
+    conf_interval = cached(('metacritic_ci', selected_confidence, inference_method), lambda: metacritic_interval(filtered_df, cube, selected_cells, selected_confidence, inference_method))
+    if conf_interval is not None:
+        st.info(f"Temos {selected_confidence}% de confiança de que a pontuação média real do Metacritic para os jogos selecionados está entre **{conf_interval[0]:.2f} e {conf_interval[1]:.2f}**.")
+
+    st.subheader("Teste de Hipótese para Conquistas nos Jogos")
+    st.markdown("""
+        A escolha de conquistas (`Achievements`) para o teste de hipótese foi motivada por ser uma métrica que pode estar diretamente ligada ao esforço de desenvolvimento e à longevidade de um jogo. A hipótese é que um jogo com mais conquistas pode ser visto como mais completo, oferecendo mais conteúdo, o que poderia se traduzir em melhores avaliações.
+
+        O teste de hipótese nos permite verificar se essa suposição é estatisticamente válida.
+    """)
+
+    if results['achievements_test'] is not None:
+        if inference_method == 'bootstrap':
+            diff_ach, p_value_ach = cached('achievements_permutation', lambda: achievements_permutation(filtered_df))
+            st.write(f"**Diferença de médias:** `{diff_ach:.2f}` | **Valor p (permutação, 1000 reamostras):** `{p_value_ach:.4f}`")
+        else:
+            t_stat_ach, p_value_ach = results['achievements_test']
+            st.write(f"**Estatística T:** `{t_stat_ach:.2f}` | **Valor p:** `{p_value_ach:.4f}`")
+        if p_value_ach < 0.05:
+            st.success("O p-valor é menor que 0.05, indicando uma diferença estatisticamente significativa na média de avaliações positivas entre os dois grupos.")
+        else:
+            st.warning("O p-valor não é menor que 0.05. Não há evidência de uma diferença estatisticamente significativa.")
+
+        st.plotly_chart(results['achievements_bp'], width="stretch")
+        st.markdown("""
+        * **Diferença de Médias:** O teste t com um p-valor de `0.0000` indica uma diferença estatisticamente significativa na média de avaliações positivas entre os dois grupos. O box plot, ao limitar o eixo Y, mostra claramente que a mediana de avaliações do grupo "Acima da Mediana" é superior.
+        * **Distribuição de Dados:** A distribuição das avaliações do grupo "Acima da Mediana" é mais concentrada e tem uma mediana mais alta do que o grupo "Abaixo da Mediana", embora ambos os grupos tenham um grande número de outliers positivos, que podem ser melhor vistos ajustando a escala do gráfico.
+        """)
+
+# --- EXPLORADOR DE DADOS ---
+# Tabela paginada da seleção atual (portfolio/explorer.py): a cada interação só uma página de linhas, com as colunas
+# escolhidas, vai para o navegador. Como fragmento, trocar de página, ordem ou colunas reexecuta só esta tabela,
+# não a página inteira. A exportação só é gerada quando o botão é clicado.
+
+@st.fragment
+def render_explorer(df, selection_mask, version):
+    st.markdown("### Explorador de Dados")
+    col1, col2, col3 = st.columns([3, 1.2, 0.8])
+    columns = col1.multiselect("Colunas:", options=list(df.columns), default=EXPLORER_COLUMNS, key="explorer_columns")
+    sort_column = col2.selectbox("Ordenar por:", options=[None] + sortable_columns(df), format_func=lambda column: "Ordem original" if column is None else column, key="explorer_sort")
+    descending = col3.toggle("Decrescente", value=True, key="explorer_desc")
+    if not columns:
+        st.info("Selecione ao menos uma coluna.")
+        return
+
+    with span("page.explorer.order"):
+        permutation = sort_permutation(df, sort_column, descending, version) if sort_column else None
+        positions = ordered_rows(selection_mask, permutation)
+    col1, col2, col3 = st.columns([1, 1, 2])
+    page_size = col1.selectbox("Linhas por página:", options=PAGE_SIZES, index=1, key="explorer_page_size")
+    n_pages = page_count(len(positions), page_size)
+    # Depois de mudar os filtros ou o tamanho da página, a página atual pode não existir mais
+    if st.session_state.get("explorer_page", 1) > n_pages:
+        st.session_state.explorer_page = n_pages
+    page = col2.number_input("Página:", min_value=1, max_value=n_pages, step=1, key="explorer_page")
+    export_format = col3.radio("Exportar a seleção como:", options=list(EXPORT_FORMATS), format_func=str.upper, horizontal=True, key="explorer_format")
+
+    start = (page - 1) * page_size
+    st.caption(f"Linhas {start + 1:,}–{min(start + page_size, len(positions)):,} de {len(positions):,} jogos selecionados (página {page} de {n_pages:,}).")
+    with span("page.explorer.page"):
+        st.dataframe(page_frame(df, positions, page, page_size, columns), hide_index=True)
+    st.download_button(f"Baixar as {len(positions):,} linhas ({export_format.upper()})", data=lambda: export_file(df, positions, columns, export_format),
+                       file_name=f"jogos_selecionados.{export_format}", mime=EXPORT_FORMATS[export_format], on_click="ignore")
+
+# --- BUSCA DE JOGOS ---
+# Consultas ao índice invertido montado junto com os dados (portfolio/search.py): cada digitação custa poucos
+# milissegundos, sem varrer os textos. Só as SEARCH_LIMIT primeiras linhas do resultado vão para o navegador.
+
+SEARCH_LIMIT = 50
+SEARCH_COLUMNS = ['Name', 'Developers', 'Publishers', 'Release Year', 'Price', 'Total_Reviews', 'Positive_Percentage', 'Metacritic score']
+
+def apply_suggestion():
+    # Troca o último termo digitado pela sugestão escolhida
+    suggestion = st.session_state.search_suggestion
+    if suggestion:
+        words = st.session_state.search_query.split()
+        st.session_state.search_query = " ".join(words[:-1] + [suggestion]) + " "
+    st.session_state.search_suggestion = None
+
+def render_game_details(df, game):
+    row = df.iloc[game]
+    # Textos ausentes chegam como NaN
+    text = lambda column, default: row[column] if isinstance(row[column], str) else default
+    st.markdown(f"### {text('Name', 'Sem nome')}")
+    st.caption(f"{text('Developers', 'Desenvolvedora desconhecida')} · {text('Publishers', 'Publicadora desconhecida')} · lançado em {row['Release date']:%d/%m/%Y}")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Preço", f"${row['Price']:.2f}")
+    col2.metric("Avaliações", format_number(int(row['Total_Reviews'])), f"{row['Positive_Percentage']:.0f}% positivas", delta_color="off")
+    col3.metric("Metacritic", f"{row['Metacritic score']:.0f}" if row['Metacritic score'] else "-")
+    col4.metric("Tempo médio de jogo", f"{row['Average playtime forever'] / 60:.1f} h")
+    # Posição do jogo no dataset inteiro (uma comparação vetorizada sobre a coluna mapeada)
+    share = (df['Total_Reviews'].to_numpy() < row['Total_Reviews']).mean()
+    st.write(f"**Donos estimados:** {row['Estimated owners']} | **Mais avaliado que** {share:.0%} dos jogos do dataset.")
+    st.write(f"**Gêneros:** {text('Genres', '-').replace(',', ', ')}")
+    st.write(f"**Tags:** {text('Tags', '-').replace(',', ', ')}")
+    st.link_button("Ver na loja da Steam", f"https://store.steampowered.com/app/{row['AppID']}")
+
+def render_search_tab(df, search_index, selection_mask):
+    st.subheader("Busca de Jogos")
+    query = st.text_input("Buscar por nome, desenvolvedora, publicadora ou tag:", key="search_query", placeholder="ex.: counter strike, valve, roguelike")
+    col1, col2 = st.columns([3, 1])
+    fields = col1.pills("Buscar em:", options=list(SEARCH_FIELDS), selection_mode="multi", default=list(SEARCH_FIELDS), key="search_fields")
+    within_filters = col2.checkbox("Apenas na seleção dos filtros", value=False)
+
+    suggestions = complete(search_index, query)
+    if suggestions:
+        st.pills("Sugestões:", options=[token for token, _ in suggestions], key="search_suggestion", on_change=apply_suggestion)
+    if not query.strip():
+        st.info("Digite parte do nome de um jogo, de uma desenvolvedora, publicadora ou tag.")
+        return
+
+    with span("page.search"):
+        rows, total = search(search_index, query, fields, SEARCH_LIMIT, df['Total_Reviews'].to_numpy(), selection_mask if within_filters else None)
+    if not total:
+        st.warning("Nenhum jogo encontrado para a busca.")
+        return
+    st.caption(f"{total:,} jogo(s) encontrado(s); mostrando os {len(rows)} mais relevantes. Selecione uma linha para ver os detalhes.")
+    results = st.dataframe(df.iloc[rows][SEARCH_COLUMNS], hide_index=True, on_select="rerun", selection_mode="single-row", key="search_results")
+    selected = results.selection.rows
+    if selected and selected[0] < len(rows):
+        render_game_details(df, rows[selected[0]])
+
+def render_conclusion_tab():
+    st.markdown('### Conclusão Geral das Análises')
+    st.markdown("""
+        O dashboard demonstra uma abordagem analítica estruturada e aprofundada sobre o ecossistema de jogos da Steam, revelando insights valiosos sobre tendências de mercado, engajamento do usuário e percepção de qualidade, ainda que com as limitações da base de dados utilizada.
+
+        A análise de tendência de preço ao longo dos anos mostra uma clara e acelerada tendência de queda no preço médio dos jogos desde 2012, impulsionada pelo crescimento exponencial de títulos free-to-play e de baixo custo. A visualização da distribuição de avaliações por faixa de preço revela uma dinâmica interessante: enquanto jogos gratuitos atraem um grande número de avaliações, os jogos pagos de baixo custo recebem menos feedback, e o número de avaliações aumenta drasticamente nas faixas de preço mais altas.
+
+        O estudo do tempo de jogo médio por gênero revelou que as categorias com maior engajamento de longo prazo não são jogos tradicionais, mas sim softwares de produtividade e ferramentas criativas, como `Audio Production` e `Utilities`. No universo dos jogos, o gênero `Massively Multiplayer` se destaca como o único com um alto tempo de jogo médio. A análise de inferência estatística reforça essas descobertas, demonstrando que jogos com mais conquistas tendem a ter um número significativamente maior de avaliações positivas, sugerindo que o investimento do desenvolvedor em conteúdo se correlaciona com uma melhor recepção do público.
+
+        A correlação entre o Metacritic Score e as recomendações é muito fraca, indicando que a pontuação da crítica não é um forte preditor de recomendações diretas dos usuários. Por fim, o Intervalo de Confiança para a média do `Metacritic Score` nos permite estimar o verdadeiro score médio da plataforma, fornecendo um parâmetro robusto para entender a percepção de qualidade do mercado de forma geral.
+    """)
 
 def data_analysis_page():
     # --- SIDEBAR ---
     with st.sidebar:
-        st.image(logo, width=30)
+        st.image(image_data_uri("logo.png", 30), width=30)
 
     try:
-        df, logs = load_and_process_data()
+        data = load_and_process_data()
     except FileNotFoundError:
         st.error("Arquivo 'dataset/games.csv' não encontrado. Verifique o caminho do arquivo.")
         st.stop()
+    df, logs, genre_index, cube = data.df, data.logs, data.genre_index, data.cube
 
     st.sidebar.header("Filtros")
-    df_genres_filter = df.copy()
-    df_genres_filter['Genres'] = df_genres_filter['Genres'].str.split(',')
-    df_genres_filter = df_genres_filter.explode('Genres')
-    df_genres_filter['Genres'] = df_genres_filter['Genres'].str.strip()
-    all_genres = sorted(df_genres_filter['Genres'].unique())
-    selected_genres = st.sidebar.multiselect("Selecione o(s) Gênero(s):", options=all_genres, default=[])
+    selected_genres = st.sidebar.multiselect("Selecione o(s) Gênero(s):", options=genre_index.genres, default=[])
+    genre_mode = st.sidebar.radio("Combinar gêneros por:", options=['any', 'all'], format_func={'any': "Qualquer um dos gêneros", 'all': "Todos os gêneros"}.get, horizontal=True)
 
     min_year, max_year = int(df['Release Year'].min()), int(df['Release Year'].max())
     selected_year_range = st.sidebar.slider("Selecione o Ano de Lançamento:", min_value=min_year, max_value=max_year, value=(min_year, max_year))
 
-    if selected_genres:
-        filtered_df = df[df['Genres'].apply(lambda x: any(g in x for g in selected_genres))].copy()
-    else:
-        filtered_df = df.copy()
-    filtered_df = filtered_df[(filtered_df['Release Year'] >= selected_year_range[0]) & (filtered_df['Release Year'] <= selected_year_range[1])]
+    selection_cache, figure_cache = get_selection_cache(), get_figure_cache()
+    filter_key = selection_key(selected_genres, genre_mode, selected_year_range)
+    # A versão dos dados faz parte da chave: depois de uma atualização, nada da versão anterior é reaproveitado
+    cache_key = (data.version, filter_key)
+    selection = selection_cache.get(cache_key)
+    if selection is None:
+        selection, selection_bytes = select_games(df, genre_index, cube, filter_key)
+        selection_cache.put(cache_key, selection, nbytes=selection_bytes)
+    selected_cells, filtered_df = selection["cells"], selection["frame"]
     
     st.sidebar.divider()
     st.sidebar.subheader("Resumo da Seleção")
@@ -130,11 +392,11 @@ def data_analysis_page():
     
     col1_side, col2_side = st.sidebar.columns(2)
     col1_side.metric(label="Jogos Selecionados", value=f"{len(filtered_df):,}")
-    col2_side.metric(label="Total de Avaliações", value=f"{format_number(filtered_df['Total_Reviews'].sum())}")
+    col2_side.metric(label="Total de Avaliações", value=f"{format_number(int(selection['total_reviews']))}")
     
     # --- LAYOUT PRINCIPAL ---
     col1, col2 = st.columns([1, 9])
-    with col1: st.image(logo, width=100)
+    with col1: st.image(image_data_uri("logo.png", 100), width=100)
     with col2: st.title("Análise de Dados de Jogos da Steam")
     st.divider()
 
@@ -152,18 +414,24 @@ def data_analysis_page():
             Steam é uma renomada plataforma de jogos digitais que serve como um hub para jogadores em todo o mundo. Desenvolvida e operada pela Valve Corporation, a Steam revolucionou a forma como os jogadores acessam e desfrutam de seus videogames favoritos. Lançada em 2003, rapidamente ganhou popularidade e se tornou a plataforma de referência para jogos de PC. Em sua essência, a Steam oferece aos usuários uma vasta biblioteca de jogos que abrangem diversos gêneros, desde títulos indie até lançamentos de sucesso. Os jogadores podem navegar e comprar jogos diretamente na plataforma, que são então adicionados à sua biblioteca digital para fácil acesso. A Steam também oferece uma maneira segura e conveniente de instalar, atualizar e gerenciar jogos, eliminando a necessidade de mídia física.
         """)
     with col2:
-        st.image("img/steam_logo.png")
+        # Logo original (2120 px) reduzido para a largura da coluna, em WebP
+        st.image(image_data_uri("steam_logo.png", 560))
 
     with st.expander("Ver Log de Processamento de Dados"):
         for log in logs:
             st.info(log)
+        st.caption(f"Versão dos dados: {data.version}, montada às {time.strftime('%H:%M:%S', time.localtime(data.built_at))}.")
+        for cache_label, cache in (("seleções", selection_cache), ("figuras", figure_cache)):
+            cache_stats = cache.stats()
+            st.caption(f"Cache de {cache_label}: {cache_stats['entries']} entradas ({cache_stats['bytes'] / 2**20:.1f} MB), {cache_stats['hits']} acertos, {cache_stats['misses']} falhas, {cache_stats['evictions']} remoções, taxa de acerto {cache_stats['hit_rate']:.0%}.")
+        st.caption(f"Memória: {format_memory(process_memory())}")
             
     st.subheader("Apresentação dos Dados e Tipos de Variáveis")
     st.markdown("### Sobre este Conjunto de Dados")
     st.markdown("""
         O conjunto de dados "All Steam Spiele und deren Metadaten" é uma coleção abrangente de dados que engloba diversos jogos disponíveis na plataforma Steam, juntamente com seus metadados correspondentes. Ele serve como um recurso valioso para pesquisadores, desenvolvedores e entusiastas de jogos interessados em explorar e analisar o vasto ecossistema de jogos da Steam. O conjunto de dados inclui informações sobre cada jogo, como título, data de lançamento, desenvolvedor, editora, gênero, avaliações de usuários, classificações e requisitos de sistema. Ele cobre uma ampla gama de gêneros de jogos, incluindo ação, aventura, estratégia, RPG, simulação, esportes e muito mais, fornecendo uma representação diversificada e extensa da biblioteca de jogos da Steam.
     """)
-    st.dataframe(df.head())
+    render_explorer(df, selection["mask"], data.version)
     
     col1, col2 = st.columns([1.6, 1])
     with col1:
@@ -196,144 +464,36 @@ def data_analysis_page():
     
     # --- ABAS DE NAVEGAÇÃO ---
     st.header("Análise Exploratória e Inferência")
-    tab1, tab2, tab3, tab4 = st.tabs(["📊 Popularidade e Gêneros", "📈 Tendências de Mercado", "🔬 Inferência Estatística", "✅ Conclusão"])
+    tab1, tab2, tab3, tab_search, tab4 = st.tabs(["📊 Popularidade e Gêneros", "📈 Tendências de Mercado", "🔬 Inferência Estatística", "🔎 Buscar Jogos", "✅ Conclusão"], key="analysis_tab", on_change="rerun")
 
-    with tab1:
-        st.subheader("Análise de Popularidade vs. Preço")
-        unique_owners = sorted(filtered_df['Estimated owners'].unique(), key=sort_key)
-        fig_price_owners = px.box(filtered_df, x='Estimated owners', y='Price', title='Distribuição de Preço por Faixa de Donos Estimados', category_orders={"Estimated owners": unique_owners})
-        fig_price_owners.update_xaxes(title_text='Faixa de Donos Estimados').update_yaxes(title_text='Preço (USD)')
-        st.plotly_chart(fig_price_owners, use_container_width=True)
-        st.markdown("""
-        * **Preço concentrado em faixas baixas:** A maioria dos jogos, em todas as faixas de donos estimados, tem seu preço mediano abaixo de 15 USD. Isso sugere que o preço não é um fator determinante para a quantidade de donos, e que muitos jogos com grandes bases de jogadores são de baixo custo ou gratuitos.
-        * **Jogos gratuitos dominam as faixas mais altas:** O gráfico mostra que as duas faixas de donos mais altas, **`20M - 50M`** e **`50M - 100M`**, têm um preço mediano igual a zero. Isso indica que, para atingir o maior número de donos, o modelo de negócios de jogos gratuitos é uma estratégia predominante.
-        * **Outliers e variação de preços:** As faixas com poucos donos (`0 - 0` e `0 - 20k`) apresentam a maior variabilidade de preços, com muitos outliers que chegam a custar mais de 20 USD. Isso pode refletir jogos de nicho, versões premium ou simplesmente jogos que não alcançaram uma grande popularidade. No caso da faixa de `0 - 0`, é possível concluir que dentro da biblioteca da Steam há muitos jogos que jamais foram comprados, ou têm um número de jogadores irrelevante no dataset.
-        """)
+    def cached(name, compute):
+        # Só os cálculos que de fato rodam (falhas do cache) geram spans e medidas de tamanho
+        label = name if isinstance(name, str) else name[0]
 
-        st.subheader("Análise de Desempenho por Gênero e Tags")
-        df_genres_tab = filtered_df.copy()
-        df_genres_tab['Genres'] = df_genres_tab['Genres'].str.split(',')
-        df_genres_tab = df_genres_tab.explode('Genres')
-        df_genres_tab['Genres'] = df_genres_tab['Genres'].str.strip()
-        top_genres = df_genres_tab.groupby('Genres')['Average playtime forever'].mean().nlargest(10).reset_index().sort_values('Average playtime forever', ascending=True)
-        
-        col1_g, col2_g = st.columns([1.5, 1])
-        with col1_g:
-            fig_top_genres = px.bar(top_genres, x='Average playtime forever', y='Genres', orientation='h', title='Top 10 Gêneros por Tempo Médio de Jogo')
-            fig_top_genres.update_xaxes(title_text='Tempo Médio de Jogo (minutos)').update_yaxes(title_text='Gênero')
-            st.plotly_chart(fig_top_genres, use_container_width=True)
-        with col2_g:
-            st.markdown("""
-            * **Aplicativos e Ferramentas com Maior Tempo de Jogo:** As categorias com o maior tempo médio de jogo não são jogos tradicionais. O topo da lista é dominado por software de produção de áudio, publicação na web, utilitários, design e edição de vídeo. Isso indica que essas ferramentas, quando disponíveis na plataforma, são utilizadas por longos períodos.
-            * **Gêneros de Jogos com Alto Engajamento:** O único gênero de jogo tradicional a entrar no top 10 é `Massively Multiplayer`, o que reforça a ideia de que jogos que incentivam a interação contínua entre jogadores possuem um alto potencial de engajamento a longo prazo.
-            * **Baixo Tempo de Jogo para Educação e Desenvolvimento:** Categorias como `Education`e `Game Development` aparecem na parte inferior do ranking, com tempo médio de jogo significativamente menor. Isso sugere que, em geral, essas aplicações são usadas por períodos mais curtos do que as ferramentas de produção criativa.
-            """)
-
-    with tab2:
-        st.subheader("Distribuição de Avaliações por Faixa de Preço")
-        price_bins = [0, 0.01, 5.0, 10.0, 15.0, 20.0, float('inf')]
-        price_labels = ['Free', '0.01 - 5', '5.01 - 10', '10.01 - 15', '15.01 - 20', 'Over 20']
-        filtered_df['Price_Bins'] = pd.cut(filtered_df['Price'], bins=price_bins, labels=price_labels, right=False)
-        fig_price_pos_pct = px.box(filtered_df, x='Price_Bins', y='Positive_Percentage', title='Distribuição de % de Avaliações Positivas por Faixa de Preço')
-        fig_price_pos_pct.update_xaxes(title_text='Faixa de Preço', categoryorder='array', categoryarray=price_labels).update_yaxes(title_text='Porcentagem de Avaliações Positivas (%)')
-        st.plotly_chart(fig_price_pos_pct, use_container_width=True)
-        st.markdown("""
-        * **Distribuição de avaliações em jogos pagos:** Jogos com preço acima de zero apresentam uma distribuição de avaliações muito mais consistente e positiva. A mediana da porcentagem de avaliações positivas para todas as faixas de preço pagas está consistentemente alta, por volta de 70-80%, o que sugere que ao pagar por um jogo, os jogadores tendem a ter uma expectativa de qualidade que é frequentemente atendida.
-        * **Os extremos dos jogos gratuitos:** A categoria de jogos gratuitos (`Free`) apresenta a maior dispersão nas avaliações, com uma mediana mais baixa (cerca de 34%) e a maior amplitude interquartil, indicando uma alta volatilidade nos resultados. A presença de um grande número de outliers em 100% reforça a ideia de que muitos jogos gratuitos com poucas avaliações se concentram nos extremos, um fenômeno que não é tão proeminente nas faixas de preço pagas.
-        * **Falta de correlação linear com o preço:** O gráfico não mostra uma tendência clara de que jogos mais caros recebem avaliações percentuais mais altas. As medianas da porcentagem de avaliações positivas permanecem estáveis em todas as faixas de preço pagas, indicando que, após o jogo ter um preço, o valor em si não é o principal fator para avaliações mais altas.
-        """)
-
-        st.subheader("Tendências de Mercado")
-        df_by_year = filtered_df.groupby('Release Year')['Price'].mean().reset_index()
-        col1_t, col2_t = st.columns([1.8, 1])
-        with col1_t:
-            selected_window = st.selectbox("Escolha o Período da Média Móvel (em anos):", options=[1, 3, 5, 7], index=1)
-            df_by_year['Média Móvel'] = df_by_year['Price'].rolling(window=selected_window, min_periods=1).mean()
-            fig_price_trend = go.Figure()
-            fig_price_trend.add_trace(go.Scatter(x=df_by_year['Release Year'], y=df_by_year['Price'], mode='lines+markers', name='Preço Médio Original'))
-            fig_price_trend.add_trace(go.Scatter(x=df_by_year['Release Year'], y=df_by_year['Média Móvel'], mode='lines', name=f'Média Móvel ({selected_window} anos)', line=dict(color='blue', width=3)))
-            fig_price_trend.update_layout(title='Preço Médio dos Jogos ao Longo dos Anos', xaxis_title='Ano de Lançamento', yaxis_title='Preço Médio (USD)', legend_title='Séries')
-            st.plotly_chart(fig_price_trend, use_container_width=True)
-        with col2_t:
-            st.markdown("""
-            * **Pico Histórico de Preço:** A linha de média móvel confirma que o preço médio dos jogos na Steam atingiu seu pico histórico na década dos anos 2000, superando os 10 USD. Isso pode refletir o período em que jogos de PC eram majoritariamente lançados por grandes estúdios, com preços mais elevados.
-            * **Tendência de Queda Acelerada:** O gráfico suavizado pela média móvel demonstra de forma robusta uma tendência de queda constante no preço médio dos jogos, que se acentuou significativamente a partir de 2022. Essa queda reflete a crescente popularidade e o grande volume de jogos gratuitos e de baixo custo que entram na plataforma, além do fim dos registros do dataset.
-            * **Estabilização Temporária:** A média móvel mostra um período de relativa estabilidade no preço médio entre 2018 e 2022, antes da queda recente. Isso sugere que o mercado se estabilizou por um tempo, mas a tendência de longo prazo de barateamento dos jogos continua.
-            """)
+        def timed_compute():
+            with span(f"page.build.{label}"):
+                result = compute()
+            payload = figure_nbytes(result)
+            if payload:
+                REGISTRY.record_size(f"figure.{label}", payload)
+            return result
 
-        st.markdown("<br><br>", unsafe_allow_html=True)
-        df_by_price_bin = filtered_df.groupby('Price_Bins', observed=False)['Total_Reviews'].mean().reset_index()
-        col1_pb, col2_pb = st.columns([1, 1])
-        with col2_pb:
-            fig_price_bin = px.bar(df_by_price_bin, x='Price_Bins', y='Total_Reviews', title='Número Médio de Avaliações por Faixa de Preço')
-            fig_price_bin.update_xaxes(title_text='Faixa de Preço', type='category').update_yaxes(title_text='Número Médio de Avaliações')
-            st.plotly_chart(fig_price_bin, use_container_width=True)
-        with col1_pb:
-            st.markdown("""
-            * **Relação de Avaliações em Faixas de Preço Baixas:** A faixa de preço `Free` tem um número médio de avaliações significativamente maior do que a faixa de `0.01 - 5` USD. Isso sugere que, embora o modelo gratuito atraia um grande volume de avaliações, a faixa mais baixa de jogos pagos pode ter menos visibilidade e um público menos propenso a deixar feedback.
-            * **Relação Positiva e Acelerada:** Para jogos com preço acima de 5 USD, há uma relação positiva e acelerada: quanto maior a faixa de preço, maior o número médio de avaliações que ele recebe. O número de avaliações cresce consistentemente a cada faixa de preço mais alta.
-            * **Pico de Engajamento em Jogos Mais Caros:** A categoria de jogos com preço `Over 20` USD recebe o maior número médio de avaliações, superando 6.000 por jogo. Isso indica que os jogos mais caros são, em média, os mais populares ou os que mais geram engajamento e feedback dos jogadores na plataforma.
-            """)
+        return figure_cache.get_or_compute((cache_key, name), timed_compute)
 
+    with tab1:
+        if tab1.open:
+            with span("page.render.popularity"): render_popularity_tab(filtered_df, cube, selected_cells, cached)
+    with tab2:
+        if tab2.open:
+            with span("page.render.market"): render_market_tab(filtered_df, cube, selected_cells, cached)
     with tab3:
-        st.subheader("Comparação de Avaliações e Métrica de Sucesso")
-        corr_value = filtered_df[['Metacritic score', 'Recommendations']].corr().iloc[0,1]
-        st.metric(label="Correlação entre Metacritic Score e Recomendações", value=f"{corr_value:.3f}")
-        fig_metacritic_rec = px.scatter(filtered_df.sample(min(1000, len(filtered_df))), x='Metacritic score', y='Recommendations', title='Metacritic Score vs. Recomendações', trendline='ols', hover_data=['Name'], range_y=[0, 25000])
-        st.plotly_chart(fig_metacritic_rec, use_container_width=True)
-        st.markdown("""
-        * **Correlação Fraca:** A correlação positiva de `0.124` demonstra uma relação muito fraca entre a pontuação do Metacritic e as recomendações dos usuários. Embora um Metacritic Score mais alto possa ter uma pequena tendência a gerar mais recomendações, a relação não é forte.
-        * **Distribuição de Pontos:** A visualização mostra que a maioria dos jogos tem pontuações e recomendações baixas, com alguns outliers em ambas as variáveis, que podem representar jogos de grande sucesso.
-        """)
-        
-        st.subheader("Intervalo de Confiança para a Média do Metacritic Score")
-        st.markdown("""
-            O `Metacritic score` foi escolhido para aplicar o Intervalo de Confiança por ser uma variável quantitativa e um dos indicadores mais importantes da qualidade e recepção crítica de um jogo. Ele nos permite fazer inferências sobre a população inteira de jogos da Steam a partir da sua amostra.
-        """)
-        
-        selected_confidence = st.selectbox("Escolha o Nível de Confiança (%)", options=[70, 80, 90, 95, 99], index=3)
-        metacritic_data = filtered_df['Metacritic score'].dropna()
-        if len(metacritic_data) > 1:
-            conf_interval = stats.t.interval(confidence=selected_confidence/100, df=len(metacritic_data)-1, loc=metacritic_data.mean(), scale=stats.sem(metacritic_data))
-            st.info(f"Temos {selected_confidence}% de confiança de que a pontuação média real do Metacritic para os jogos selecionados está entre **{conf_interval[0]:.2f} e {conf_interval[1]:.2f}**.")
-
-        st.subheader("Teste de Hipótese para Conquistas nos Jogos")
-        st.markdown("""
-            A escolha de conquistas (`Achievements`) para o teste de hipótese foi motivada por ser uma métrica que pode estar diretamente ligada ao esforço de desenvolvimento e à longevidade de um jogo. A hipótese é que um jogo com mais conquistas pode ser visto como mais completo, oferecendo mais conteúdo, o que poderia se traduzir em melhores avaliações.
-
-            O teste de hipótese nos permite verificar se essa suposição é estatisticamente válida.
-        """)
-        
-        median_achievements = filtered_df['Achievements'].median()
-        high_ach_data = filtered_df[filtered_df['Achievements'] > median_achievements]['Positive'].dropna()
-        low_ach_data = filtered_df[filtered_df['Achievements'] <= median_achievements]['Positive'].dropna()
-        if not high_ach_data.empty and not low_ach_data.empty:
-            t_stat_ach, p_value_ach = stats.ttest_ind(high_ach_data, low_ach_data, equal_var=False, nan_policy='omit')
-            st.write(f"**Estatística T:** `{t_stat_ach:.2f}` | **Valor p:** `{p_value_ach:.4f}`")
-            if p_value_ach < 0.05:
-                st.success("O p-valor é menor que 0.05, indicando uma diferença estatisticamente significativa na média de avaliações positivas entre os dois grupos.")
-            else:
-                st.warning("O p-valor não é menor que 0.05. Não há evidência de uma diferença estatisticamente significativa.")
-
-            fig_achievements_bp = px.box(filtered_df, x=np.where(filtered_df['Achievements'] > median_achievements, 'Acima da Mediana', 'Abaixo da Mediana'), y='Positive', title='Distribuição de Avaliações Positivas por Grupo de Conquistas', range_y=[0, 350])
-            fig_achievements_bp.update_xaxes(title_text='Grupo de Conquistas').update_yaxes(title_text='Avaliações Positivas')
-            st.plotly_chart(fig_achievements_bp, use_container_width=True)
-            st.markdown("""
-            * **Diferença de Médias:** O teste t com um p-valor de `0.0000` indica uma diferença estatisticamente significativa na média de avaliações positivas entre os dois grupos. O box plot, ao limitar o eixo Y, mostra claramente que a mediana de avaliações do grupo "Acima da Mediana" é superior.
-            * **Distribuição de Dados:** A distribuição das avaliações do grupo "Acima da Mediana" é mais concentrada e tem uma mediana mais alta do que o grupo "Abaixo da Mediana", embora ambos os grupos tenham um grande número de outliers positivos, que podem ser melhor vistos ajustando a escala do gráfico.
-            """)
-
+        if tab3.open:
+            with span("page.render.inference"): render_inference_tab(filtered_df, cube, selected_cells, cached)
+    with tab_search:
+        if tab_search.open:
+            with span("page.render.search"): render_search_tab(df, data.search, selection["mask"])
     with tab4:
-        st.markdown('### Conclusão Geral das Análises')
-        st.markdown("""
-            O dashboard demonstra uma abordagem analítica estruturada e aprofundada sobre o ecossistema de jogos da Steam, revelando insights valiosos sobre tendências de mercado, engajamento do usuário e percepção de qualidade, ainda que com as limitações da base de dados utilizada.
-            
-            A análise de tendência de preço ao longo dos anos mostra uma clara e acelerada tendência de queda no preço médio dos jogos desde 2012, impulsionada pelo crescimento exponencial de títulos free-to-play e de baixo custo. A visualização da distribuição de avaliações por faixa de preço revela uma dinâmica interessante: enquanto jogos gratuitos atraem um grande número de avaliações, os jogos pagos de baixo custo recebem menos feedback, e o número de avaliações aumenta drasticamente nas faixas de preço mais altas.
-
-            O estudo do tempo de jogo médio por gênero revelou que as categorias com maior engajamento de longo prazo não são jogos tradicionais, mas sim softwares de produtividade e ferramentas criativas, como `Audio Production` e `Utilities`. No universo dos jogos, o gênero `Massively Multiplayer` se destaca como o único com um alto tempo de jogo médio. A análise de inferência estatística reforça essas descobertas, demonstrando que jogos com mais conquistas tendem a ter um número significativamente maior de avaliações positivas, sugerindo que o investimento do desenvolvedor em conteúdo se correlaciona com uma melhor recepção do público.
-
-            A correlação entre o Metacritic Score e as recomendações é muito fraca, indicando que a pontuação da crítica não é um forte preditor de recomendações diretas dos usuários. Por fim, o Intervalo de Confiança para a média do `Metacritic Score` nos permite estimar o verdadeiro score médio da plataforma, fornecendo um parâmetro robusto para entender a percepção de qualidade do mercado de forma geral.
-        """)
+        if tab4.open: render_conclusion_tab()
 
     st.divider()
     st.markdown("""
@@ -347,4 +507,6 @@ def data_analysis_page():
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    data_analysis_page()
\ No newline at end of file
+    # Cada execução da página vira um trace, com os spans acima em ordem (ver página de diagnóstico)
+    with trace("page.rerun"):
+        data_analysis_page()
\ No newline at end of file
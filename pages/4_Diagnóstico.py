@@ -0,0 +1,166 @@
+import os
+import time
+import streamlit as st
+from portfolio.metrics import REGISTRY
+from portfolio.state import request_refresh
+from portfolio.assets import image_data_uri, page_icon
+from portfolio.warmup import start_warmup
+
+# --- CONFIGURAÇÕES INICIAIS ---
+
+# Configurações da página
+st.set_page_config(
+    page_title="Diagnóstico",
+    page_icon=page_icon("logo.png"),
+    layout="wide"
+)
+
+start_warmup()
+
+# Zerar as métricas e forçar a verificação do CSV afetam todas as sessões do processo: só aparecem com PORTFOLIO_ADMIN=1
+ADMIN_ENABLED = os.environ.get("PORTFOLIO_ADMIN", "0") == "1"
+
+def clock(seconds):
+    # Horário local do servidor, no mesmo formato da página de análise
+    return time.strftime('%H:%M:%S', time.localtime(seconds))
+
+# --- TABELAS E GRÁFICOS A PARTIR DO SNAPSHOT DAS MÉTRICAS ---
+# pandas e plotly são importados nas funções que os usam, como nas páginas leves, e só quando há o que mostrar:
+# sem etapas medidas (um processo que ainda não abriu a análise), nenhum gráfico é montado e o plotly não é carregado.
+
+def spans_table(snapshot):
+    if not snapshot["spans"]:
+        return None
+    import pandas as pd
+    spans = pd.DataFrame.from_dict(snapshot["spans"], orient="index")
+    table = pd.DataFrame({
+        "Execuções": spans["count"],
+        "Média (ms)": spans["mean"] * 1e3,
+        "p50 (ms)": spans["p50"] * 1e3,
+        "p95 (ms)": spans["p95"] * 1e3,
+        "Máximo (ms)": spans["max"] * 1e3,
+        "Total (s)": spans["total"],
+    })
+    table.index.name = "Etapa"
+    return table.sort_values("Total (s)", ascending=False)
+
+def sizes_table(snapshot):
+    if not snapshot["sizes"]:
+        return None
+    import pandas as pd
+    sizes = pd.DataFrame.from_dict(snapshot["sizes"], orient="index")
+    table = pd.DataFrame({
+        "Medições": sizes["count"],
+        "Média (KB)": sizes["total"] / sizes["count"] / 1024,
+        "Última (KB)": sizes["last"] / 1024,
+        "Máximo (KB)": sizes["max"] / 1024,
+    })
+    table.index.name = "Resultado"
+    return table.sort_values("Média (KB)", ascending=False)
+
+def gauge_table(values):
+    import pandas as pd
+    return pd.Series(values, name="valor").to_frame()
+
+def trace_figure(trace):
+    # Cascata de uma execução: cada barra começa no início relativo do span; a indentação mostra o aninhamento
+    import plotly.graph_objects as go
+    spans = trace["spans"]
+    labels = [f"{'· ' * span['depth']}{span['name']} #{i}" for i, span in enumerate(spans)]
+    fig = go.Figure(go.Bar(
+        y=labels, x=[span["seconds"] * 1e3 for span in spans], base=[span["start"] * 1e3 for span in spans],
+        orientation='h', marker_color='#636efa', hovertemplate="%{y}<br>início %{base:.1f} ms<br>duração %{x:.1f} ms<extra></extra>",
+    ))
+    fig.update_layout(title=f"Execução de {trace['seconds'] * 1e3:.0f} ms", xaxis_title="Tempo desde o início (ms)",
+                      height=max(300, 22 * len(spans)), margin=dict(l=10, r=10, t=40, b=10))
+    fig.update_yaxes(autorange="reversed", type='category', tickfont=dict(family="monospace"))
+    return fig
+
+def diagnostics_page():
+    with st.sidebar:
+        st.image(image_data_uri("logo.png", 30), width=30)
+
+    col1, col2 = st.columns([1, 9])
+    with col1: st.image(image_data_uri("logo.png", 100), width=100)
+    with col2: st.title("Diagnóstico de Desempenho")
+    st.divider()
+
+    st.markdown("""
+        Tempos, tamanhos e medidores coletados por este processo desde que ele foi iniciado, somando todas as sessões.
+        As etapas `ingest.*` são o pré-processamento dos dados, e as etapas `page.*` são a página de Análise de Dados:
+        filtros, agregados, montagem das figuras e desenho das abas. Navegue pela página de análise para gerar medições.
+    """)
+
+    snapshot = REGISTRY.snapshot()
+    traces = snapshot["traces"]
+    cache = snapshot["gauges"].get("selection_cache", {})
+    memory = snapshot["gauges"].get("process_memory", {})
+    reruns = snapshot["spans"].get("page.rerun")
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Execuções da análise", f"{reruns['count']:,}" if reruns else "0")
+    col2.metric("p95 por execução", f"{reruns['p95'] * 1e3:.0f} ms" if reruns else "-")
+    col3.metric("Acerto do cache de seleções", f"{cache['hit_rate']:.0%}" if "hit_rate" in cache else "-")
+    col4.metric("Memória do processo (RSS)", f"{memory['rss'] / 2**20:.0f} MB" if "rss" in memory else "-")
+
+    st.subheader("Tempo por etapa")
+    spans = spans_table(snapshot)
+    if spans is None:
+        st.info("Nenhuma etapa medida ainda neste processo.")
+    else:
+        st.dataframe(spans.style.format(precision=1), width="stretch")
+        import plotly.graph_objects as go
+        top = spans.head(15).iloc[::-1]
+        fig = go.Figure(go.Bar(x=top["Total (s)"], y=top.index, orientation='h', marker_color='#636efa'))
+        fig.update_layout(title="Tempo total acumulado por etapa (15 maiores)", xaxis_title="Segundos", yaxis_title="")
+        st.plotly_chart(fig, width="stretch")
+
+    st.subheader("Execuções recentes")
+    if traces:
+        options = list(range(len(traces)))[::-1]
+        chosen = st.selectbox("Execução:", options, format_func=lambda i: f"{clock(traces[i]['started'])} ({traces[i]['seconds'] * 1e3:.0f} ms, {len(traces[i]['spans'])} etapas)")
+        st.plotly_chart(trace_figure(traces[chosen]), width="stretch")
+    else:
+        st.info("Nenhuma execução da página de análise registrada ainda.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Tamanho dos resultados")
+        sizes = sizes_table(snapshot)
+        if sizes is None:
+            st.info("Nenhum resultado medido ainda.")
+        else:
+            st.dataframe(sizes.style.format(precision=1), width="stretch")
+    with col2:
+        st.subheader("Medidores")
+        for source, values in snapshot["gauges"].items():
+            st.markdown(f"**{source}**")
+            st.dataframe(gauge_table(values), width="stretch")
+
+    st.subheader("Dados servidos")
+    state = snapshot["gauges"].get("analysis_state", {})
+    if state.get("version"):
+        st.caption(f"Versão {state['version']:.0f}, montada às {clock(state['built_at'])} em {state['last_build_seconds']:.1f} s; "
+                   f"{state['builds']:.0f} montagem(ns), {state['skipped']:.0f} verificação(ões) sem mudança de conteúdo, {state['errors']:.0f} erro(s).")
+    else:
+        st.caption("Os dados da análise ainda não foram carregados neste processo.")
+    if ADMIN_ENABLED and st.button("Verificar o CSV agora"):
+        # A nova versão é montada em segundo plano; as sessões passam a usá-la quando ficar pronta
+        request_refresh()
+        st.toast("Verificação iniciada em segundo plano.")
+
+    st.subheader("Exportar")
+    col1, col2, col3 = st.columns([1, 1, 3])
+    col1.download_button("Baixar JSON", REGISTRY.to_json(snapshot), file_name="metricas.json", mime="application/json")
+    col2.download_button("Baixar Prometheus", REGISTRY.to_prometheus(snapshot), file_name="metricas.prom", mime="text/plain")
+    if ADMIN_ENABLED:
+        if col3.button("Zerar métricas"):
+            REGISTRY.reset()
+            st.rerun()
+    else:
+        col3.caption("Zerar as métricas e verificar o CSV ficam disponíveis com a variável de ambiente PORTFOLIO_ADMIN=1.")
+    with st.expander("Ver métricas no formato Prometheus"):
+        st.code(REGISTRY.to_prometheus(snapshot), language="text")
+
+if __name__ == "__main__":
+    diagnostics_page()
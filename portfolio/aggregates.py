@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from portfolio.genres import genre_mask
+
+# --- CUBO DE AGREGADOS ---
+# Estatísticas suficientes (contagem, soma e soma dos quadrados) por célula
+# conjunto de gêneros x ano x faixa de preço x faixa de donos, montadas uma vez no carregamento.
+# As células usam o conjunto de gêneros da linha (e não cada gênero isolado), de modo que os filtros
+# "qualquer um"/"todos" são resolvidos exatamente sem contar um jogo duas vezes.
+# Qualquer média, contagem ou variância de uma seleção sai da soma de células, sem varrer as linhas.
+
+PRICE_BINS = [0, 0.01, 5.0, 10.0, 15.0, 20.0, float('inf')]
+PRICE_LABELS = ['Free', '0.01 - 5', '5.01 - 10', '10.01 - 15', '15.01 - 20', 'Over 20']
+CUBE_METRICS = ['Price', 'Total_Reviews', 'Positive_Percentage', 'Average playtime forever', 'Metacritic score', 'Recommendations']
+# Produtos cruzados guardados para correlações e regressões entre pares de métricas
+CUBE_PRODUCTS = [('Metacritic score', 'Recommendations')]
+
+@dataclass(frozen=True)
+class AggregateCube:
+    genres: list
+    genre_sets: np.ndarray
+    owner_labels: list
+    min_year: int
+    n_years: int
+    cells: dict
+
+def price_bin_codes(prices):
+    # Faixas de PRICE_BINS fechadas à esquerda, como pd.cut(..., right=False). 'Free' é preço <= 0, e não < 0.01:
+    # o preço é float32 e float32(0.01) fica abaixo de 0.01, o que poria um jogo de $0.01 em 'Free'. Os demais
+    # limites (5, 10, 15, 20) são exatos em float32. Preço nulo ou negativo fica fora das faixas (-1).
+    values = np.asarray(prices, dtype=np.float64)
+    codes = np.searchsorted(PRICE_BINS[2:-1], values, side='right').astype(np.int8) + 1
+    codes[values <= 0] = 0
+    codes[~(values >= 0)] = -1
+    return codes
+
+def build_cube(df, genre_index):
+    genre_sets, set_codes = np.unique(genre_index.membership, axis=0, return_inverse=True)
+    # Categórico ordenado pelos limites numéricos da faixa (ver portfolio/owners.py)
+    owners = df['Estimated owners'].cat
+    owner_labels = list(owners.categories)
+    years = df['Release Year'].to_numpy(dtype=np.int64)
+    min_year = int(years.min()) if len(years) else 0
+
+    keys = pd.DataFrame({
+        'genre_set': set_codes.ravel(),
+        'year': years - min_year,
+        'price_bin': price_bin_codes(df['Price']),
+        'owners': owners.codes,
+    })
+    values = pd.DataFrame({'count': np.ones(len(df))})
+    for metric in CUBE_METRICS:
+        column = df[metric].to_numpy(dtype=np.float64)
+        values[f'{metric}_sum'] = column
+        values[f'{metric}_sumsq'] = column ** 2
+    for a, b in CUBE_PRODUCTS:
+        values[f'{a}*{b}_sum'] = df[a].to_numpy(dtype=np.float64) * df[b].to_numpy(dtype=np.float64)
+    grouped = pd.concat([keys, values], axis=1).groupby(list(keys.columns), sort=False).sum().reset_index()
+    cells = {name: grouped[name].to_numpy() for name in grouped.columns}
+    return AggregateCube(genre_index.genres, genre_sets, owner_labels, min_year, int(years.max()) - min_year + 1 if len(years) else 0, cells)
+
+def cube_mask(cube, selected_genres=(), genre_mode='any', year_range=None):
+    cells = cube.cells
+    mask = np.ones(len(cells['count']), dtype=bool)
+    if year_range is not None:
+        mask &= (cells['year'] >= year_range[0] - cube.min_year) & (cells['year'] <= year_range[1] - cube.min_year)
+    if selected_genres:
+        mask &= genre_mask(cube.genre_sets, cube.genres, selected_genres, genre_mode)[cells['genre_set']]
+    return mask
+
+def _group_labels(cube, by):
+    if by == 'Release Year':
+        return cube.cells['year'], np.arange(cube.min_year, cube.min_year + cube.n_years)
+    if by == 'Price_Bins':
+        return cube.cells['price_bin'], np.array(PRICE_LABELS, dtype=object)
+    if by == 'Estimated owners':
+        return cube.cells['owners'], np.array(cube.owner_labels, dtype=object)
+    raise ValueError(f"Agrupamento não suportado pelo cubo: {by!r}")
+
+def grouped_stats(cube, mask, by, metric):
+    # Contagem, média e variância amostral de 'metric' por grupo, a partir das somas das células
+    codes, labels = _group_labels(cube, by)
+    codes, keep = codes[mask], codes[mask] >= 0
+    n_groups = len(labels)
+    count = np.bincount(codes[keep], weights=cube.cells['count'][mask][keep], minlength=n_groups)
+    total = np.bincount(codes[keep], weights=cube.cells[f'{metric}_sum'][mask][keep], minlength=n_groups)
+    total_sq = np.bincount(codes[keep], weights=cube.cells[f'{metric}_sumsq'][mask][keep], minlength=n_groups)
+    return _stats_frame(labels, by, count, total, total_sq)
+
+def genre_stats(cube, mask, metric):
+    # Agrega primeiro por conjunto de gêneros e depois distribui cada conjunto entre os seus gêneros
+    n_sets = len(cube.genre_sets)
+    set_codes = cube.cells['genre_set'][mask]
+    by_set = [np.bincount(set_codes, weights=cube.cells[name][mask], minlength=n_sets)
+              for name in ('count', f'{metric}_sum', f'{metric}_sumsq')]
+    count, total, total_sq = (values @ cube.genre_sets for values in by_set)
+    return _stats_frame(np.array(cube.genres, dtype=object), 'Genres', count, total, total_sq)
+
+def _stats_frame(labels, by, count, total, total_sq):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        var = (total_sq - count * mean ** 2) / (count - 1)
+    return pd.DataFrame({'count': count, 'mean': mean, 'var': np.where(count > 1, np.maximum(var, 0), np.nan)},
+                        index=pd.Index(labels, name=by))
+
+def selection_totals(cube, mask, metric):
+    return cube.cells['count'][mask].sum(), cube.cells[f'{metric}_sum'][mask].sum()
+
+def selection_sums(cube, mask, metric):
+    # (n, soma, soma dos quadrados) de 'metric' na seleção
+    return cube.cells['count'][mask].sum(), cube.cells[f'{metric}_sum'][mask].sum(), cube.cells[f'{metric}_sumsq'][mask].sum()
+
+def selection_cross_sum(cube, mask, a, b):
+    return cube.cells[f'{a}*{b}_sum'][mask].sum()
@@ -0,0 +1,187 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from portfolio.aggregates import CUBE_METRICS, cube_mask, genre_stats, grouped_stats, selection_cross_sum, selection_sums
+from portfolio.cache import LRUCache
+from portfolio.genres import filter_genres
+from portfolio.inference import correlation, moments, moments_from_sums, t_interval, welch_test
+from portfolio.metrics import REGISTRY, span
+
+# --- CONSULTAS SOBRE O DATASET PROCESSADO ---
+# Os cálculos da página de análise, separados do Streamlit: a página, a API HTTP (portfolio/api.py) e scripts usam
+# as mesmas funções. Um filtro é (gêneros, modo, intervalo de anos) normalizado, de modo que estados equivalentes
+# geram a mesma chave. Agregados saem do cubo (somas por célula, sem varrer as linhas); só o teste de conquistas
+# precisa das linhas da seleção. Os resultados de query() e report() ficam num LRU indexado pela versão dos dados
+# (ver portfolio/state.py) e pela consulta normalizada.
+
+GROUP_BY = ['Release Year', 'Price_Bins', 'Estimated owners', 'Genres']
+GENRE_MODES = ['any', 'all']
+
+QUERY_CACHE = LRUCache(max_entries=256, max_bytes=64 * 2**20)
+REGISTRY.register_collector("query_cache", QUERY_CACHE.stats)
+
+@dataclass(frozen=True)
+class Query:
+    genres: tuple = ()
+    genre_mode: str = 'any'
+    years: tuple = None
+    metric: str = 'Price'
+    group_by: str = None
+
+# --- FILTROS ---
+
+def selection_key(selected_genres, genre_mode, year_range):
+    # Normaliza o estado dos filtros: a ordem dos gêneros não importa, e o modo só importa com 2+ gêneros
+    genres = tuple(sorted(set(selected_genres)))
+    return (genres, genre_mode if len(genres) > 1 else 'any', (int(year_range[0]), int(year_range[1])))
+
+def row_mask(df, genre_index, key):
+    # Máscara booleana alinhada às posições de df, reaproveitada pelo índice de gêneros
+    genres, genre_mode, (start_year, end_year) = key
+    mask = df['Release Year'].between(start_year, end_year).to_numpy()
+    if genres:
+        mask = mask & filter_genres(genre_index, genres, genre_mode)
+    return mask
+
+def cell_mask(cube, key):
+    genres, genre_mode, year_range = key
+    return cube_mask(cube, genres, genre_mode, year_range)
+
+# --- AGREGADOS DA PÁGINA ---
+
+def price_by_year(cube, cells, window=3):
+    stats = grouped_stats(cube, cells, 'Release Year', 'Price')
+    by_year = stats.loc[stats['count'] > 0, 'mean'].rename('Price').reset_index()
+    by_year['Média Móvel'] = by_year['Price'].rolling(window=window, min_periods=1).mean()
+    return by_year
+
+def reviews_by_price_bin(cube, cells):
+    return grouped_stats(cube, cells, 'Price_Bins', 'Total_Reviews')['mean'].rename('Total_Reviews').reset_index()
+
+def top_genres_by_playtime(cube, cells, n=10):
+    playtime = genre_stats(cube, cells, 'Average playtime forever')['mean'].dropna()
+    return playtime.rename('Average playtime forever').nlargest(n).reset_index().sort_values('Average playtime forever', ascending=True)
+
+def metacritic_recommendations_correlation(cube, cells):
+    # Correlação a partir das somas e produtos cruzados do cubo, sem varrer as linhas
+    n, sum_x, sum_xx = selection_sums(cube, cells, 'Metacritic score')
+    _, sum_y, sum_yy = selection_sums(cube, cells, 'Recommendations')
+    return correlation(n, sum_x, sum_y, sum_xx, sum_yy, selection_cross_sum(cube, cells, 'Metacritic score', 'Recommendations'))
+
+def metacritic_t_interval(cube, cells, confidence):
+    return t_interval(*moments_from_sums(*selection_sums(cube, cells, 'Metacritic score')), confidence)
+
+def achievement_groups(frame):
+    median_achievements = frame['Achievements'].median()
+    above = (frame['Achievements'] > median_achievements).to_numpy()
+    positive = frame['Positive'].to_numpy(dtype=np.float64)
+    high_ach_data, low_ach_data = positive[above], positive[~above]
+    return above, high_ach_data[~np.isnan(high_ach_data)], low_ach_data[~np.isnan(low_ach_data)]
+
+def achievements_ttest(frame):
+    _, high_ach_data, low_ach_data = achievement_groups(frame)
+    if not len(high_ach_data) or not len(low_ach_data):
+        return None
+    return welch_test(moments(high_ach_data), moments(low_ach_data))
+
+# --- INTERFACE DE CONSULTA ---
+
+def make_query(genres=(), genre_mode='any', years=None, metric='Price', group_by=None, state=None):
+    # Valida e normaliza; anos ausentes viram o intervalo completo da versão de dados servida
+    if metric not in CUBE_METRICS:
+        raise ValueError(f"Métrica desconhecida: {metric!r} (use uma de {', '.join(CUBE_METRICS)})")
+    if group_by is not None and group_by not in GROUP_BY:
+        raise ValueError(f"Agrupamento desconhecido: {group_by!r} (use um de {', '.join(GROUP_BY)})")
+    if genre_mode not in GENRE_MODES:
+        raise ValueError(f"Modo de filtro desconhecido: {genre_mode!r}")
+    if years is None:
+        cube = _state(state).cube
+        years = (cube.min_year, cube.min_year + cube.n_years - 1)
+    genres, genre_mode, years = selection_key(genres, genre_mode, years)
+    return Query(genres, genre_mode, years, metric, group_by)
+
+def query(genres=(), genre_mode='any', years=None, metric='Price', group_by=None, state=None):
+    # Contagem, média e variância de 'metric' na seleção, por grupo (ou uma linha 'Total' sem agrupamento)
+    state = _state(state)
+    spec = make_query(genres, genre_mode, years, metric, group_by, state)
+    return QUERY_CACHE.get_or_compute((state.version, spec), lambda: _run_query(state, spec))
+
+def _run_query(state, spec):
+    with span("query.aggregate"):
+        cells = cell_mask(state.cube, (spec.genres, spec.genre_mode, spec.years))
+        if spec.group_by == 'Genres':
+            return genre_stats(state.cube, cells, spec.metric)
+        if spec.group_by is not None:
+            return grouped_stats(state.cube, cells, spec.group_by, spec.metric)
+        n, mean, var = moments_from_sums(*selection_sums(state.cube, cells, spec.metric))
+        return pd.DataFrame({'count': [n], 'mean': [mean], 'var': [var]}, index=pd.Index(['Total'], name='group'))
+
+# Relatórios prontos: os mesmos números mostrados nas abas da página
+REPORTS = {
+    'price_by_year': lambda state, key, params: price_by_year(state.cube, cell_mask(state.cube, key), int(params.get('window', 3))),
+    'reviews_by_price_bin': lambda state, key, params: reviews_by_price_bin(state.cube, cell_mask(state.cube, key)),
+    'top_genres_by_playtime': lambda state, key, params: top_genres_by_playtime(state.cube, cell_mask(state.cube, key), int(params.get('n', 10))),
+    'metacritic_correlation': lambda state, key, params: {'correlation': metacritic_recommendations_correlation(state.cube, cell_mask(state.cube, key))},
+    'metacritic_interval': lambda state, key, params: _interval(metacritic_t_interval(state.cube, cell_mask(state.cube, key), float(params.get('confidence', 0.95)))),
+    'achievements_ttest': lambda state, key, params: _ttest(achievements_ttest(state.df[row_mask(state.df, state.genre_index, key)])),
+}
+
+# Parâmetros aceitos por cada relatório, além dos filtros
+REPORT_PARAMS = {
+    'price_by_year': ('window',),
+    'reviews_by_price_bin': (),
+    'top_genres_by_playtime': ('n',),
+    'metacritic_correlation': (),
+    'metacritic_interval': ('confidence',),
+    'achievements_ttest': (),
+}
+
+def check_report(name, params):
+    if name not in REPORTS:
+        raise ValueError(f"Relatório desconhecido: {name!r} (use um de {', '.join(REPORTS)})")
+    unknown = [key for key in params if key not in REPORT_PARAMS[name]]
+    if unknown:
+        accepted = ', '.join(REPORT_PARAMS[name]) or 'nenhum além dos filtros'
+        raise ValueError(f"Parâmetro desconhecido para o relatório {name!r}: {unknown[0]!r} (aceitos: {accepted})")
+
+def report(name, genres=(), genre_mode='any', years=None, state=None, **params):
+    check_report(name, params)
+    state = _state(state)
+    spec = make_query(genres, genre_mode, years, state=state)
+    key = (spec.genres, spec.genre_mode, spec.years)
+    cache_key = (state.version, 'report', name, key, tuple(sorted(params.items())))
+    with span(f"query.report.{name}"):
+        return QUERY_CACHE.get_or_compute(cache_key, lambda: REPORTS[name](state, key, params))
+
+def to_records(result):
+    # Resultado de query()/report() em estruturas JSON (NaN vira None)
+    if isinstance(result, pd.DataFrame):
+        frame = result.reset_index() if result.index.name is not None else result
+        frame = frame.astype(object).where(frame.notna(), None)
+        return [{key: _plain(value) for key, value in row.items()} for row in frame.to_dict(orient='records')]
+    if isinstance(result, dict):
+        return {key: _plain(value) for key, value in result.items()}
+    return _plain(result)
+
+def _plain(value):
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+def _interval(interval):
+    return None if interval is None else {'lower': interval[0], 'upper': interval[1]}
+
+def _ttest(result):
+    return None if result is None else {'t_stat': result[0], 'p_value': result[1]}
+
+def _state(state):
+    if state is not None:
+        return state
+    from portfolio.state import analysis_data
+    return analysis_data()
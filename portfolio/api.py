@@ -0,0 +1,265 @@
+import argparse
+import json
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from portfolio.analytics import GROUP_BY, REPORTS, check_report, make_query, query, report, row_mask, to_records
+from portfolio.aggregates import CUBE_METRICS
+from portfolio.explorer import EXPLORER_COLUMNS, EXPORT_FORMATS, export_chunks, ordered_rows, page_count, page_frame, sort_permutation
+from portfolio.metrics import REGISTRY, span
+from portfolio.search import SEARCH_FIELDS, complete, search
+from portfolio.state import analysis_data
+
+# --- API HTTP/JSON LOCAL ---
+# Expõe portfolio/analytics.py sem Streamlit nem navegador, para scripts, relatórios pré-calculados e testes de
+# carga. Usa só a biblioteca padrão (uma thread por requisição) e serve a mesma versão de dados que a página,
+# inclusive as trocas feitas pela atualização em segundo plano. Escuta em 127.0.0.1 por padrão.
+# Uso, a partir da raiz do projeto:
+#   python -m portfolio.api --port 8502
+#   curl "http://127.0.0.1:8502/query?genres=Action,RPG&genre_mode=all&years=2010-2020&metric=Price&group_by=Release%20Year"
+#   curl "http://127.0.0.1:8502/report/metacritic_interval?genres=Indie&confidence=0.99"
+#   curl -d '[{"query": {"metric": "Price"}}, {"report": "price_by_year", "window": 5}]' http://127.0.0.1:8502/batch
+#   curl "http://127.0.0.1:8502/search?q=counter%20str&fields=Name,Tags&limit=10"
+#   curl "http://127.0.0.1:8502/rows?genres=RPG&sort=Price&desc=1&page=2&page_size=50&columns=Name,Price"
+#   curl -o rpg.parquet "http://127.0.0.1:8502/export?genres=RPG&format=parquet"
+# Rotas: GET /health, /catalog, /query, /report/<nome>, /search, /complete, /rows, /export, /metrics (Prometheus);
+# POST /batch (lista de consultas). /export envia o arquivo em pedaços, à medida que é gerado.
+
+FILTER_PARAMS = ("genres", "genre_mode", "years")
+MAX_PAGE_SIZE = 1000
+SEARCH_RESULT_COLUMNS = ['AppID', 'Name', 'Developers', 'Publishers', 'Release Year', 'Price', 'Total_Reviews', 'Positive_Percentage']
+
+def parse_filters(params):
+    # genres=Action,RPG  genre_mode=any|all  years=2010-2020
+    filters = {}
+    if params.get("genres"):
+        filters["genres"] = tuple(g.strip() for g in params["genres"].split(",") if g.strip())
+    if params.get("genre_mode"):
+        filters["genre_mode"] = params["genre_mode"]
+    if params.get("years"):
+        try:
+            start, end = params["years"].replace(",", "-").split("-")
+            filters["years"] = (int(start), int(end))
+        except ValueError:
+            raise ValueError(f"Intervalo de anos inválido: {params['years']!r} (use, por exemplo, 2010-2020)")
+    return filters
+
+def run_query(params):
+    state = analysis_data()
+    result = query(metric=params.get("metric", "Price"), group_by=params.get("group_by") or None, state=state, **parse_filters(params))
+    return {"version": state.version, "rows": to_records(result)}
+
+def run_report(name, params):
+    # Só os parâmetros do relatório seguem como argumentos: '?state=x' ou '?name=x' viram 400, não um TypeError
+    extra = {key: value for key, value in params.items() if key not in FILTER_PARAMS}
+    check_report(name, extra)
+    state = analysis_data()
+    result = report(name, state=state, **parse_filters(params), **extra)
+    return {"version": state.version, "report": name, "result": to_records(result)}
+
+def run_search(params):
+    # q=texto  fields=Name,Tags  limit=20
+    fields = [f.strip() for f in params.get("fields", "").split(",") if f.strip()]
+    unknown = [f for f in fields if f not in SEARCH_FIELDS]
+    if unknown:
+        raise ValueError(f"Campo de busca desconhecido: {unknown[0]!r} (use um de {', '.join(SEARCH_FIELDS)})")
+    try:
+        limit = int(params.get("limit", 20))
+    except ValueError:
+        raise ValueError(f"Limite inválido: {params['limit']!r}")
+    state = analysis_data()
+    with span("api.search"):
+        rows, total = search(state.search, params.get("q", ""), fields, max(limit, 1), state.df['Total_Reviews'].to_numpy())
+    return {"version": state.version, "total": total, "rows": to_records(state.df.iloc[rows][SEARCH_RESULT_COLUMNS])}
+
+def run_complete(params):
+    state = analysis_data()
+    return {"version": state.version, "suggestions": [{"token": token, "count": count} for token, count in complete(state.search, params.get("q", ""))]}
+
+def _int_param(params, name, default):
+    try:
+        return int(params.get(name, default))
+    except ValueError:
+        raise ValueError(f"Valor inválido para {name}: {params[name]!r}")
+
+def selection_rows(params):
+    # Filtros -> (estado, posições das linhas da seleção na ordem pedida, colunas pedidas)
+    state = analysis_data()
+    spec = make_query(state=state, **parse_filters(params))
+    mask = row_mask(state.df, state.genre_index, (spec.genres, spec.genre_mode, spec.years))
+    sort = params.get("sort")
+    permutation = sort_permutation(state.df, sort, params.get("desc", "0") in ("1", "true"), state.version) if sort else None
+    columns = [c.strip() for c in params["columns"].split(",") if c.strip()] if params.get("columns") else EXPLORER_COLUMNS
+    unknown = [c for c in columns if c not in state.df.columns]
+    if unknown:
+        raise ValueError(f"Coluna desconhecida: {unknown[0]!r}")
+    return state, ordered_rows(mask, permutation), columns
+
+def run_rows(params):
+    # page (1 = primeira) e page_size (até MAX_PAGE_SIZE), sobre a seleção e a ordem de selection_rows
+    page, page_size = _int_param(params, "page", 1), min(max(_int_param(params, "page_size", 50), 1), MAX_PAGE_SIZE)
+    state, positions, columns = selection_rows(params)
+    n_pages = page_count(len(positions), page_size)
+    if not 1 <= page <= n_pages:
+        raise ValueError(f"Página fora do intervalo: {page} (a seleção tem {n_pages} página(s))")
+    frame = page_frame(state.df, positions, page, page_size, columns)
+    return {"version": state.version, "total": len(positions), "page": page, "pages": n_pages, "rows": to_records(frame)}
+
+def parse_batch(body):
+    # JSON inválido (json.JSONDecodeError é um ValueError) ou fora do formato: a requisição inteira recebe 400
+    items = json.loads(body or b"[]")
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError("O corpo deve ser uma lista de consultas (objetos JSON).")
+    return items
+
+def batch_params(values):
+    # Valores JSON no formato da query string: listas viram itens separados por vírgula
+    # ("genres": ["Action", "RPG"] equivale a genres=Action,RPG e "years": [2010, 2020] a years=2010-2020)
+    params = {}
+    for key, value in values.items():
+        items = value if isinstance(value, list) else [value]
+        if not items or not all(isinstance(item, (str, int, float)) and not isinstance(item, bool) for item in items):
+            raise ValueError(f"Valor inválido para {key}: {value!r} (use texto, número ou lista deles)")
+        params[key] = ",".join(str(item) for item in items)
+    return params
+
+def run_batch(items):
+    # Cada item é {"query": {...}} ou {"report": nome, ...filtros e parâmetros}; erros ficam no próprio item
+    results = []
+    for item in items:
+        try:
+            if "report" in item:
+                if not isinstance(item["report"], str):
+                    raise ValueError(f"Nome de relatório inválido: {item['report']!r}")
+                results.append(run_report(item["report"], batch_params({key: value for key, value in item.items() if key != "report"})))
+            else:
+                query = item.get("query", {})
+                if not isinstance(query, dict):
+                    raise ValueError(f"'query' deve ser um objeto JSON: {query!r}")
+                results.append(run_query(batch_params(query)))
+        except ValueError as e:
+            results.append({"error": str(e)})
+    return results
+
+def health():
+    state = analysis_data()
+    return {"status": "ok", "version": state.version, "rows": len(state.df)}
+
+def catalog():
+    state = analysis_data()
+    cube = state.cube
+    return {
+        "version": state.version,
+        "metrics": CUBE_METRICS,
+        "group_by": GROUP_BY,
+        "reports": list(REPORTS),
+        "genres": cube.genres,
+        "years": [cube.min_year, cube.min_year + cube.n_years - 1],
+    }
+
+class AnalyticsHandler(BaseHTTPRequestHandler):
+    server_version = "PortfolioAnalytics/1.0"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip("/") or "/"
+        if path == "/metrics":
+            return self._handle(REGISTRY.to_prometheus, lambda text: self._send(200, text.encode(), "text/plain; version=0.0.4; charset=utf-8"))
+        if path == "/health":
+            return self._handle(health)
+        if path == "/catalog":
+            return self._handle(catalog)
+        if path == "/query":
+            return self._handle(lambda: run_query(params))
+        if path == "/search":
+            return self._handle(lambda: run_search(params))
+        if path == "/complete":
+            return self._handle(lambda: run_complete(params))
+        if path == "/rows":
+            return self._handle(lambda: run_rows(params))
+        if path == "/export":
+            return self._export(params)
+        if path.startswith("/report/"):
+            return self._handle(lambda: run_report(unquote(path[len("/report/"):]), params))
+        self._json(404, {"error": f"Rota desconhecida: {path}"})
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/batch":
+            return self._json(404, {"error": f"Rota desconhecida: {self.path}"})
+        self._handle(lambda: run_batch(parse_batch(self.rfile.read(int(self.headers.get("Content-Length") or 0)))))
+
+    def _handle(self, compute, send=None):
+        # Toda rota passa por aqui: o resultado vai como JSON (ou por 'send') e qualquer erro vira uma resposta JSON
+        try:
+            with span("api.request"):
+                payload = compute()
+        except Exception as e:
+            return self._error(e)
+        (send or (lambda payload: self._json(200, payload)))(payload)
+
+    def _error(self, e):
+        if isinstance(e, ValueError):
+            return self._json(400, {"error": str(e)})
+        if isinstance(e, FileNotFoundError):
+            return self._json(503, {"error": f"Dataset não encontrado: {e}"})
+        # Erro inesperado: o cliente recebe só o tipo; o traceback vai para o stderr do servidor
+        traceback.print_exc()
+        self._json(500, {"error": f"Erro interno: {type(e).__name__}"})
+
+    def _export(self, params):
+        # Sem Content-Length: cada pedaço vai para o cliente assim que é escrito e a conexão fecha no fim
+        fmt = params.get("format", "csv")
+        try:
+            if fmt not in EXPORT_FORMATS:
+                raise ValueError(f"Formato de exportação desconhecido: {fmt!r} (use um de {', '.join(EXPORT_FORMATS)})")
+            state, positions, columns = selection_rows(params)
+        except Exception as e:
+            return self._error(e)
+        with span("api.export"):
+            self.send_response(200)
+            self.send_header("Content-Type", EXPORT_FORMATS[fmt])
+            self.send_header("Content-Disposition", f'attachment; filename="jogos_selecionados.{fmt}"')
+            self.end_headers()
+            self.close_connection = True
+            for chunk in export_chunks(state.df, positions, columns, fmt):
+                if chunk:
+                    self.wfile.write(chunk)
+
+    def _json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode(), "application/json; charset=utf-8")
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Sem um log por requisição: a contagem e a latência ficam no span api.request
+        pass
+
+def serve(host="127.0.0.1", port=8502):
+    server = ThreadingHTTPServer((host, port), AnalyticsHandler)
+    server.daemon_threads = True
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="API HTTP/JSON local sobre o dataset processado.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+    state = analysis_data()
+    server = serve(args.host, args.port)
+    print(f"Dados na versão {state.version} ({len(state.df)} jogos); servindo em http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
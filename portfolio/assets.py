@@ -0,0 +1,71 @@
+import base64
+import hashlib
+import io
+from functools import lru_cache
+from pathlib import Path
+
+from portfolio.cache import LRUCache
+from portfolio.metrics import REGISTRY
+
+# --- IMAGENS PRÉ-PROCESSADAS E COMPARTILHADAS ENTRE AS PÁGINAS ---
+# Cada imagem de img/ é lida uma vez por processo e convertida, por tamanho, em WebP (ou PNG, para o ícone da
+# aba). O st.image reencoda imagens PIL e bytes em PNG a cada rerun, mas repassa URLs 'data:' sem processar; por
+# isso as páginas recebem data URIs prontos. As entradas são indexadas pelo hash do conteúdo do arquivo: se a
+# imagem mudar em disco, a nova versão gera novas entradas e as antigas saem pelo LRU.
+# As larguras são em pixels CSS; a imagem é gerada com PIXEL_DENSITY vezes essa largura (telas de alta
+# densidade), sem nunca ampliar o original.
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "img"
+PIXEL_DENSITY = 2
+WEBP_QUALITY = 85
+ICON_SIZE = 32
+
+ASSET_CACHE = LRUCache(max_entries=64, max_bytes=16 * 2**20)
+REGISTRY.register_collector("assets", ASSET_CACHE.stats)
+
+@lru_cache(maxsize=32)
+def _read_source(path, mtime_ns, size):
+    data = Path(path).read_bytes()
+    return data, hashlib.sha256(data).hexdigest()[:16]
+
+def source(name):
+    # Bytes originais e hash do conteúdo; o stat (barato) garante que uma imagem alterada seja relida
+    path = ASSETS_DIR / name
+    stat = path.stat()
+    return _read_source(str(path), stat.st_mtime_ns, stat.st_size)
+
+def content_hash(name):
+    return source(name)[1]
+
+def _encode(data, width, fmt):
+    # PIL só é importado quando uma imagem precisa ser codificada (falha do cache)
+    from PIL import Image
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    if width is not None:
+        target = min(image.width, width * PIXEL_DENSITY)
+        if target < image.width:
+            image = image.resize((target, max(1, round(image.height * target / image.width))), Image.LANCZOS)
+    if fmt == "JPEG" and image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGB")
+    output = io.BytesIO()
+    if fmt == "WEBP":
+        image.save(output, fmt, quality=WEBP_QUALITY)
+    else:
+        image.save(output, fmt, optimize=True)
+    return output.getvalue()
+
+def encoded_image(name, width=None, fmt="WEBP"):
+    data, digest = source(name)
+    return ASSET_CACHE.get_or_compute((digest, width, fmt, "bytes"), lambda: _encode(data, width, fmt))
+
+def image_data_uri(name, width=None, fmt="WEBP"):
+    digest = content_hash(name)
+    return ASSET_CACHE.get_or_compute(
+        (digest, width, fmt, "uri"),
+        lambda: f"data:image/{fmt.lower()};base64,{base64.b64encode(encoded_image(name, width, fmt)).decode()}",
+    )
+
+def page_icon(name="logo.png"):
+    # Ícone da aba do navegador em PNG (suporte mais amplo que WebP para favicons)
+    return image_data_uri(name, ICON_SIZE, "PNG")
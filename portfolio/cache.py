@@ -0,0 +1,89 @@
+import sys
+import threading
+from collections import OrderedDict
+
+# --- CACHE LRU COM LIMITE DE ENTRADAS E DE MEMÓRIA ---
+# Compartilhado entre as sessões do processo (criado via st.cache_resource na página).
+# Os valores guardados são tratados como somente leitura por quem os recebe.
+# pandas, numpy e plotly não são importados aqui (páginas leves também usam o cache): se o módulo ainda não foi
+# carregado pelo processo, o valor não pode ser um objeto dele.
+
+def estimate_nbytes(value):
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(value, pd.DataFrame) else int(usage)
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        return value.nbytes
+    go = sys.modules.get("plotly.graph_objects")
+    if go is not None and isinstance(value, go.Figure):
+        # Sem serializar para JSON: os dados dos traços vêm de to_plotly_json como arrays ou blocos base64
+        return estimate_nbytes(value.to_plotly_json())
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+class LRUCache:
+    def __init__(self, max_entries=32, max_bytes=256 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value, nbytes=None):
+        # 'nbytes' evita uma segunda estimativa quando quem chama já mediu o valor
+        if nbytes is None:
+            nbytes = estimate_nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                # Valor maior que o orçamento inteiro: não vale a pena esvaziar o cache por ele
+                return value
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_bytes
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
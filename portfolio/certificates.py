@@ -0,0 +1,59 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from portfolio.cache import LRUCache
+from portfolio.metrics import REGISTRY
+
+# --- REGISTRO DE CERTIFICADOS ---
+# A página de formação lista os PDFs de certificados/ sem lê-los: a listagem só depende de um stat da pasta
+# (refeita quando um arquivo é adicionado ou removido). O conteúdo é lido apenas quando alguém clica em
+# baixar (download_button com dados sob demanda) e fica em cache por processo, indexado por caminho, data de
+# modificação e tamanho. Assim o custo de desenhar a página não cresce com o total de PDFs.
+
+CERTIFICATES_DIR = Path(__file__).resolve().parent.parent / "certificados"
+
+# Rótulo do botão e nome do arquivo baixado; PDFs sem entrada aqui recebem nomes derivados do arquivo
+CERTIFICATE_INFO = {
+    "Algoritmos - Aprenda a programar.pdf": ("Certificado - Algoritmos", "certificado_de_algoritmos.pdf"),
+    "Design Thinking - Process.pdf": ("Certificado - Design Thinking", "certificado_de_design_thinking.pdf"),
+    "Estruturas de Computadores.pdf": ("Certificado - Estruturas de Computadores", "certificado_de_estrutura_de_computadores.pdf"),
+    "Formação Social e Sustentabilidade.pdf": ("Certificado - Formação Social e Sustentabilidade", "certificado_de_formação_social_e_sustentabilidade.pdf"),
+    "Trilha de Treinamentos Comportamentais.pdf": ("Certificado - Trilha de Treinamentos Comportamentais", "certificado_de_trilha_de_treinamentos_comportamentais.pdf"),
+}
+
+CERTIFICATE_CACHE = LRUCache(max_entries=32, max_bytes=64 * 2**20)
+REGISTRY.register_collector("certificates", CERTIFICATE_CACHE.stats)
+
+@dataclass(frozen=True)
+class Certificate:
+    label: str
+    file_name: str
+    path: Path
+    size: int
+
+def _default_info(path):
+    slug = re.sub(r"[^\w]+", "_", path.stem.lower()).strip("_")
+    return f"Certificado - {path.stem}", f"certificado_de_{slug}.pdf"
+
+@lru_cache(maxsize=8)
+def _scan(directory, mtime_ns):
+    certificates = []
+    for path in sorted(Path(directory).glob("*.pdf")):
+        stat = path.stat()
+        label, file_name = CERTIFICATE_INFO.get(path.name) or _default_info(path)
+        certificates.append(Certificate(label, file_name, path, stat.st_size))
+    return tuple(certificates)
+
+def list_certificates(directory=CERTIFICATES_DIR):
+    directory = Path(directory)
+    if not directory.is_dir():
+        return ()
+    return _scan(str(directory), directory.stat().st_mtime_ns)
+
+def certificate_bytes(certificate):
+    # O stat no momento do download garante que um arquivo alterado seja relido
+    stat = certificate.path.stat()
+    key = (str(certificate.path), stat.st_mtime_ns, stat.st_size)
+    return CERTIFICATE_CACHE.get_or_compute(key, certificate.path.read_bytes)
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# --- BOX PLOTS PRÉ-AGREGADOS ---
+# Quartis, cercas (whiskers) e uma amostra limitada de outliers são calculados no servidor;
+# o navegador recebe só o resumo de cada grupo em vez de todas as linhas selecionadas.
+
+BOX_COLOR = '#636efa'
+
+def box_stats(values, groups, order=None, max_outliers=200, seed=0):
+    frame = pd.DataFrame({'group': np.asarray(groups, dtype=object), 'value': np.asarray(values, dtype=np.float64)}).dropna()
+    rng = np.random.default_rng(seed)
+    summaries = {}
+    for label, group_values in frame.groupby('group', sort=False)['value']:
+        v = np.sort(group_values.to_numpy())
+        # Mesmos quartis e cercas que o plotly.js calcularia com as linhas: o quartilemethod 'linear' dele interpola
+        # na posição n * p - 0.5 (o método 'hazen' do numpy, não o 'linear'), e as cercas são o menor e o maior
+        # valor dentro de 1.5 * IQR, limitados aos quartis
+        q1, median, q3 = np.percentile(v, [25, 50, 75], method='hazen')
+        low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        inside = v[(v >= low) & (v <= high)]
+        outliers = v[(v < low) | (v > high)]
+        if len(outliers) > max_outliers:
+            outliers = rng.choice(outliers, max_outliers, replace=False)
+        summaries[label] = {
+            'q1': q1, 'median': median, 'q3': q3,
+            'lowerfence': min(q1, inside[0]), 'upperfence': max(q3, inside[-1]), 'mean': v.mean(),
+            'n': len(v), 'outliers': outliers,
+        }
+    labels = [label for label in (order if order is not None else summaries) if label in summaries]
+    stats = pd.DataFrame([summaries[label] for label in labels], index=pd.Index(labels, dtype=object))
+    return stats
+
+def box_figure(stats, title, x_title, y_title, range_y=None):
+    labels = list(stats.index)
+    fig = go.Figure()
+    fig.add_trace(go.Box(
+        x=labels, q1=stats['q1'], median=stats['median'], q3=stats['q3'],
+        lowerfence=stats['lowerfence'], upperfence=stats['upperfence'], mean=stats['mean'],
+        marker_color=BOX_COLOR, showlegend=False, hovertext=[f"n = {n:,}" for n in stats['n']],
+    ))
+    outliers = stats['outliers']
+    if outliers.map(len).sum():
+        fig.add_trace(go.Scatter(
+            x=np.repeat(labels, outliers.map(len)), y=np.concatenate(outliers.to_list()),
+            mode='markers', marker=dict(color=BOX_COLOR, size=4, opacity=0.6), name='Outliers (amostra)', showlegend=False,
+        ))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    fig.update_xaxes(type='category', categoryorder='array', categoryarray=labels)
+    if range_y is not None:
+        fig.update_yaxes(range=range_y)
+    return fig
+
+# --- TAMANHO DAS FIGURAS ENVIADAS AO NAVEGADOR ---
+
+def figure_nbytes(value):
+    # Bytes do JSON das figuras contidas em 'value' (figura, dict, lista ou tupla); 0 se não houver figuras
+    if isinstance(value, go.Figure):
+        return len(value.to_json())
+    if isinstance(value, dict):
+        return sum(figure_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(figure_nbytes(v) for v in value)
+    return 0
@@ -0,0 +1,594 @@
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: sem flock, o store fica sem proteção entre processos (um único processo por pasta de store)
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from portfolio.incremental import appended_tail, build_summary, merge_summaries, summary_quantiles, update_summary
+from portfolio.metrics import span
+from portfolio.owners import parse_owner_ranges
+from portfolio.parallel import csv_byte_ranges, process_pool
+from portfolio.search import build_search_index, index_from_tables, index_tables
+from portfolio.streaming import (
+    last_occurrences, read_arrow_files, read_csv_chunks, read_partitions, spool_chunks, write_frames,
+)
+
+# --- CAMINHOS DO DATASET E DO ARMAZENAMENTO COLUNAR ---
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# Podem ser trocados por variáveis de ambiente (ex.: para rodar a página sobre um dataset sintético nos benchmarks)
+CSV_PATH = Path(os.environ.get("PORTFOLIO_CSV_PATH", PROJECT_ROOT / "dataset" / "games.csv"))
+STORE_DIR = Path(os.environ.get("PORTFOLIO_STORE_DIR", PROJECT_ROOT / "dataset" / ".cache"))
+
+# Incrementar sempre que o pré-processamento mudar, para invalidar stores antigos
+STORE_VERSION = 7
+# Idem para a tokenização ou o formato do índice de busca
+SEARCH_VERSION = 1
+
+# Backend do parser de CSV: "c" (padrão do pandas) ou "pyarrow" (multithread, mais rápido em arquivos grandes)
+CSV_ENGINE = "c"
+
+# CSVs acima deste tamanho são processados em pedaços de STREAM_CHUNK_ROWS linhas, com memória de pico limitada
+STREAM_MIN_BYTES = 512 * 2**20
+STREAM_CHUNK_ROWS = 50_000
+
+# Número de processos da ingestão (1 = processo único); com mais de um, o CSV é dividido em partições de até
+# PARALLEL_PART_BYTES processadas em paralelo (ver build_store_parallel)
+INGEST_WORKERS = 1
+PARALLEL_PART_BYTES = 64 * 2**20
+
+# --- ESQUEMA DE INGESTÃO ---
+# Apenas estas colunas são lidas do CSV; textos longos (About the game, Screenshots, Movies...) ficam de fora.
+# Developers, Publishers e Tags são curtos e alimentam o índice de busca (ver portfolio/search.py).
+# Contagens são lidas como float32 para tolerar nulos e convertidas para int32 depois do tratamento de nulos.
+INGEST_SCHEMA = {
+    'AppID': 'int32',
+    'Name': 'str',
+    'Developers': 'str',
+    'Publishers': 'str',
+    'Release date': 'str',
+    'Estimated owners': 'category',
+    'Price': 'float32',
+    'Genres': 'str',
+    'Tags': 'str',
+    'Positive': 'float32',
+    'Negative': 'float32',
+    'Metacritic score': 'float32',
+    'Recommendations': 'float32',
+    'Achievements': 'float32',
+    'Average playtime forever': 'float32',
+}
+COUNT_COLUMNS = ['Positive', 'Negative', 'Metacritic score', 'Recommendations', 'Achievements', 'Average playtime forever']
+
+# Colunas usadas pela página de análise (as demais não são persistidas)
+ANALYTIC_COLUMNS = [
+    'AppID', 'Name', 'Developers', 'Publishers', 'Release date', 'Release Year', 'Estimated owners', 'Owners lower',
+    'Owners upper', 'Price', 'Genres', 'Tags', 'Positive', 'Negative', 'Total_Reviews', 'Positive_Percentage',
+    'Metacritic score', 'Recommendations', 'Achievements', 'Average playtime forever',
+]
+# O store guarda também o preço antes do corte de outliers, para recalcular o corte numa ingestão incremental
+STORE_COLUMNS = ANALYTIC_COLUMNS + ['Price raw']
+
+# Colunas numéricas cujo tratamento depende do dataset inteiro (mediana para nulos, quartis do preço)
+SUMMARY_COLUMNS = ['Price', 'Positive', 'Metacritic score']
+# Valores brutos guardados por AppID, inclusive das linhas descartadas depois: tudo de que as regras do dataset
+# inteiro dependem (resumos, nulos nas contagens, faixas de donos), para que a ingestão incremental as reaplique
+RAW_COLUMNS = ['AppID', 'Estimated owners'] + SUMMARY_COLUMNS + [col for col in COUNT_COLUMNS if col not in SUMMARY_COLUMNS]
+
+# --- FUNÇÕES DE FORMATAÇÃO ---
+
+def format_number(n):
+    if n >= 1e9: return f'{n/1e9:.0f}B'
+    if n >= 1e6: return f'{n/1e6:.0f}M'
+    if n >= 1e3: return f'{n/1e3:.0f}K'
+    return str(n)
+
+# --- PRÉ-PROCESSAMENTO ---
+
+def read_games_csv(csv_path=CSV_PATH, engine=None):
+    return pd.read_csv(csv_path, usecols=list(INGEST_SCHEMA), dtype=INGEST_SCHEMA, engine=engine or CSV_ENGINE)
+
+def drop_duplicate_games(df, log_messages):
+    # Um jogo por AppID, valendo a última linha do arquivo: a mesma regra da ingestão incremental, em que uma linha
+    # acrescentada substitui a anterior do mesmo jogo, e dos processamentos em pedaços (ver last_occurrences).
+    # Como só o AppID conta, o resultado não depende das colunas deixadas de fora de INGEST_SCHEMA (comparar linhas
+    # inteiras só sobre as colunas lidas juntaria linhas que diferem apenas em textos não lidos).
+    duplicated = df.duplicated(subset='AppID', keep='last')
+    _log_duplicates(log_messages, int(duplicated.sum()))
+    return df[~duplicated.to_numpy()]
+
+def raw_values(df):
+    # Faixas de donos como texto: cada pedaço tem as próprias categorias, e um arquivo Arrow aceita um só dicionário
+    return df[RAW_COLUMNS].astype({'Estimated owners': 'str'}).reset_index(drop=True)
+
+def owner_categories(owners, has_nulls):
+    # Categorias (rótulos compactos, na ordem das faixas) de um conjunto de faixas brutas do dataset inteiro
+    raw_owners = pd.Categorical([], categories=sorted(owners) + (['Desconhecido'] if has_nulls else []))
+    return list(parse_owner_ranges(pd.Series(raw_owners))['Estimated owners'].cat.categories)
+
+def summary_params(summary):
+    # Valores de preenchimento e limite de preço calculados a partir dos resumos mantidos (ver portfolio/incremental.py)
+    fill = {col: summary_quantiles(summary, col, [0.5])[0] for col in SUMMARY_COLUMNS}
+    Q1, Q3 = summary_quantiles(summary, 'Price', [0.25, 0.75], nulls_as=fill['Price'])
+    return {"fill": fill, "price_limit": Q3 + 1.5 * (Q3 - Q1)}
+
+def process_games(df, log_messages, params=None):
+    # 'params' (opcional) traz medianas e limite de preço do dataset inteiro, para processar só um lote novo de linhas
+    with span("ingest.nulls"):
+        log_messages.append("Iniciando tratamento de valores nulos para colunas indispensáveis...")
+        colunas_indispensaveis = ['Price', 'Genres', 'Positive', 'Metacritic score', 'Estimated owners']
+        for col in colunas_indispensaveis:
+            if df[col].isnull().sum() > 0:
+                if pd.api.types.is_numeric_dtype(df[col]):
+                    df[col] = df[col].fillna(params["fill"][col] if params else df[col].median())
+                elif isinstance(df[col].dtype, pd.CategoricalDtype):
+                    df[col] = df[col].cat.add_categories(['Desconhecido']).fillna('Desconhecido')
+                else:
+                    df[col] = df[col].fillna('Desconhecido')
+                log_messages.append(f"-> Valores nulos na coluna '{col}' foram tratados.")
+        # No processamento em pedaços, 'int_columns' diz quais contagens não têm nulos no dataset inteiro
+        for col in params.get("int_columns", COUNT_COLUMNS) if params else COUNT_COLUMNS:
+            if df[col].notnull().all():
+                df[col] = df[col].astype('int32')
+        log_messages.append("Tratamento de valores nulos concluído.")
+
+    with span("ingest.outliers"):
+        log_messages.append("Iniciando tratamento de outliers para a coluna 'Price'...")
+        if params:
+            limite_superior = params["price_limit"]
+        else:
+            Q1, Q3 = df['Price'].quantile(0.25), df['Price'].quantile(0.75)
+            limite_superior = Q3 + 1.5 * (Q3 - Q1)
+        outliers_count = (df['Price'] > limite_superior).sum()
+        df['Price raw'] = df['Price']
+        # Um limite float64 promoveria só os pedaços com preço cortado; o preço fica float32 em todos
+        df['Price'] = df['Price'].clip(upper=limite_superior).astype('float32')
+        log_messages.append(f"{outliers_count} outliers de preço foram ajustados para o limite superior de ${limite_superior:.2f}.")
+
+    with span("ingest.features"):
+        log_messages.append("Iniciando engenharia de features...")
+        df['Release date'] = pd.to_datetime(df['Release date'], format='%b %d, %Y', errors='coerce')
+        df['Release Year'] = df['Release date'].dt.year
+        df = df.dropna(subset=['Release Year'])
+        df['Release Year'] = df['Release Year'].astype('int16')
+        log_messages.append("-> Coluna 'Release Year' criada.")
+        df['Total_Reviews'] = df['Positive'] + df['Negative']
+        log_messages.append("-> Coluna 'Total_Reviews' criada.")
+        df['Positive_Percentage'] = np.where(df['Total_Reviews'] > 0, (df['Positive'] / df['Total_Reviews']) * 100, 0).astype('float32')
+        log_messages.append("-> Coluna 'Positive_Percentage' criada.")
+        owners = parse_owner_ranges(df['Estimated owners'])
+        df['Estimated owners'] = owners['Estimated owners']
+        df['Owners lower'], df['Owners upper'] = owners['Owners lower'], owners['Owners upper']
+        log_messages.append("-> Coluna 'Estimated owners' formatada; limites numéricos em 'Owners lower' e 'Owners upper'.")
+        log_messages.append("Engenharia de features concluída.")
+    return df
+
+# --- ARMAZENAMENTO COLUNAR PERSISTENTE ---
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _store_paths(store_dir):
+    return store_dir / "games.feather", store_dir / "games.json"
+
+def _side_paths(store_dir):
+    # Valores brutos por AppID (inclusive de linhas descartadas depois) e contagens por valor das SUMMARY_COLUMNS
+    return store_dir / "games.raw.feather", store_dir / "games.summary.feather"
+
+def _search_paths(store_dir):
+    return store_dir / "games.search.tokens.feather", store_dir / "games.search.rows.feather"
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def _write_atomic(path, write):
+    # Escreve num arquivo temporário (um por processo e thread) e troca de uma vez, para que um leitor nunca veja um
+    # arquivo pela metade
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+def _write_meta(meta_path, meta):
+    def write(tmp_path):
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file, ensure_ascii=False, indent=2)
+    _write_atomic(meta_path, write)
+
+def store_is_fresh(csv_path=CSV_PATH, store_dir=STORE_DIR):
+    # Compara a impressão digital do CSV (tamanho, mtime e, se preciso, sha256) com a gravada no store
+    data_path, meta_path = _store_paths(store_dir)
+    meta = _read_meta(meta_path)
+    if meta is None or meta.get("version") != STORE_VERSION or not data_path.exists():
+        return False, meta
+    stat = os.stat(csv_path)
+    if meta["size"] == stat.st_size and meta["mtime_ns"] == stat.st_mtime_ns:
+        return True, meta
+    if meta["size"] != stat.st_size or meta["sha256"] != file_sha256(csv_path):
+        return False, meta
+    # Apenas o mtime mudou (ex.: checkout do git): o conteúdo é o mesmo, então o store continua válido
+    meta["mtime_ns"] = stat.st_mtime_ns
+    try:
+        _write_meta(meta_path, meta)
+    except OSError:
+        pass
+    return True, meta
+
+def build_store(csv_path=CSV_PATH, store_dir=STORE_DIR, engine=None, workers=None):
+    workers = workers or INGEST_WORKERS
+    if workers > 1:
+        return build_store_parallel(csv_path, store_dir, engine, workers)
+    if os.stat(csv_path).st_size > STREAM_MIN_BYTES:
+        return build_store_streaming(csv_path, store_dir, engine)
+    log_messages = []
+    log_messages.append(f"Iniciando carregamento do arquivo '{csv_path.name}'...")
+    with span("ingest.read_csv"):
+        df = read_games_csv(csv_path, engine)
+    log_messages.append(f"Arquivo carregado com sucesso. {len(df)} linhas encontradas.")
+    with span("ingest.dedup"):
+        df = drop_duplicate_games(df, log_messages)
+    raw = raw_values(df)
+    with span("ingest.process"):
+        df = process_games(df, log_messages)
+    df = df[STORE_COLUMNS].reset_index(drop=True)
+    log_messages.append("Pré-processamento de dados finalizado com sucesso!")
+    _save_store(store_dir, df, raw, build_summary(raw[SUMMARY_COLUMNS]), _csv_meta(csv_path), log_messages)
+    return df[ANALYTIC_COLUMNS], log_messages
+
+def _save_store(store_dir, df, raw, summary, meta, log_messages):
+    # 'df' e 'raw' podem ser DataFrames ou sequências de pedaços (ver build_store_streaming)
+    data_path, meta_path = _store_paths(store_dir)
+    raw_path, summary_path = _side_paths(store_dir)
+    written = {}
+    meta["logs"] = log_messages
+    try:
+        store_dir.mkdir(parents=True, exist_ok=True)
+        # Sem compressão, para que as leituras seguintes possam mapear o arquivo em memória
+        # (nos modos em pedaços, os pedaços são processados à medida que são gravados, dentro deste span)
+        with span("ingest.write_store"):
+            _write_atomic(data_path, lambda tmp_path: written.update(rows=write_frames(tmp_path, df)))
+            _write_atomic(raw_path, lambda tmp_path: write_frames(tmp_path, raw))
+            _write_atomic(summary_path, lambda tmp_path: feather.write_feather(summary, tmp_path))
+        # O meta é escrito por último: enquanto ele não muda, o store anterior continua sendo o válido
+        meta["rows"] = written["rows"]
+        _write_meta(meta_path, meta)
+        log_messages.append(f"Dados processados salvos em '{data_path.name}'.")
+    except OSError as e:
+        log_messages.append(f"Não foi possível salvar o cache colunar: {e}")
+
+# --- PROCESSAMENTO EM PEDAÇOS (CSVs MAIORES QUE A MEMÓRIA) ---
+# Passo 1: lê o CSV em pedaços e grava cada pedaço como uma partição em disco, guardando só os AppIDs (4 bytes
+# por linha), de onde saem as máscaras da última ocorrência de cada jogo (ver last_occurrences).
+# Passo 2: relê as partições sem as linhas substituídas e acumula os resumos por valor (medianas e quartis exatos,
+# ver portfolio/incremental.py).
+# Passo 3: relê as partições, aplica process_games com os parâmetros do dataset inteiro e grava cada pedaço
+# como um record batch do store. Nenhum passo mantém o dataset inteiro em memória.
+
+def chunk_stats(chunk):
+    # O que o passo 1 precisa saber de cada pedaço; pedaços diferentes se combinam com merge_chunk_stats
+    owners = chunk['Estimated owners']
+    return {
+        "summary": build_summary(chunk[SUMMARY_COLUMNS]),
+        "owners": set(owners.dropna().unique()),
+        "owner_nulls": bool(owners.isnull().any()),
+        "count_nulls": {col: int(chunk[col].isnull().sum()) for col in COUNT_COLUMNS},
+    }
+
+def merge_chunk_stats(stats_list):
+    return {
+        "summary": merge_summaries([stats["summary"] for stats in stats_list]),
+        "owners": set().union(*(stats["owners"] for stats in stats_list)),
+        "owner_nulls": any(stats["owner_nulls"] for stats in stats_list),
+        "count_nulls": {col: sum(stats["count_nulls"][col] for stats in stats_list) for col in COUNT_COLUMNS},
+    }
+
+def chunked_params(stats, log_messages):
+    params = summary_params(stats["summary"])
+    # Colunas com nulos preenchidos pela mediana também ficam sem nulos
+    params["int_columns"] = [col for col in COUNT_COLUMNS if stats["count_nulls"][col] == 0 or col in params["fill"]]
+    # Categorias de donos do dataset inteiro, para que todos os pedaços gravem o mesmo dicionário
+    params["owner_categories"] = owner_categories(stats["owners"], stats["owner_nulls"])
+    log_messages.append("Medianas para nulos: " + ", ".join(f"'{col}' = {value:g}" for col, value in params["fill"].items()) + ".")
+    log_messages.append(f"Limite superior de preço calculado sobre o dataset inteiro: ${params['price_limit']:.2f}.")
+    return params
+
+def process_chunk(chunk, params):
+    # Devolve o pedaço processado, o número de preços cortados e o de linhas descartadas (data inválida)
+    outliers = int((chunk['Price'] > params["price_limit"]).sum())
+    out = process_games(chunk, [], params)
+    out['Estimated owners'] = out['Estimated owners'].cat.set_categories(params["owner_categories"])
+    return out[STORE_COLUMNS], outliers, len(chunk) - len(out)
+
+def _log_duplicates(log_messages, duplicates):
+    if duplicates:
+        log_messages.append(f"Encontradas {duplicates} linhas duplicadas (AppID repetido). Mantendo a última de cada jogo...")
+        log_messages.append("Duplicatas removidas.")
+    else:
+        log_messages.append("Nenhuma linha duplicada encontrada.")
+
+def _spool_dir(store_dir):
+    # Pasta de partições própria de cada montagem: outra montagem na mesma pasta de store (uma réplica, o
+    # atualizador) não apaga as partições desta no meio da escrita
+    store_dir.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(dir=store_dir, prefix="games.parts."))
+
+def _kept_partitions(parts, keeps, columns=None):
+    for chunk, keep in zip(read_partitions(parts, columns), keeps):
+        yield chunk[keep].reset_index(drop=True)
+
+def _log_processed(log_messages, outliers, dropped):
+    log_messages.append(f"{outliers} outliers de preço foram ajustados; {dropped} linhas sem data de lançamento válida descartadas.")
+    log_messages.append("Pré-processamento de dados finalizado com sucesso!")
+
+def _csv_meta(csv_path):
+    stat = os.stat(csv_path)
+    return {
+        "version": STORE_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": file_sha256(csv_path),
+    }
+
+def build_store_streaming(csv_path=CSV_PATH, store_dir=STORE_DIR, engine=None, chunk_rows=STREAM_CHUNK_ROWS):
+    log_messages = [f"Iniciando processamento em pedaços de {chunk_rows} linhas do arquivo '{csv_path.name}'..."]
+    spool_dir = _spool_dir(store_dir)
+    app_ids = []
+
+    def observe(chunks):
+        for chunk in chunks:
+            app_ids.append(chunk['AppID'].to_numpy())
+            yield chunk
+
+    try:
+        with span("ingest.stream.scan"):
+            parts = spool_chunks(observe(read_csv_chunks(csv_path, INGEST_SCHEMA, chunk_rows, engine or CSV_ENGINE)), spool_dir)
+            keeps = last_occurrences(app_ids)
+        total_rows = sum(len(keep) for keep in keeps)
+        log_messages.append(f"Arquivo lido em {len(parts)} partições. {total_rows} linhas encontradas.")
+        _log_duplicates(log_messages, total_rows - sum(int(keep.sum()) for keep in keeps))
+        accumulated = []
+        with span("ingest.stream.stats"):
+            for chunk in _kept_partitions(parts, keeps):
+                accumulated = [merge_chunk_stats(accumulated + [chunk_stats(chunk)])]
+        stats = accumulated[0]
+        params = chunked_params(stats, log_messages)
+        totals = {"outliers": 0, "dropped": 0}
+
+        def processed(chunks):
+            for chunk in chunks:
+                out, outliers, dropped = process_chunk(chunk, params)
+                totals["outliers"] += outliers
+                totals["dropped"] += dropped
+                yield out
+            _log_processed(log_messages, totals["outliers"], totals["dropped"])
+
+        _save_store(store_dir, processed(_kept_partitions(parts, keeps)), map(raw_values, _kept_partitions(parts, keeps, RAW_COLUMNS)),
+                    stats["summary"], _csv_meta(csv_path), log_messages)
+    finally:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+    return read_store(store_dir), log_messages
+
+# --- PROCESSAMENTO PARALELO (PROCESS POOL) ---
+# O CSV é dividido em faixas de bytes (sempre em fim de linha fora de aspas) e cada faixa é lida e processada
+# por um processo do pool, nas mesmas etapas do processamento em pedaços. Os processos devolvem só resumos
+# pequenos; os dados trafegam como arquivos Arrow em disco, mapeados em memória pelo processo principal e
+# copiados para o store em record batches, sem passar por pandas nem por pickle.
+
+def _scan_partition(csv_path, header, start, end, spool_path, engine):
+    with open(csv_path, "rb") as file:
+        file.seek(start)
+        body = file.read(end - start)
+    chunk = pd.read_csv(io.BytesIO(header + body), usecols=list(INGEST_SCHEMA), dtype=INGEST_SCHEMA, engine=engine)
+    feather.write_feather(chunk, spool_path)
+    return chunk['AppID'].to_numpy()
+
+def _partition_stats(spool_path, keep):
+    return chunk_stats(feather.read_feather(spool_path)[keep])
+
+def _process_partition(spool_path, keep, params, out_path, raw_out_path):
+    chunk = feather.read_feather(spool_path)[keep]
+    out, outliers, dropped = process_chunk(chunk, params)
+    write_frames(out_path, out)
+    write_frames(raw_out_path, raw_values(chunk))
+    return outliers, dropped
+
+def build_store_parallel(csv_path=CSV_PATH, store_dir=STORE_DIR, engine=None, workers=INGEST_WORKERS, part_bytes=PARALLEL_PART_BYTES):
+    header, ranges = csv_byte_ranges(csv_path, min(part_bytes, -(-os.stat(csv_path).st_size // workers)))
+    workers = max(1, min(workers, len(ranges)))
+    log_messages = [f"Iniciando processamento paralelo do arquivo '{csv_path.name}' em {len(ranges)} partições com {workers} processos..."]
+    spool_dir = _spool_dir(store_dir)
+    spools = [spool_dir / f"part-{i:05d}.feather" for i in range(len(ranges))]
+    outs = [spool_dir / f"out-{i:05d}.feather" for i in range(len(ranges))]
+    raw_outs = [spool_dir / f"raw-{i:05d}.feather" for i in range(len(ranges))]
+    try:
+        with process_pool(workers) as pool:
+            with span("ingest.parallel.scan"):
+                scans = list(pool.map(_scan_partition, *zip(*[(csv_path, header, start, end, spool, engine or CSV_ENGINE)
+                                                               for (start, end), spool in zip(ranges, spools)])))
+            # A ordem das partições é a ordem do arquivo: vale a última ocorrência de cada AppID no arquivo inteiro
+            keeps = last_occurrences(scans)
+            total_rows = sum(len(keep) for keep in keeps)
+            log_messages.append(f"Arquivo lido em {len(ranges)} partições. {total_rows} linhas encontradas.")
+            _log_duplicates(log_messages, total_rows - sum(int(keep.sum()) for keep in keeps))
+
+            with span("ingest.parallel.stats"):
+                stats = merge_chunk_stats(list(pool.map(_partition_stats, spools, keeps)))
+            params = chunked_params(stats, log_messages)
+            with span("ingest.parallel.process"):
+                results = list(pool.map(_process_partition, spools, keeps, [params] * len(spools), outs, raw_outs))
+        _log_processed(log_messages, sum(r[0] for r in results), sum(r[1] for r in results))
+        _save_store(store_dir, read_arrow_files(outs), read_arrow_files(raw_outs), stats["summary"], _csv_meta(csv_path), log_messages)
+    finally:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+    return read_store(store_dir), log_messages
+
+# --- INGESTÃO INCREMENTAL (POR AppID) ---
+
+def merge_delta(delta, store_dir, meta, log_messages):
+    # Processa apenas as linhas novas/alteradas e as mescla no store; linhas com o mesmo AppID são substituídas.
+    # Só o processamento é incremental: store, valores brutos e resumo são lidos e regravados por inteiro (E/S O(N)).
+    # Chamar com store_lock, com meta lida depois de obter o lock.
+    with span("ingest.merge_delta"):
+        return _merge_delta(delta, store_dir, meta, log_messages)
+
+def _merge_delta(delta, store_dir, meta, log_messages):
+    log_messages.append(f"Ingestão incremental: {len(delta)} linhas recebidas.")
+    delta = drop_duplicate_games(delta, log_messages)
+    raw_path, summary_path = _side_paths(store_dir)
+    raw = feather.read_feather(raw_path)
+    summary = feather.read_feather(summary_path)
+    delta_ids = delta['AppID'].unique()
+    replaced = raw['AppID'].isin(delta_ids)
+    delta_raw = raw_values(delta)
+    summary = update_summary(summary, raw.loc[replaced, SUMMARY_COLUMNS], delta_raw[SUMMARY_COLUMNS])
+    raw = pd.concat([raw[~replaced], delta_raw], ignore_index=True)
+    params = summary_params(summary)
+    # Tipos das contagens e categorias de donos saem dos valores brutos do dataset inteiro, como numa reconstrução
+    params["int_columns"] = [col for col in COUNT_COLUMNS if col in params["fill"] or raw[col].notnull().all()]
+    params["owner_categories"] = owner_categories(raw['Estimated owners'].dropna().unique(), raw['Estimated owners'].isnull().any())
+
+    with span("ingest.process"):
+        processed = process_games(delta, log_messages, params)[STORE_COLUMNS]
+    df = read_store(store_dir, STORE_COLUMNS)
+    kept = ~df['AppID'].isin(delta_ids)
+    log_messages.append(f"{int((~kept).sum())} linhas substituídas e {len(processed) - int((~kept).sum())} linhas novas.")
+    df = pd.concat([df[kept], processed], ignore_index=True)
+    df['Estimated owners'] = pd.Categorical(np.asarray(df['Estimated owners'], dtype=object), categories=params["owner_categories"], ordered=True)
+    # Uma contagem cujo último nulo foi substituído volta a int32; com um nulo novo, passa a float32 no store inteiro
+    df = df.astype({col: 'int32' if col in params["int_columns"] else 'float32' for col in COUNT_COLUMNS})
+    df['Total_Reviews'] = df['Positive'] + df['Negative']
+    # O limite de preço pode ter mudado com as linhas novas: o corte é reaplicado sobre o preço bruto, sem reprocessar nada
+    df['Price'] = df['Price raw'].clip(upper=params["price_limit"]).astype('float32')
+    log_messages.append(f"Limite superior de preço recalculado a partir dos resumos: ${params['price_limit']:.2f}.")
+    _save_store(store_dir, df, raw, summary, meta, log_messages)
+    return df[ANALYTIC_COLUMNS], log_messages
+
+def ingest_delta_csv(delta_path, store_dir=STORE_DIR, engine=None):
+    # Mescla no store um CSV (mesmo esquema de games.csv) só com jogos novos ou atualizados
+    delta = read_games_csv(delta_path, engine)
+    _, meta_path = _store_paths(store_dir)
+    with store_lock(store_dir):
+        meta = _read_meta(meta_path)
+        if meta is None or meta.get("version") != STORE_VERSION:
+            raise FileNotFoundError(f"Nenhum store processado em '{store_dir}' para receber a atualização.")
+        log_messages = list(meta.get("logs", []))
+        log_messages.append(f"Iniciando ingestão incremental de '{Path(delta_path).name}'...")
+        return merge_delta(delta, store_dir, meta, log_messages)
+
+def _try_append(csv_path, store_dir, engine):
+    # games.csv só ganhou linhas no fim: processa apenas o trecho acrescentado. Chamado com store_lock; a meta
+    # (e o deslocamento em bytes já processado) é relida aqui, para não acrescentar duas vezes o mesmo trecho
+    _, meta_path = _store_paths(store_dir)
+    meta = _read_meta(meta_path)
+    stat = os.stat(csv_path)
+    if meta is None or meta.get("version") != STORE_VERSION or stat.st_size <= meta["size"] or not all(p.exists() for p in _side_paths(store_dir)):
+        return None
+    appended = appended_tail(csv_path, meta["size"], meta["sha256"])
+    if appended is None:
+        return None
+    header, tail, sha256 = appended
+    log_messages = list(meta.get("logs", []))
+    log_messages.append(f"'{csv_path.name}' recebeu {len(tail)} bytes novos no fim do arquivo; processando apenas o trecho acrescentado...")
+    delta = read_games_csv(io.BytesIO(header + tail), engine)
+    meta.update({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256})
+    return merge_delta(delta, store_dir, meta, log_messages)
+
+def read_store(store_dir=STORE_DIR, columns=ANALYTIC_COLUMNS):
+    # split_blocks evita a consolidação em blocos do pandas: as colunas numéricas e de texto viram views sobre o
+    # arquivo mapeado (somente leitura), cujas páginas o sistema compartilha entre processos e réplicas
+    data_path, _ = _store_paths(store_dir)
+    with span("ingest.read_store"):
+        return feather.read_table(data_path, columns=columns, memory_map=True).to_pandas(split_blocks=True)
+
+@contextmanager
+def store_lock(store_dir=STORE_DIR):
+    # Lock exclusivo entre processos do mesmo host (réplicas, atualizador em segundo plano, API) para montar ou
+    # alterar o store. Se a pasta não puder ser criada, o store também não poderá ser gravado: segue sem lock.
+    try:
+        store_dir.mkdir(parents=True, exist_ok=True)
+        file = open(store_dir / ".lock", "a")
+    except OSError:
+        yield
+        return
+    with file:
+        if fcntl is not None:
+            with span("ingest.store_lock"):
+                fcntl.flock(file, fcntl.LOCK_EX)
+        yield
+
+def load_games(csv_path=CSV_PATH, store_dir=STORE_DIR, columns=None, engine=None):
+    if not csv_path.exists():
+        raise FileNotFoundError(csv_path)
+    with span("ingest.store_check"):
+        fresh, meta = store_is_fresh(csv_path, store_dir)
+    if not fresh:
+        with store_lock(store_dir):
+            # Outro processo pode ter montado o store enquanto este esperava: nesse caso só relê
+            fresh, meta = store_is_fresh(csv_path, store_dir)
+            if not fresh:
+                appended = _try_append(csv_path, store_dir, engine)
+                df, log_messages = appended if appended is not None else build_store(csv_path, store_dir, engine)
+                if not store_is_fresh(csv_path, store_dir)[0]:
+                    # O store não pôde ser gravado: segue com o frame processado em memória
+                    return (df if columns is None else df[columns]), log_messages
+    if fresh:
+        log_messages = [f"Dados carregados do cache colunar ({meta['rows']} linhas); '{csv_path.name}' não mudou desde o último processamento."]
+        log_messages += meta.get("logs", [])
+    # Sempre que possível os dados vêm do arquivo mapeado, compartilhado entre processos
+    return read_store(store_dir, columns or ANALYTIC_COLUMNS), log_messages
+
+# --- ÍNDICE DE BUSCA PERSISTIDO ---
+# O índice (ver portfolio/search.py) é derivado do arquivo do store e gravado ao lado dele, com o tamanho e o mtime
+# desse arquivo como chave: qualquer regravação do store (completa ou incremental) o invalida. Nas inicializações
+# seguintes ele é apenas mapeado em memória, sem retokenizar os textos.
+
+def _search_key(data_path, rows):
+    stat = os.stat(data_path)
+    return json.dumps([SEARCH_VERSION, stat.st_size, stat.st_mtime_ns, rows])
+
+def load_search_index(df, store_dir=STORE_DIR, persist=True):
+    # 'persist' = False quando df não veio do store (ex.: o store não pôde ser gravado): o índice fica só em memória
+    data_path, _ = _store_paths(store_dir)
+    tokens_path, rows_path = _search_paths(store_dir)
+    if not persist or not data_path.exists():
+        return build_search_index(df)
+    key = _search_key(data_path, len(df))
+    try:
+        with span("search.read_index"):
+            tokens = feather.read_table(tokens_path, memory_map=True)
+            if (tokens.schema.metadata or {}).get(b"key") == key.encode():
+                return index_from_tables(tokens, feather.read_table(rows_path, memory_map=True), len(df))
+    except (OSError, pa.ArrowInvalid):
+        pass
+    with span("search.build_index"):
+        index = build_search_index(df)
+    tokens, postings = index_tables(index)
+    try:
+        # As listas de linhas primeiro: a chave só aparece quando as duas tabelas já estão no disco
+        _write_atomic(rows_path, lambda tmp_path: write_frames(tmp_path, postings))
+        _write_atomic(tokens_path, lambda tmp_path: write_frames(tmp_path, tokens.replace_schema_metadata({"key": key})))
+    except OSError:
+        pass
+    return index
@@ -0,0 +1,125 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from portfolio.cache import LRUCache
+from portfolio.metrics import REGISTRY, span
+
+# --- EXPLORADOR PAGINADO DO DATASET ---
+# A tabela da página mostra uma página de linhas por vez: só page_size linhas (e só as colunas escolhidas) são
+# serializadas para o navegador, qualquer que seja o tamanho da seleção. A ordenação usa permutações pré-calculadas
+# por coluna (argsort do dataset inteiro, uma vez por versão dos dados e por direção, num LRU compartilhado entre
+# sessões); a ordem de uma seleção é a permutação filtrada pela máscara da seleção, O(n) e sem nova ordenação.
+# A exportação (CSV ou Parquet) percorre a seleção em pedaços de EXPORT_CHUNK_ROWS linhas e devolve os bytes de
+# cada pedaço assim que são escritos, com memória constante (ver /export em portfolio/api.py).
+
+EXPLORER_COLUMNS = ['Name', 'Developers', 'Release Year', 'Price', 'Genres', 'Total_Reviews', 'Positive_Percentage', 'Metacritic score', 'Average playtime forever']
+PAGE_SIZES = [25, 50, 100, 250]
+EXPORT_CHUNK_ROWS = 10_000
+EXPORT_FORMATS = {'csv': 'text/csv', 'parquet': 'application/vnd.apache.parquet'}
+
+SORT_CACHE = LRUCache(max_entries=64, max_bytes=64 * 2**20)
+REGISTRY.register_collector("sort_permutations", SORT_CACHE.stats)
+
+# --- ORDENAÇÃO ---
+
+def sortable_columns(df):
+    # Colunas numéricas, datas e categorias ordenadas (ex.: faixas de donos); textos são achados pela busca
+    return [column for column in df.columns
+            if pd.api.types.is_numeric_dtype(df[column]) or pd.api.types.is_datetime64_any_dtype(df[column])
+            or (isinstance(df[column].dtype, pd.CategoricalDtype) and df[column].cat.ordered)]
+
+def _sort_key(values):
+    # Chave float64 com NaN nos valores ausentes: o argsort do numpy deixa NaN no fim nas duas direções
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy().astype(np.float64)
+        return np.where(codes < 0, np.nan, codes)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return np.where(values.isna().to_numpy(), np.nan, values.to_numpy().view(np.int64).astype(np.float64))
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+def sort_permutation(df, column, descending=False, version=None):
+    # Posições de todas as linhas de df ordenadas por 'column'; com 'version', fica no LRU compartilhado
+    if column not in sortable_columns(df):
+        raise ValueError(f"Coluna não ordenável: {column!r}")
+
+    def compute():
+        with span("explorer.sort_permutation"):
+            key = _sort_key(df[column])
+            return np.argsort(-key if descending else key, kind='stable').astype(np.int32)
+
+    if version is None:
+        return compute()
+    return SORT_CACHE.get_or_compute((version, column, descending), compute)
+
+def ordered_rows(mask, permutation=None):
+    # Posições das linhas da seleção na ordem pedida (ou na ordem do dataset, sem permutação)
+    if permutation is None:
+        return np.flatnonzero(mask)
+    return permutation[np.asarray(mask)[permutation]]
+
+# --- PAGINAÇÃO ---
+
+def page_count(n_rows, page_size):
+    return max(1, -(-n_rows // page_size))
+
+def page_frame(df, positions, page, page_size, columns):
+    # Só as linhas da página pedida (1 = primeira), já na ordem de 'positions'
+    start = (page - 1) * page_size
+    return df.iloc[positions[start:start + page_size]][columns]
+
+# --- EXPORTAÇÃO EM PEDAÇOS ---
+
+class _ChunkSink(io.RawIOBase):
+    # Destino dos writers do pyarrow que guarda só o que foi escrito desde a última retirada. A posição (tell) conta
+    # o arquivo inteiro, como o writer de Parquet precisa para os offsets do rodapé.
+    def __init__(self):
+        self.parts, self.position = [], 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b"".join(self.parts)
+        self.parts.clear()
+        return data
+
+def export_chunks(df, positions, columns, fmt='csv', chunk_rows=EXPORT_CHUNK_ROWS):
+    # Gera os bytes do arquivo pedaço a pedaço: no máximo chunk_rows linhas convertidas em memória de cada vez
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportação desconhecido: {fmt!r} (use um de {', '.join(EXPORT_FORMATS)})")
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    sink, writer = _ChunkSink(), None
+    try:
+        for start in range(0, max(len(positions), 1), chunk_rows):
+            table = pa.Table.from_pandas(df.iloc[positions[start:start + chunk_rows]][columns], preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema) if fmt == 'parquet' else pa_csv.CSVWriter(sink, table.schema)
+            writer.write_table(table)
+            yield sink.drain()
+    finally:
+        if writer is not None:
+            writer.close()
+    yield sink.drain()
+
+def export_file(df, positions, columns, fmt='csv'):
+    # Para o st.download_button (que precisa do arquivo inteiro): os pedaços vão para um arquivo temporário, que só
+    # passa a ocupar disco acima de 16 MB
+    import tempfile
+    file = tempfile.SpooledTemporaryFile(max_size=16 * 2**20)
+    with span("explorer.export"):
+        for chunk in export_chunks(df, positions, columns, fmt):
+            file.write(chunk)
+    file.seek(0)
+    return file
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# --- ÍNDICE DE GÊNEROS ---
+# Construído uma única vez junto com o carregamento dos dados. Guarda o vocabulário ordenado,
+# a tabela longa (linha, gênero) e a matriz booleana de pertinência linha x gênero,
+# alinhadas às posições das linhas do DataFrame processado.
+
+@dataclass(frozen=True)
+class GenreIndex:
+    genres: list
+    rows: np.ndarray
+    codes: np.ndarray
+    membership: np.ndarray
+
+def build_genre_index(genres_col):
+    tokens = pd.Series(genres_col.to_numpy(dtype=object)).str.split(',').explode().str.strip()
+    tokens = tokens[tokens.notna() & (tokens != '')]
+    codes, vocab = pd.factorize(tokens.to_numpy(dtype=object), sort=True)
+    rows = tokens.index.to_numpy(dtype=np.int64)
+    membership = np.zeros((len(genres_col), len(vocab)), dtype=bool)
+    membership[rows, codes] = True
+    return GenreIndex(list(vocab), rows, codes.astype(np.int32), membership)
+
+def genre_mask(membership, genres, selected_genres, mode='any'):
+    # Máscara booleana das linhas de 'membership' que possuem algum ('any') ou todos ('all') os gêneros selecionados.
+    # A comparação é por token exato: selecionar "Action" não casa com outro gênero que apenas contenha o texto.
+    n_rows = membership.shape[0]
+    if not selected_genres:
+        return np.ones(n_rows, dtype=bool)
+    positions = {genre: i for i, genre in enumerate(genres)}
+    codes = [positions[g] for g in selected_genres if g in positions]
+    if mode == 'all':
+        if len(codes) < len(set(selected_genres)):
+            return np.zeros(n_rows, dtype=bool)
+        return membership[:, codes].all(axis=1)
+    if mode == 'any':
+        return membership[:, codes].any(axis=1)
+    raise ValueError(f"Modo de filtro desconhecido: {mode!r}")
+
+def filter_genres(index, selected_genres, mode='any'):
+    return genre_mask(index.membership, index.genres, selected_genres, mode)
@@ -0,0 +1,77 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# --- RESUMOS MANTIDOS PARA INGESTÃO INCREMENTAL ---
+# Para as colunas cujo tratamento depende do dataset inteiro (mediana para nulos, quartis do corte de preço)
+# o store guarda uma tabela de contagens por valor (coluna, valor, contagem; valor nulo = NaN).
+# Uma atualização apenas soma as linhas novas e subtrai as substituídas, e os quantis saem das contagens,
+# com a mesma interpolação linear do pandas, sem reler o CSV completo.
+
+def build_summary(raw):
+    parts = []
+    for col in raw.columns:
+        counts = raw[col].astype(np.float64).value_counts(dropna=False)
+        parts.append(pd.DataFrame({'column': col, 'value': counts.index.to_numpy(dtype=np.float64), 'count': counts.to_numpy(dtype=np.int64)}))
+    return pd.concat(parts, ignore_index=True)
+
+def merge_summaries(summaries):
+    # Soma as contagens por (coluna, valor); resumos de pedaços diferentes se combinam sem perda
+    combined = pd.concat(summaries, ignore_index=True)
+    combined = combined.groupby(['column', 'value'], dropna=False, sort=False)['count'].sum().reset_index()
+    return combined[combined['count'] > 0].reset_index(drop=True)
+
+def update_summary(summary, removed, added):
+    removed_summary = build_summary(removed)
+    removed_summary['count'] = -removed_summary['count']
+    return merge_summaries([summary, build_summary(added), removed_summary])
+
+def summary_quantiles(summary, column, quantiles, nulls_as=None):
+    rows = summary[summary['column'] == column]
+    known = rows[rows['value'].notna()]
+    values, counts = known['value'].to_numpy(), known['count'].to_numpy()
+    nulls = rows.loc[rows['value'].isna(), 'count'].sum()
+    if nulls_as is not None and nulls:
+        values, counts = np.append(values, nulls_as), np.append(counts, nulls)
+    order = np.argsort(values, kind='stable')
+    values, cumulative = values[order], np.cumsum(counts[order])
+    if len(values) == 0:
+        return [np.nan for _ in quantiles]
+    total = cumulative[-1]
+
+    def value_at(k):
+        return values[np.searchsorted(cumulative, k, side='right')]
+
+    result = []
+    for q in quantiles:
+        h = (total - 1) * q
+        low = int(np.floor(h))
+        high = min(low + 1, total - 1)
+        result.append(value_at(low) + (h - low) * (value_at(high) - value_at(low)))
+    return result
+
+# --- DETECÇÃO DE CSV QUE SÓ CRESCEU ---
+
+def appended_tail(csv_path, old_size, old_sha256, chunk_size=1 << 20):
+    # Se os primeiros old_size bytes do arquivo são exatamente os já processados, devolve
+    # (linha de cabeçalho, bytes acrescentados, sha256 do arquivo novo); caso contrário, None.
+    digest = hashlib.sha256()
+    with open(csv_path, "rb") as file:
+        header = file.readline()
+        file.seek(0)
+        remaining = old_size
+        last_byte = b""
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+            if not chunk:
+                return None
+            digest.update(chunk)
+            last_byte = chunk[-1:]
+            remaining -= len(chunk)
+        # O trecho novo precisa começar numa linha nova
+        if digest.hexdigest() != old_sha256 or last_byte != b"\n":
+            return None
+        tail = file.read()
+    digest.update(tail)
+    return header, tail, digest.hexdigest()
@@ -0,0 +1,82 @@
+import numpy as np
+
+# --- INFERÊNCIA A PARTIR DE ESTATÍSTICAS SUFICIENTES ---
+# Intervalos, testes, correlação e reta de mínimos quadrados calculados a partir de
+# (n, soma, soma dos quadrados, produtos cruzados), que vêm do cubo de agregados ou de uma única passada vetorizada.
+# O modo de reamostragem (bootstrap / permutação) é vetorizado em lotes para manter a memória limitada.
+# scipy.stats só é importado nas funções que usam a distribuição t: o import leva quase 1 s e a maioria das
+# execuções da página não chega à aba de inferência.
+
+def moments(values):
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    return moments_from_sums(len(values), values.sum(), np.square(values).sum())
+
+def moments_from_sums(count, total, total_sq):
+    # (n, média, variância amostral)
+    if count == 0:
+        return 0, np.nan, np.nan
+    mean = total / count
+    var = max(total_sq - count * mean ** 2, 0.0) / (count - 1) if count > 1 else np.nan
+    return int(count), mean, var
+
+def t_interval(n, mean, var, confidence):
+    if n < 2:
+        return None
+    from scipy import stats
+    return stats.t.interval(confidence=confidence, df=n - 1, loc=mean, scale=np.sqrt(var / n))
+
+def welch_test(moments_a, moments_b):
+    # Equivalente a stats.ttest_ind(a, b, equal_var=False), a partir dos momentos de cada grupo
+    from scipy import stats
+    (n_a, mean_a, var_a), (n_b, mean_b, var_b) = moments_a, moments_b
+    se_a, se_b = var_a / n_a, var_b / n_b
+    t_stat = (mean_a - mean_b) / np.sqrt(se_a + se_b)
+    df = (se_a + se_b) ** 2 / (se_a ** 2 / (n_a - 1) + se_b ** 2 / (n_b - 1))
+    return t_stat, 2 * stats.t.sf(np.abs(t_stat), df)
+
+def correlation(n, sum_x, sum_y, sum_xx, sum_yy, sum_xy):
+    cov = sum_xy - sum_x * sum_y / n
+    var_x = sum_xx - sum_x ** 2 / n
+    var_y = sum_yy - sum_y ** 2 / n
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return cov / np.sqrt(var_x * var_y)
+
+def ols_line(x, y):
+    # Reta de mínimos quadrados em forma fechada (inclinação, intercepto), sem ajustar um modelo do statsmodels
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    x_mean, y_mean = x.mean(), y.mean()
+    sxx = np.square(x - x_mean).sum()
+    slope = ((x - x_mean) * (y - y_mean)).sum() / sxx if sxx > 0 else 0.0
+    return slope, y_mean - slope * x_mean
+
+def bootstrap_mean_interval(values, confidence, n_resamples=1000, seed=0, batch_size=100):
+    # Intervalo percentil da média por bootstrap; os índices das reamostras são sorteados em lotes
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if len(values) < 2:
+        return None
+    rng = np.random.default_rng(seed)
+    means = np.empty(n_resamples)
+    for start in range(0, n_resamples, batch_size):
+        size = min(batch_size, n_resamples - start)
+        idx = rng.integers(0, len(values), size=(size, len(values)), dtype=np.int32)
+        means[start:start + size] = values[idx].mean(axis=1)
+    alpha = (1 - confidence) / 2
+    return tuple(np.quantile(means, [alpha, 1 - alpha]))
+
+def permutation_test(a, b, n_permutations=1000, seed=0, batch_size=100):
+    # Teste de permutação bicaudal para a diferença de médias entre os grupos a e b
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    pooled = np.concatenate([a, b])
+    observed = a.mean() - b.mean()
+    total, n_a, n_b = pooled.sum(), len(a), len(b)
+    rng = np.random.default_rng(seed)
+    extreme = 0
+    for start in range(0, n_permutations, batch_size):
+        size = min(batch_size, n_permutations - start)
+        shuffled = rng.permuted(np.broadcast_to(pooled, (size, len(pooled))), axis=1)
+        sum_a = shuffled[:, :n_a].sum(axis=1)
+        diffs = sum_a / n_a - (total - sum_a) / n_b
+        extreme += np.count_nonzero(np.abs(diffs) >= abs(observed) - 1e-12)
+    return observed, (extreme + 1) / (n_permutations + 1)
@@ -0,0 +1,45 @@
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# --- MEMÓRIA DO PROCESSO ---
+# No Linux lê /proc/self: 'rss' é a memória residente total, 'anon' a parte privada do processo e 'file' as páginas
+# de arquivos mapeados (o store Arrow), que o sistema compartilha entre todos os processos que mapeiam o mesmo
+# arquivo. 'pss' divide cada página compartilhada pelo número de processos que a usam, então a soma do PSS de
+# várias réplicas é o custo real delas na máquina. Em outros sistemas Unix só o pico de RSS está disponível.
+
+def _read_kb(path, fields):
+    values = {}
+    try:
+        with open(path, encoding="ascii") as file:
+            for line in file:
+                name, _, rest = line.partition(":")
+                if name in fields:
+                    values[fields[name]] = int(rest.split()[0]) * 1024
+    except OSError:
+        pass
+    return values
+
+def process_memory():
+    memory = _read_kb("/proc/self/status", {"VmRSS": "rss", "RssAnon": "anon", "RssFile": "file", "RssShmem": "shmem"})
+    memory.update(_read_kb("/proc/self/smaps_rollup", {"Pss": "pss"}))
+    if "rss" not in memory and resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        memory["peak_rss"] = peak if sys.platform == "darwin" else peak * 1024
+    memory["pid"] = os.getpid()
+    return memory
+
+def format_memory(memory):
+    mb = {key: value / 2**20 for key, value in memory.items() if key != "pid"}
+    if "rss" not in mb:
+        if "peak_rss" not in mb:
+            return f"Processo {memory['pid']}: medição de memória indisponível neste sistema."
+        return f"Processo {memory['pid']}: pico de RSS {mb['peak_rss']:.0f} MB."
+    text = f"Processo {memory['pid']}: RSS {mb['rss']:.0f} MB ({mb.get('anon', 0):.0f} MB privados, {mb.get('file', 0):.0f} MB de arquivos mapeados e compartilháveis)"
+    if "pss" in mb:
+        text += f", PSS {mb['pss']:.0f} MB"
+    return text + "."
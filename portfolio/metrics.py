@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from portfolio.memory import process_memory
+
+# --- INSTRUMENTAÇÃO: SPANS, TAMANHOS E MEDIDORES ---
+# Registro único por processo (REGISTRY), compartilhado por todas as páginas e sessões. Cada span cronometra uma
+# etapa (ingestão, filtro, agregado, figura) e acumula contagem, soma e as últimas SPAN_WINDOW durações, de onde
+# saem os percentis. Dentro de um trace (uma execução da página), os spans também são guardados em ordem, com
+# início relativo e profundidade, para montar a cascata da execução. Coletores registrados (cache, memória)
+# são lidos só no momento da exportação, em JSON ou no formato de texto do Prometheus.
+
+SPAN_WINDOW = 512
+TRACE_HISTORY = 50
+PERCENTILES = (0.5, 0.95, 0.99)
+
+class MetricsRegistry:
+    def __init__(self, window=SPAN_WINDOW, history=TRACE_HISTORY):
+        self.window = window
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._spans = {}
+        self._sizes = {}
+        self._collectors = {}
+        self._traces = deque(maxlen=history)
+
+    def observe(self, name, seconds):
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = {"count": 0, "total": 0.0, "max": 0.0, "recent": deque(maxlen=self.window)}
+            stats["count"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["recent"].append(seconds)
+
+    def record_size(self, name, nbytes):
+        with self._lock:
+            stats = self._sizes.setdefault(name, {"count": 0, "total": 0, "last": 0, "max": 0})
+            stats["count"] += 1
+            stats["total"] += nbytes
+            stats["last"] = nbytes
+            stats["max"] = max(stats["max"], nbytes)
+
+    def register_collector(self, name, collect):
+        # 'collect' devolve um dict de valores numéricos, lido a cada exportação
+        with self._lock:
+            self._collectors[name] = collect
+
+    @contextmanager
+    def span(self, name):
+        trace = getattr(self._local, "trace", None)
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._local.depth = depth
+            self.observe(name, elapsed)
+            if trace is not None:
+                trace["spans"].append({"name": name, "start": start - trace["t0"], "seconds": elapsed, "depth": depth})
+
+    @contextmanager
+    def trace(self, name):
+        # Agrupa os spans de uma execução (ex.: um rerun da página); traces aninhados ficam no trace externo
+        if getattr(self._local, "trace", None) is not None:
+            with self.span(name):
+                yield
+            return
+        trace = {"name": name, "started": time.time(), "t0": time.perf_counter(), "spans": []}
+        self._local.trace = trace
+        try:
+            with self.span(name):
+                yield
+        finally:
+            self._local.trace = None
+            trace["seconds"] = time.perf_counter() - trace.pop("t0")
+            trace["spans"].sort(key=lambda span: span["start"])
+            with self._lock:
+                self._traces.append(trace)
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._sizes.clear()
+            self._traces.clear()
+
+    def snapshot(self):
+        import numpy as np
+        with self._lock:
+            spans = {name: dict(stats, recent=list(stats["recent"])) for name, stats in self._spans.items()}
+            sizes = {name: dict(stats) for name, stats in self._sizes.items()}
+            collectors = dict(self._collectors)
+            traces = list(self._traces)
+        for stats in spans.values():
+            recent = stats.pop("recent")
+            stats["mean"] = stats["total"] / stats["count"]
+            for q in PERCENTILES:
+                stats[f"p{round(q * 100)}"] = float(np.quantile(recent, q))
+        gauges = {}
+        for name, collect in collectors.items():
+            try:
+                gauges[name] = {key: float(value) for key, value in collect().items()}
+            except Exception as e:
+                gauges[name] = {"erro": str(e)}
+        return {"timestamp": time.time(), "spans": spans, "sizes": sizes, "gauges": gauges, "traces": traces}
+
+    def to_json(self, snapshot=None):
+        return json.dumps(snapshot or self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self, snapshot=None, prefix="portfolio"):
+        snapshot = snapshot or self.snapshot()
+        lines = [
+            f"# HELP {prefix}_span_seconds Duração das etapas instrumentadas (janela das últimas {self.window} execuções para os quantis).",
+            f"# TYPE {prefix}_span_seconds summary",
+        ]
+        for name, stats in sorted(snapshot["spans"].items()):
+            label = _label(name)
+            for q in PERCENTILES:
+                lines.append(f'{prefix}_span_seconds{{span="{label}",quantile="{q}"}} {stats[f"p{round(q * 100)}"]:.6g}')
+            lines.append(f'{prefix}_span_seconds_sum{{span="{label}"}} {stats["total"]:.6g}')
+            lines.append(f'{prefix}_span_seconds_count{{span="{label}"}} {stats["count"]}')
+        lines += [f"# HELP {prefix}_payload_bytes Tamanho dos resultados gerados (figuras serializadas, seleções).",
+                  f"# TYPE {prefix}_payload_bytes summary"]
+        for name, stats in sorted(snapshot["sizes"].items()):
+            label = _label(name)
+            lines.append(f'{prefix}_payload_bytes_sum{{payload="{label}"}} {stats["total"]}')
+            lines.append(f'{prefix}_payload_bytes_count{{payload="{label}"}} {stats["count"]}')
+        lines += [f"# HELP {prefix}_gauge Medidores lidos dos coletores registrados (cache, memória).",
+                  f"# TYPE {prefix}_gauge gauge"]
+        for source, values in sorted(snapshot["gauges"].items()):
+            for key, value in sorted(values.items()):
+                if isinstance(value, float):
+                    lines.append(f'{prefix}_gauge{{source="{_label(source)}",name="{_label(key)}"}} {value:.6g}')
+        return "\n".join(lines) + "\n"
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+REGISTRY = MetricsRegistry()
+REGISTRY.register_collector("process_memory", process_memory)
+
+span = REGISTRY.span
+trace = REGISTRY.trace
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+# --- FAIXAS DE DONOS ESTIMADOS ---
+# A faixa bruta ("20,000 - 50,000") é convertida uma única vez em limites inteiros e num rótulo compacto
+# ("20K - 50K") guardado como categórico ordenado pelos limites numéricos; a ordenação nunca reinterpreta o texto.
+# Faixas que não seguem o formato "início - fim" recebem limites -1 e vão para o fim da ordem.
+
+OWNER_RANGE_PATTERN = r'^\s*(\d+)\s*-\s*(\d+)\s*$'
+
+def format_numbers(values):
+    # Versão vetorizada de format_number (1e3 -> K, 1e6 -> M, 1e9 -> B, sem casas decimais)
+    v = np.asarray(values, dtype=np.float64)
+    conditions = [v >= 1e9, v >= 1e6, v >= 1e3]
+    scaled = np.select(conditions, [v / 1e9, v / 1e6, v / 1e3], v)
+    suffixes = np.select(conditions, ['B', 'M', 'K'], '')
+    return np.char.add(np.round(scaled).astype(np.int64).astype(str), suffixes)
+
+def parse_owner_ranges(raw):
+    # Trabalha sobre os valores distintos (poucas dezenas) e espalha o resultado pelas linhas via códigos
+    if isinstance(getattr(raw, 'dtype', None), pd.CategoricalDtype):
+        # Coluna já categórica (esquema de ingestão): os códigos existentes são reaproveitados; o nulo, se houver,
+        # vira a última posição (sem nulos, 'Desconhecido' não entra nas categorias)
+        uniques = list(raw.cat.categories)
+        codes = raw.cat.codes.to_numpy()
+        if (codes < 0).any():
+            uniques.append(None)
+            codes = np.where(codes < 0, len(uniques) - 1, codes)
+    else:
+        codes, uniques = pd.factorize(pd.Series(raw, dtype=object), use_na_sentinel=False)
+    uniques = pd.Series(uniques, dtype=object).fillna('Desconhecido')
+    cleaned = uniques.str.replace(',', '', regex=False)
+    bounds = cleaned.str.extract(OWNER_RANGE_PATTERN)
+    parsed = bounds.notna().all(axis=1).to_numpy()
+    lower = np.where(parsed, pd.to_numeric(bounds[0]).fillna(-1), -1).astype(np.int64)
+    upper = np.where(parsed, pd.to_numeric(bounds[1]).fillna(-1), -1).astype(np.int64)
+    labels = np.where(parsed, np.char.add(np.char.add(format_numbers(lower), ' - '), format_numbers(upper)), cleaned.to_numpy(dtype=str))
+
+    # Ordem das categorias pelos limites numéricos; faixas não reconhecidas por último
+    order = np.lexsort((labels, upper, lower, ~parsed))
+    categories = pd.Index(pd.unique(labels[order]))
+    label_codes = categories.get_indexer(labels)
+    return pd.DataFrame({
+        'Estimated owners': pd.Categorical.from_codes(label_codes[codes], categories=categories, ordered=True),
+        'Owners lower': lower[codes],
+        'Owners upper': upper[codes],
+    }, index=getattr(raw, 'index', None))
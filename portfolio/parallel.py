@@ -0,0 +1,54 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# --- PARTIÇÃO DO CSV POR FAIXAS DE BYTES ---
+
+def csv_byte_ranges(csv_path, part_bytes, block_size=1 << 20):
+    # Divide o corpo do CSV em faixas de ~part_bytes que terminam num fim de linha fora de aspas, para que um
+    # campo com quebra de linha nunca fique dividido entre duas faixas. Devolve (linha de cabeçalho, [(início, fim)]).
+    ranges = []
+    in_quotes = False
+    with open(csv_path, "rb") as file:
+        header = file.readline()
+        start = pos = file.tell()
+        while True:
+            block = file.read(block_size)
+            if not block:
+                break
+            offset = 0
+            while True:
+                # Só procura um corte depois de atingir o tamanho alvo da faixa atual
+                search_from = max(start + part_bytes - pos, offset)
+                newline = block.find(b"\n", search_from) if search_from < len(block) else -1
+                if newline < 0:
+                    break
+                in_quotes ^= block.count(b'"', offset, newline) % 2 == 1
+                offset = newline + 1
+                if not in_quotes:
+                    ranges.append((start, pos + offset))
+                    start = pos + offset
+            in_quotes ^= block.count(b'"', offset) % 2 == 1
+            pos += len(block)
+    if pos > start:
+        ranges.append((start, pos))
+    return header, ranges
+
+# --- POOL DE PROCESSOS ---
+
+class _InlineExecutor:
+    # Mesma interface do pool, no próprio processo (usado com um único processo, ex.: linha de base do benchmark)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+def process_pool(workers):
+    if workers <= 1:
+        return _InlineExecutor()
+    # "spawn" em vez de "fork": o servidor do Streamlit tem threads, e um fork herdaria locks em estado indefinido
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
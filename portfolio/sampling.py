@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+# --- AMOSTRAGEM DETERMINÍSTICA ---
+# Cada jogo recebe uma prioridade pseudoaleatória fixa, derivada do AppID; a amostra de uma seleção
+# são as linhas de menor prioridade ("bottom-k"). Assim a mesma seleção sempre gera a mesma amostra,
+# em qualquer processo, e os pontos não "pulam" de um rerun para outro.
+
+SAMPLE_SEED = 2025
+
+def row_priorities(ids, seed=SAMPLE_SEED):
+    # splitmix64 sobre o AppID, normalizado para [0, 1)
+    x = np.asarray(ids, dtype=np.uint64) + np.uint64((seed * 0x9E3779B97F4A7C15) % 2**64)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    x = x ^ (x >> np.uint64(31))
+    return (x >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+def sample_positions(priorities, size, strata=None):
+    # Posições (ordenadas) das linhas amostradas; com 'strata', cada estrato recebe uma cota proporcional ao seu tamanho
+    n = len(priorities)
+    if size >= n:
+        return np.arange(n)
+    if strata is None:
+        return np.sort(np.argpartition(priorities, size)[:size])
+    codes, _ = pd.factorize(np.asarray(strata, dtype=object), use_na_sentinel=False)
+    counts = np.bincount(codes)
+    quotas = np.minimum(counts, np.maximum(1, np.floor(counts * size / n))).astype(np.int64)
+    order = np.lexsort((priorities, codes))
+    sorted_codes = codes[order]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.arange(n) - starts[sorted_codes]
+    return np.sort(order[rank < quotas[sorted_codes]])
+
+def sample_games(df, size, stratify_by=None):
+    strata = df[stratify_by] if stratify_by else None
+    return df.iloc[sample_positions(row_priorities(df['AppID']), size, strata)]
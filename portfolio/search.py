@@ -0,0 +1,157 @@
+import re
+import unicodedata
+from dataclasses import dataclass
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# --- ÍNDICE DE BUSCA ---
+# Índice invertido (token -> linhas) sobre Name, Developers, Publishers e Tags, alinhado às posições das linhas do
+# DataFrame processado. Os textos são normalizados (minúsculas, sem acentos) e quebrados em letras/dígitos, tudo em
+# pyarrow.compute, sem laço em Python por linha. As listas de linhas ficam num único vetor (formato CSR): o token i
+# ocupa rows[offsets[i]:offsets[i + 1]], em ordem crescente de linha, com a máscara dos campos onde aparece.
+# O vocabulário é ordenado: todos os tokens com um prefixo formam um intervalo contíguo, achado por busca binária,
+# que faz o papel da árvore de prefixos no autocompletar sem um nó por caractere na memória ou no disco.
+# O índice é persistido ao lado do store (ver load_search_index em portfolio/data.py).
+
+# Bit de cada campo na máscara; o valor do bit é também o peso do campo na ordenação dos resultados
+SEARCH_FIELDS = {'Name': 8, 'Developers': 4, 'Publishers': 2, 'Tags': 1}
+ALL_FIELDS = sum(SEARCH_FIELDS.values())
+
+# Letras e dígitos Unicode; o mesmo critério nas duas formas: RE2 (pyarrow) para os dados e re para as consultas
+TOKEN_SEPARATOR = r"[^\p{L}\p{N}]+"
+QUERY_TOKEN = re.compile(r"[^\W_]+")
+
+@dataclass(frozen=True)
+class SearchIndex:
+    tokens: np.ndarray
+    offsets: np.ndarray
+    rows: np.ndarray
+    fields: np.ndarray
+    n_rows: int
+
+def _tokenize(values):
+    # (tokens, posição de origem de cada token) de um array de textos; nulos e vazios não geram tokens
+    normalized = pc.replace_substring_regex(pc.utf8_normalize(pc.utf8_lower(values), "NFKD"), r"\p{Mn}+", "")
+    lists = pc.split_pattern_regex(normalized, TOKEN_SEPARATOR)
+    tokens, parents = pc.list_flatten(lists), pc.list_parent_indices(lists)
+    keep = pc.not_equal(tokens, "")
+    return pc.filter(tokens, keep).cast(pa.large_string()), pc.filter(parents, keep).to_numpy()
+
+def tokenize(text):
+    # A mesma normalização de _tokenize, em Python puro: compilar a regex no pyarrow custa ~4 ms por chamada
+    normalized = unicodedata.normalize("NFKD", text.lower())
+    return QUERY_TOKEN.findall("".join(c for c in normalized if unicodedata.category(c) != "Mn"))
+
+def build_search_index(df):
+    n_rows = len(df)
+    tokens, rows, bits = [], [], []
+    for field, bit in SEARCH_FIELDS.items():
+        values = pa.array(df[field], type=pa.large_string())
+        # Depois de uma ingestão incremental o store tem vários record batches; os índices de origem precisam ser
+        # contados sobre um array contínuo
+        values = values.combine_chunks() if isinstance(values, pa.ChunkedArray) else values
+        field_tokens, field_rows = _tokenize(values)
+        tokens.append(field_tokens)
+        rows.append(field_rows.astype(np.int64))
+        bits.append(np.full(len(field_rows), bit, dtype=np.uint8))
+    encoded = pc.dictionary_encode(pa.concat_arrays(tokens))
+    vocab, codes = encoded.dictionary, encoded.indices.to_numpy()
+    # Renumera os tokens na ordem do vocabulário ordenado
+    order = pc.sort_indices(vocab).to_numpy()
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    # Um par (token, linha) por ocorrência; ocorrências repetidas (ex.: o mesmo token no nome e nas tags) viram um
+    # único par, com a máscara dos campos combinada
+    keys = rank[codes].astype(np.int64) * max(n_rows, 1) + np.concatenate(rows)
+    by_key = np.argsort(keys, kind='stable')
+    keys = keys[by_key]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.zeros(0, dtype=np.int64)
+    fields = np.bitwise_or.reduceat(np.concatenate(bits)[by_key], starts) if len(starts) else np.zeros(0, dtype=np.uint8)
+    keys = keys[starts]
+    token_ids, posting_rows = keys // max(n_rows, 1), (keys % max(n_rows, 1)).astype(np.int32)
+    offsets = np.searchsorted(token_ids, np.arange(len(order) + 1)).astype(np.int64)
+    return SearchIndex(vocab.take(order).to_numpy(zero_copy_only=False), offsets, posting_rows, fields.astype(np.uint8), n_rows)
+
+# --- CONSULTAS ---
+
+def _token_range(index, term, prefix):
+    lo = int(np.searchsorted(index.tokens, term, side='left'))
+    if prefix:
+        return lo, int(np.searchsorted(index.tokens, term + "\U0010ffff", side='left'))
+    return lo, lo + 1 if lo < len(index.tokens) and index.tokens[lo] == term else lo
+
+def _postings(index, lo, hi, field_mask):
+    # Linhas (ordenadas, sem repetição) dos tokens no intervalo [lo, hi) e a máscara de campos de cada uma
+    rows = index.rows[index.offsets[lo]:index.offsets[hi]]
+    fields = index.fields[index.offsets[lo]:index.offsets[hi]] & field_mask
+    if hi - lo > 1:
+        # União das listas de vários tokens num vetor denso por linha (um bit por campo), sem ordenar
+        merged = np.zeros(index.n_rows, dtype=np.uint8)
+        for bit in SEARCH_FIELDS.values():
+            merged[rows[(fields & bit) > 0]] |= bit
+        rows = np.flatnonzero(merged).astype(np.int32)
+        fields = merged[rows]
+    found = fields > 0
+    return rows[found], fields[found]
+
+def search(index, text, fields=None, limit=None, popularity=None, within=None):
+    # (posições das linhas com todos os termos, da mais para a menos relevante; total de linhas encontradas).
+    # Os termos completos casam por token exato e o último, enquanto está sendo digitado (sem espaço depois), por
+    # prefixo. A relevância soma o peso dos campos onde cada termo aparece; 'popularity' (ex.: total de avaliações)
+    # desempata. 'within' (máscara booleana por linha) restringe a busca, por exemplo, à seleção dos filtros.
+    terms = tokenize(text)
+    if not terms:
+        return np.zeros(0, dtype=np.int32), 0
+    field_mask = sum(SEARCH_FIELDS[field] for field in fields) if fields else ALL_FIELDS
+    typing = not text[-1:].isspace()
+    rows = scores = None
+    for i, term in enumerate(terms):
+        term_rows, term_fields = _postings(index, *_token_range(index, term, typing and i == len(terms) - 1), field_mask)
+        term_scores = term_fields.astype(np.int64)
+        if rows is None:
+            rows, scores = term_rows, term_scores
+        else:
+            rows, left, right = np.intersect1d(rows, term_rows, assume_unique=True, return_indices=True)
+            scores = scores[left] + term_scores[right]
+        if not len(rows):
+            break
+    if within is not None:
+        keep = np.asarray(within)[rows]
+        rows, scores = rows[keep], scores[keep]
+    total = len(rows)
+    if popularity is not None:
+        boost = np.nan_to_num(np.asarray(popularity)[rows]).astype(np.int64)
+        scores = scores * (int(boost.max()) + 1) + boost if len(boost) else scores
+    if limit is not None and len(rows) > limit:
+        # Só os 'limit' primeiros precisam ficar em ordem
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        rows, scores = rows[top], scores[top]
+    order = np.argsort(-scores, kind='stable')
+    return rows[order], total
+
+def complete(index, text, n=8):
+    # Tokens do vocabulário que completam o último termo digitado, dos mais para os menos frequentes
+    terms = tokenize(text)
+    if not terms or text[-1:].isspace():
+        return []
+    lo, hi = _token_range(index, terms[-1], prefix=True)
+    counts = np.diff(index.offsets[lo:hi + 1])
+    top = np.argsort(-counts, kind='stable')[:n]
+    return [(index.tokens[lo + i], int(counts[i])) for i in top]
+
+# --- PERSISTÊNCIA ---
+# Duas tabelas Arrow: o vocabulário com os offsets e as listas de linhas com as máscaras de campo
+
+def index_tables(index):
+    tokens = pa.table({'token': pa.array(index.tokens, type=pa.large_string()), 'offset': index.offsets[:-1]})
+    postings = pa.table({'row': index.rows, 'fields': index.fields})
+    return tokens, postings
+
+def index_from_tables(tokens, postings, n_rows):
+    # As listas de linhas são views sobre o arquivo mapeado; só o vocabulário é convertido em objetos Python
+    rows = postings.column('row').combine_chunks().to_numpy()
+    fields = postings.column('fields').combine_chunks().to_numpy()
+    offsets = np.append(tokens.column('offset').to_numpy(), len(rows)).astype(np.int64)
+    return SearchIndex(tokens.column('token').to_numpy(), offsets, rows, fields, n_rows)
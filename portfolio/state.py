@@ -0,0 +1,141 @@
+import dataclasses
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from portfolio.metrics import REGISTRY, span
+
+# --- ESTADO DA PÁGINA DE ANÁLISE COMPARTILHADO NO PROCESSO ---
+# DataFrame mapeado do store, logs, índice de gêneros, cubo de agregados e índice de busca, montados uma vez por
+# processo e servidos a todas as sessões. Tanto a página quanto o aquecimento em segundo plano (portfolio/warmup.py) passam por aqui;
+# o lock faz quem chega durante a montagem esperar e reaproveitar o resultado em vez de repetir o trabalho.
+# As dependências pesadas (pandas, pyarrow) só são importadas na primeira montagem.
+
+# --- ATUALIZAÇÃO EM SEGUNDO PLANO ---
+# Uma thread observa o CSV (um stat a cada REFRESH_SECONDS). Quando ele muda e para de mudar (duas leituras
+# iguais seguidas, para não pegar uma cópia pela metade), a nova versão é montada fora das requisições: store
+# incremental ou completo (ver load_games), índice e cubo. Só então a referência servida é trocada, numa única
+# atribuição, com o número de versão incrementado. Até a troca, as sessões seguem com a versão anterior, cujo
+# arquivo mapeado continua válido mesmo depois de substituído no disco. PORTFOLIO_REFRESH_SECONDS=0 desliga a
+# observação (request_refresh continua disponível).
+# Cada processo (réplica da página, API) tem o seu atualizador, mas todos usam o mesmo STORE_DIR: load_games monta
+# o store sob um lock de arquivo (store_lock em portfolio/data.py), e quem chega depois só relê o store já montado.
+
+REFRESH_SECONDS = float(os.environ.get("PORTFOLIO_REFRESH_SECONDS", "30"))
+
+@dataclass(frozen=True)
+class AnalysisState:
+    version: int
+    df: object
+    logs: list
+    genre_index: object
+    cube: object
+    search: object
+    csv_stat: tuple
+    csv_sha256: str
+    built_at: float
+
+_lock = threading.Lock()
+_current = None
+_refresher = None
+_wakeup = threading.Event()
+_status = {"version": 0, "builds": 0, "skipped": 0, "errors": 0, "last_build_seconds": 0.0, "built_at": 0.0, "checked_at": 0.0}
+
+def _csv_stat():
+    from portfolio.data import CSV_PATH
+    try:
+        stat = os.stat(CSV_PATH)
+    except FileNotFoundError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+def _build(version):
+    from portfolio.aggregates import build_cube
+    from portfolio.data import load_games, load_search_index, store_is_fresh
+    from portfolio.genres import build_genre_index
+    start = time.perf_counter()
+    csv_stat = _csv_stat()
+    with span("page.load_games"):
+        df, logs = load_games()
+    with span("page.genre_index"):
+        genre_index = build_genre_index(df['Genres'])
+    with span("page.cube"):
+        cube = build_cube(df, genre_index)
+    fresh, meta = store_is_fresh()
+    with span("page.search_index"):
+        search = load_search_index(df, persist=fresh)
+    state = AnalysisState(version, df, logs, genre_index, cube, search, csv_stat, meta["sha256"] if fresh else None, time.time())
+    _status.update(version=version, builds=_status["builds"] + 1, last_build_seconds=time.perf_counter() - start, built_at=state.built_at)
+    return state
+
+def analysis_data():
+    global _current
+    state = _current
+    if state is not None:
+        return state
+    with _lock:
+        if _current is None:
+            _current = _build(1)
+            start_refresher()
+        return _current
+
+def refresh():
+    # Monta e publica uma nova versão se o CSV mudou; devolve True quando houve troca
+    global _current
+    with _lock:
+        state = _current
+        stat = _csv_stat()
+        _status["checked_at"] = time.time()
+        if state is None or stat is None or stat == state.csv_stat:
+            return False
+        from portfolio.data import store_is_fresh
+        fresh, meta = store_is_fresh()
+        if fresh and state.csv_sha256 is not None and meta["sha256"] == state.csv_sha256:
+            # Só o mtime mudou (ex.: checkout do git): mesmo conteúdo, nada a remontar
+            _current = dataclasses.replace(state, csv_stat=stat)
+            _status["skipped"] += 1
+            return False
+        with span("refresh.build"):
+            _current = _build(state.version + 1)
+        return True
+
+def _refresh_safely():
+    # Uma falha na remontagem (ex.: CSV malformado) mantém a versão atual no ar
+    try:
+        refresh()
+    except Exception:
+        _status["errors"] += 1
+
+def _refresh_loop(interval):
+    pending = None
+    while True:
+        forced = _wakeup.wait(interval)
+        _wakeup.clear()
+        state, stat = _current, _csv_stat()
+        if state is None or stat is None or stat == state.csv_stat:
+            pending = None
+            continue
+        if not forced and stat != pending:
+            # O arquivo ainda pode estar sendo escrito: espera uma leitura igual na próxima volta
+            pending = stat
+            continue
+        pending = None
+        _refresh_safely()
+
+def start_refresher(interval=REFRESH_SECONDS):
+    global _refresher
+    if interval <= 0 or _refresher is not None:
+        return _refresher
+    _refresher = threading.Thread(target=_refresh_loop, args=(interval,), name="portfolio-refresh", daemon=True)
+    _refresher.start()
+    return _refresher
+
+def request_refresh():
+    # Verifica o CSV agora, sem esperar o intervalo (e sem a espera pela estabilização do arquivo)
+    if _refresher is not None:
+        _wakeup.set()
+    else:
+        threading.Thread(target=_refresh_safely, name="portfolio-refresh-once", daemon=True).start()
+
+REGISTRY.register_collector("analysis_state", lambda: dict(_status))
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# --- ESTÁGIOS DO PIPELINE EM PEDAÇOS ---
+# Cada estágio é um gerador que recebe e devolve DataFrames de tamanho limitado, de modo que a memória
+# de pico depende do tamanho do pedaço e não do tamanho do CSV. A orquestração fica em portfolio/data.py.
+
+def read_csv_chunks(csv_path, schema, chunk_rows, engine="c"):
+    # O parser "pyarrow" do pandas não lê em pedaços; nesse caso usa o parser C
+    engine = "c" if engine == "pyarrow" else engine
+    yield from pd.read_csv(csv_path, usecols=list(schema), dtype=schema, engine=engine, chunksize=chunk_rows)
+
+class KeySet:
+    # Conjunto de chaves inteiras (AppIDs) guardado em arrays numpy ordenados (8 bytes por chave, contra ~70 de um
+    # set do Python). Os arrays formam níveis de tamanho decrescente que se fundem ao crescer, então uma consulta
+    # faz no máximo log2(n) buscas binárias.
+
+    def __init__(self):
+        self.levels = []
+
+    def __len__(self):
+        return sum(len(level) for level in self.levels)
+
+    def contains(self, keys):
+        found = np.zeros(len(keys), dtype=bool)
+        for level in self.levels:
+            positions = np.minimum(np.searchsorted(level, keys), len(level) - 1)
+            found = found | (level[positions] == keys)
+        return found
+
+    def add(self, keys):
+        # Um pedaço só de repetidas não cria nível: um nível vazio quebraria a busca binária de contains
+        if not len(keys):
+            return
+        merged = np.unique(keys)
+        while self.levels and len(self.levels[-1]) <= len(merged):
+            merged = np.union1d(self.levels.pop(), merged)
+        self.levels.append(merged)
+
+def last_occurrences(keys_per_chunk):
+    # Máscara, por pedaço, das linhas que são a última ocorrência da sua chave no arquivo inteiro (a mesma regra de
+    # drop_duplicate_games). Percorre os pedaços do fim para o começo: a primeira ocorrência vista é a que fica.
+    seen, keeps = KeySet(), []
+    for keys in reversed(keys_per_chunk):
+        keys = np.asarray(keys, dtype=np.int64)
+        keep = ~pd.Series(keys).duplicated(keep='last').to_numpy() & ~seen.contains(keys)
+        seen.add(keys[keep])
+        keeps.append(keep)
+    return keeps[::-1]
+
+# --- PARTIÇÕES EM DISCO ---
+
+def spool_chunks(chunks, spool_dir):
+    # Grava cada pedaço como uma partição Feather e devolve os caminhos, na ordem
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for chunk in chunks:
+        path = spool_dir / f"part-{len(paths):05d}.feather"
+        feather.write_feather(chunk.reset_index(drop=True), path)
+        paths.append(path)
+    return paths
+
+def read_partitions(paths, columns=None):
+    for path in paths:
+        yield feather.read_feather(path, columns=columns)
+
+def read_arrow_files(paths):
+    # Tabelas Arrow mapeadas em memória: os buffers apontam para o arquivo, sem cópia nem conversão para pandas
+    for path in paths:
+        with pa.memory_map(str(path)) as source:
+            yield pa.ipc.open_file(source).read_all()
+
+def write_frames(path, frames):
+    # Grava um DataFrame ou tabela Arrow, ou uma sequência deles, como record batches de um único arquivo
+    # Arrow/Feather sem compressão
+    if isinstance(frames, (pd.DataFrame, pa.Table)):
+        frames = [frames]
+    writer = empty = None
+    rows = 0
+    try:
+        for frame in frames:
+            table = frame if isinstance(frame, pa.Table) else pa.Table.from_pandas(frame, preserve_index=False)
+            if not table.num_rows:
+                # Pedaços vazios (ex.: uma partição só com jogos substituídos mais adiante) ficam de fora: sem linhas,
+                # o pandas não preserva alguns tipos (datas, float32) e o esquema não bateria com o dos outros
+                empty = table if empty is None else empty
+                continue
+            if writer is None:
+                writer = pa.ipc.new_file(path, table.schema)
+            writer.write_table(table)
+            rows += table.num_rows
+        if writer is None and empty is not None:
+            writer = pa.ipc.new_file(path, empty.schema)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
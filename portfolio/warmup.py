@@ -0,0 +1,69 @@
+import importlib
+import os
+import threading
+import time
+
+from portfolio.metrics import REGISTRY, span
+
+# --- AQUECIMENTO EM SEGUNDO PLANO ---
+# O Streamlit só executa um script quando a primeira sessão se conecta; nesse momento cada página chama
+# start_warmup(), que (uma vez por processo) dispara uma thread daemon para preparar o que as outras páginas vão
+# usar: as imagens já codificadas, os módulos pesados adiados (plotly.express, scipy.stats) e o estado da página de
+# análise (store mapeado, índice de gêneros e cubo, ver portfolio/state.py). A sessão que disparou o aquecimento
+# não espera por ele. PORTFOLIO_WARMUP=0 desliga; "python -m portfolio.warmup" roda as mesmas etapas em primeiro
+# plano, por exemplo no deploy, para construir o store antes de subir o servidor.
+
+WARMUP_ENABLED = os.environ.get("PORTFOLIO_WARMUP", "1") != "0"
+
+# (arquivo, largura em px) usados pelas páginas
+WARMUP_IMAGES = [("logo.png", 30), ("logo.png", 100), ("pfp.jpg", 320), ("steam_logo.png", 560)]
+WARMUP_MODULES = ["pandas", "pyarrow.feather", "plotly.graph_objects", "plotly.express", "scipy.stats"]
+
+_lock = threading.Lock()
+_thread = None
+_status = {"started": 0.0, "finished": 0.0, "seconds": 0.0, "errors": 0}
+
+def _warm_assets():
+    from portfolio.assets import image_data_uri, page_icon
+    page_icon()
+    for name, width in WARMUP_IMAGES:
+        image_data_uri(name, width)
+
+def _warm_modules():
+    for module in WARMUP_MODULES:
+        importlib.import_module(module)
+
+def _warm_analysis():
+    from portfolio.state import analysis_data
+    analysis_data()
+
+WARMUP_STEPS = [("assets", _warm_assets), ("imports", _warm_modules), ("analysis", _warm_analysis)]
+
+def warm_up():
+    # Cada etapa é independente: uma falha (ex.: CSV ausente) é contada e não impede as demais
+    _status["started"] = time.time()
+    start = time.perf_counter()
+    for name, step in WARMUP_STEPS:
+        try:
+            with span(f"warmup.{name}"):
+                step()
+        except Exception:
+            _status["errors"] += 1
+    _status["seconds"] = time.perf_counter() - start
+    _status["finished"] = time.time()
+
+def start_warmup():
+    global _thread
+    if not WARMUP_ENABLED:
+        return None
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=warm_up, name="portfolio-warmup", daemon=True)
+            _thread.start()
+        return _thread
+
+REGISTRY.register_collector("warmup", lambda: dict(_status))
+
+if __name__ == "__main__":
+    warm_up()
+    print(f"Aquecimento concluído em {_status['seconds']:.1f} s ({_status['errors']} etapa(s) com erro).")
@@ -0,0 +1,44 @@
+import itertools
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Permite rodar "pytest" a partir da raiz do projeto sem instalar o pacote
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+# Sem aquecimento em segundo plano: os testes das páginas não devem disputar o dataset com ele
+os.environ["PORTFOLIO_WARMUP"] = "0"
+
+from benchmarks.synthetic import INGEST_COLUMNS, generate_chunk
+
+def games_frame(rows, seed=0, first_id=0):
+    # Jogos sintéticos com as colunas lidas pela ingestão, sem as duplicatas que o gerador acrescenta no fim
+    table, _ = generate_chunk(np.random.default_rng(seed), first_id, rows, INGEST_COLUMNS)
+    return table.to_pandas().drop_duplicates(ignore_index=True).iloc[:rows]
+
+def write_csv(path, *frames):
+    pd.concat(frames, ignore_index=True).to_csv(path, index=False)
+    return path
+
+@pytest.fixture
+def games():
+    return games_frame(300)
+
+# Uma versão por estado montado: os caches de consultas são indexados pela versão dos dados
+_versions = itertools.count(1_000_000)
+
+@pytest.fixture
+def state(games, tmp_path):
+    # Estado da página montado como em portfolio/state.py, sobre um store próprio do teste
+    from portfolio.aggregates import build_cube
+    from portfolio.data import load_games
+    from portfolio.genres import build_genre_index
+    from portfolio.search import build_search_index
+    from portfolio.state import AnalysisState
+    df, logs = load_games(write_csv(tmp_path / "games.csv", games), tmp_path / "store")
+    genre_index = build_genre_index(df['Genres'])
+    return AnalysisState(next(_versions), df, logs, genre_index, build_cube(df, genre_index), build_search_index(df), None, None, 0.0)
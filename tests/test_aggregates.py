@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio.aggregates import PRICE_BINS, PRICE_LABELS, genre_stats, grouped_stats, price_bin_codes
+from portfolio.analytics import cell_mask, row_mask
+
+def reference_stats(frame, by, metric):
+    # Mesma estatística calculada linha a linha pelo pandas, sobre o frame filtrado (em float64, como o cubo)
+    return frame[metric].astype('float64').groupby(frame[by], observed=False).agg(['count', 'mean', 'var'])
+
+def assert_same_stats(cube_stats, expected):
+    cube_stats = cube_stats.loc[cube_stats['count'] > 0]
+    expected = expected.loc[expected['count'] > 0]
+    assert list(cube_stats.index) == list(expected.index)
+    np.testing.assert_array_equal(cube_stats['count'].to_numpy(), expected['count'].to_numpy())
+    np.testing.assert_allclose(cube_stats['mean'].to_numpy(), expected['mean'].to_numpy(), rtol=1e-9)
+    np.testing.assert_allclose(cube_stats['var'].to_numpy(), expected['var'].to_numpy(), rtol=1e-6, atol=1e-6)
+
+def selection(state, genres, mode, years):
+    key = (tuple(genres), mode, years)
+    return state.df[row_mask(state.df, state.genre_index, key)], cell_mask(state.cube, key)
+
+KEYS = [((), 'any', (1990, 2030)), (('Action',), 'any', (2010, 2020)), (('Action', 'Indie'), 'all', (1990, 2030)),
+        (('RPG', 'Strategy'), 'any', (2015, 2018))]
+
+def test_price_bins_are_closed_on_the_left():
+    prices = pd.Series([0, 0.01, 0.5, 4.99, 5, 9.99, 10, 15, 19.99, 20, 60, np.nan, -1], dtype='float32')
+    assert price_bin_codes(prices).tolist() == [0, 1, 1, 1, 2, 2, 3, 4, 4, 5, 5, -1, -1]
+    # Em float64 (o preço original) as faixas coincidem com as do pd.cut
+    exact = pd.Series([0, 0.01, 4.99, 5, 10, 20, 60])
+    reference = pd.cut(exact, bins=PRICE_BINS, labels=False, right=False).tolist()
+    assert price_bin_codes(exact).tolist() == reference
+
+@pytest.mark.parametrize("genres, mode, years", KEYS)
+@pytest.mark.parametrize("metric", ['Price', 'Total_Reviews', 'Metacritic score'])
+def test_grouped_stats_match_pandas(state, genres, mode, years, metric):
+    frame, cells = selection(state, genres, mode, years)
+    assert len(frame) > 0
+    bins = pd.Categorical.from_codes(price_bin_codes(frame['Price']), categories=PRICE_LABELS)
+    # As faixas do cubo equivalem ao pd.cut sobre o preço em centavos
+    cents = pd.cut(frame['Price'].astype('float64').round(2), bins=PRICE_BINS, labels=PRICE_LABELS, right=False)
+    assert (np.asarray(bins) == np.asarray(cents)).all()
+    frame = frame.assign(Price_Bins=bins)
+    for by in ('Release Year', 'Price_Bins', 'Estimated owners'):
+        assert_same_stats(grouped_stats(state.cube, cells, by, metric), reference_stats(frame, by, metric))
+
+@pytest.mark.parametrize("genres, mode, years", KEYS)
+def test_genre_stats_match_pandas(state, genres, mode, years):
+    frame, cells = selection(state, genres, mode, years)
+    exploded = frame.assign(Genres=frame['Genres'].str.split(',')).explode('Genres')
+    exploded['Genres'] = exploded['Genres'].str.strip()
+    expected = reference_stats(exploded, 'Genres', 'Average playtime forever')
+    assert_same_stats(genre_stats(state.cube, cells, 'Average playtime forever'), expected.sort_index())
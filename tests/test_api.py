@@ -0,0 +1,91 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+import portfolio.api as api
+
+@pytest.fixture
+def server():
+    server = api.serve(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def request(url, body=None):
+    data = body if body is None or isinstance(body, bytes) else json.dumps(body).encode()
+    try:
+        with urllib.request.urlopen(url, data=data) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+@pytest.mark.parametrize("body", [[1], ["x"], [{"query": {}}, None], {"query": {}}, b"[{", b"\xff"])
+def test_batch_rejects_bodies_that_are_not_lists_of_objects(server, body):
+    status, payload = request(server + "/batch", body)
+    assert status == 400 and "error" in payload
+
+def test_batch_reports_invalid_items_individually(server, monkeypatch):
+    monkeypatch.setattr(api, "run_query", lambda params: {"params": params})
+    status, payload = request(server + "/batch", [{"query": {"metric": "Price"}}, {"query": 5}, {"report": ["x"]}, {}])
+    assert status == 200
+    assert payload[0] == {"params": {"metric": "Price"}} and payload[3] == {"params": {}}
+    assert "error" in payload[1] and "error" in payload[2]
+
+def test_unexpected_errors_become_json_500(server, monkeypatch, capsys):
+    def broken():
+        raise RuntimeError("falhou")
+    monkeypatch.setattr(api, "analysis_data", broken)
+    for path in ("/health", "/catalog", "/query", "/rows", "/export"):
+        status, payload = request(server + path)
+        assert status == 500 and payload == {"error": "Erro interno: RuntimeError"}
+    monkeypatch.setattr(api, "run_query", lambda params: broken())
+    assert request(server + "/batch", [{"query": {}}])[0] == 500
+
+def test_missing_dataset_is_503_on_every_route(server, monkeypatch):
+    def missing():
+        raise FileNotFoundError("games.csv")
+    monkeypatch.setattr(api, "analysis_data", missing)
+    for path in ("/health", "/search?q=a", "/report/price_by_year"):
+        assert request(server + path)[0] == 503
+
+def test_metrics_and_unknown_routes(server):
+    with urllib.request.urlopen(server + "/metrics") as response:
+        assert response.status == 200 and response.headers["Content-Type"].startswith("text/plain")
+    assert request(server + "/nope")[0] == 404
+    assert request(server + "/nope", [])[0] == 404
+
+@pytest.mark.parametrize("path", ["/report/price_by_year?state=x", "/report/price_by_year?name=x", "/report/price_by_year?n=3",
+                                  "/report/reviews_by_price_bin?window=3", "/report/nope"])
+def test_report_rejects_parameters_it_does_not_take(server, monkeypatch, state, path):
+    monkeypatch.setattr(api, "analysis_data", lambda: state)
+    status, payload = request(server + path)
+    assert status == 400 and "error" in payload
+
+def test_report_accepts_filters_and_its_own_parameters(server, monkeypatch, state):
+    monkeypatch.setattr(api, "analysis_data", lambda: state)
+    status, payload = request(server + "/report/price_by_year?genres=Action&years=2010-2020&window=5")
+    assert status == 200 and payload["report"] == "price_by_year"
+
+def test_batch_accepts_list_values(server, monkeypatch, state):
+    monkeypatch.setattr(api, "analysis_data", lambda: state)
+    genres = sorted(state.cube.genres)[:2]
+    listed = [{"query": {"genres": genres, "years": [2010, 2020], "group_by": "Genres"}},
+              {"report": "price_by_year", "genres": genres, "genre_mode": "all", "window": 5}]
+    joined = [{"query": {"genres": ",".join(genres), "years": "2010-2020", "group_by": "Genres"}},
+              {"report": "price_by_year", "genres": ",".join(genres), "genre_mode": "all", "window": "5"}]
+    status, payload = request(server + "/batch", listed)
+    assert status == 200 and all("error" not in item for item in payload)
+    assert payload == request(server + "/batch", joined)[1]
+
+def test_batch_reports_bad_values_and_colliding_parameters_per_item(server, monkeypatch, state):
+    monkeypatch.setattr(api, "analysis_data", lambda: state)
+    items = [{"report": "price_by_year", "state": "x"}, {"report": "price_by_year", "name": "x"},
+             {"query": {"genres": [["Action"]]}}, {"query": {"metric": None}}, {"report": "price_by_year", "window": True},
+             {"report": "price_by_year"}]
+    status, payload = request(server + "/batch", items)
+    assert status == 200
+    assert all("error" in item for item in payload[:-1]) and "error" not in payload[-1]
@@ -0,0 +1,40 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from portfolio.cache import LRUCache, estimate_nbytes
+
+def scatter(points, seed=0):
+    values = np.random.default_rng(seed).random(points)
+    return go.Figure(go.Scattergl(x=values, y=values))
+
+def test_figure_size_counts_trace_data():
+    small, large = estimate_nbytes(scatter(1_000)), estimate_nbytes(scatter(100_000))
+    assert large >= 2 * 100_000 * 8
+    assert large > 50 * small
+    assert estimate_nbytes({"figure": scatter(100_000), "n": 3}) >= large
+
+def test_eviction_by_figure_bytes():
+    # Cada figura ocupa mais da metade do orçamento: a segunda tira a primeira, com folga no número de entradas
+    figure_bytes = estimate_nbytes(scatter(50_000))
+    cache = LRUCache(max_entries=10, max_bytes=int(figure_bytes * 1.5))
+    cache.put("a", {"figures": [scatter(50_000, seed=1)]})
+    cache.put("b", {"figures": [scatter(50_000, seed=2)]})
+    assert cache.get("a") is None and cache.get("b") is not None
+    stats = cache.stats()
+    assert stats["entries"] == 1 and stats["evictions"] == 1
+    assert figure_bytes <= stats["bytes"] <= cache.max_bytes
+
+def test_value_over_budget_is_not_cached():
+    cache = LRUCache(max_bytes=1000)
+    cache.put("small", np.zeros(10))
+    figure = scatter(10_000)
+    assert cache.put("figure", figure) is figure
+    assert cache.get("figure") is None and cache.get("small") is not None
+
+def test_put_uses_the_given_size(monkeypatch):
+    import portfolio.cache as cache_module
+    cache = LRUCache(max_bytes=1000)
+    monkeypatch.setattr(cache_module, "estimate_nbytes", lambda value: 1 / 0)
+    cache.put("a", np.zeros(10), nbytes=600)
+    cache.put("b", np.zeros(10), nbytes=600)
+    assert cache.get("a") is None and cache.stats()["bytes"] == 600
@@ -0,0 +1,16 @@
+import os
+
+from portfolio.certificates import CERTIFICATE_CACHE, certificate_bytes, list_certificates
+
+def test_listing_and_download_bytes(tmp_path):
+    (tmp_path / "Curso de Teste.pdf").write_bytes(b"%PDF-1")
+    (certificate,) = list_certificates(tmp_path)
+    assert (certificate.label, certificate.file_name) == ("Certificado - Curso de Teste", "certificado_de_curso_de_teste.pdf")
+    hits = CERTIFICATE_CACHE.hits
+    assert certificate_bytes(certificate) == b"%PDF-1"
+    assert certificate_bytes(certificate) == b"%PDF-1"
+    assert CERTIFICATE_CACHE.hits == hits + 1
+    # Arquivo trocado (outro tamanho e mtime): relido no próximo download
+    certificate.path.write_bytes(b"%PDF-2 atualizado")
+    os.utime(certificate.path, ns=(0, 10**9))
+    assert certificate_bytes(certificate) == b"%PDF-2 atualizado"
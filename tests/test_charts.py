@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio.charts import box_figure, box_stats
+
+def plotly_interp(values, p):
+    # Lib.interp do plotly.js (src/lib/stats.js), usado pelo quartilemethod 'linear' das caixas
+    position = p * len(values) - 0.5
+    if position < 0:
+        return values[0]
+    if position > len(values) - 1:
+        return values[-1]
+    frac = position % 1
+    return frac * values[int(np.ceil(position))] + (1 - frac) * values[int(np.floor(position))]
+
+def plotly_box(values):
+    # Caixa calculada como em src/traces/box/calc.js a partir das linhas
+    v = np.sort(np.asarray(values, dtype=np.float64))
+    q1, median, q3 = plotly_interp(v, 0.25), plotly_interp(v, 0.5), plotly_interp(v, 0.75)
+    low, high = 2.5 * q1 - 1.5 * q3, 2.5 * q3 - 1.5 * q1
+    return {'q1': q1, 'median': median, 'q3': q3,
+            'lowerfence': min(q1, v[v >= low][0]), 'upperfence': max(q3, v[v <= high][-1])}
+
+GROUPS = {
+    'um': [7.0],
+    'dois': [1.0, 4.0],
+    'quatro': [1.0, 2.0, 3.0, 4.0],
+    'empates': [0.0, 0.0, 0.0, 0.0, 9.99, 0.0, 0.0],
+    'outliers': [1.0, 2.0, 2.5, 3.0, 3.5, 4.0, 40.0, -30.0, 55.0],
+    'aleatorio': list(np.random.default_rng(5).lognormal(2, 1, 501)),
+}
+
+@pytest.fixture
+def stats():
+    values = np.concatenate([GROUPS[label] for label in GROUPS])
+    groups = np.repeat(list(GROUPS), [len(v) for v in GROUPS.values()])
+    return box_stats(values, groups, order=list(GROUPS))
+
+def test_quartiles_match_numpy_hazen(stats):
+    for label, values in GROUPS.items():
+        expected = np.percentile(values, [25, 50, 75], method='hazen')
+        assert stats.loc[label, ['q1', 'median', 'q3']].tolist() == pytest.approx(expected)
+        assert stats.loc[label, 'median'] == pytest.approx(np.median(values))
+        assert stats.loc[label, 'n'] == len(values) and stats.loc[label, 'mean'] == pytest.approx(np.mean(values))
+
+def test_box_matches_plotly_computation(stats):
+    for label, values in GROUPS.items():
+        expected = plotly_box(values)
+        assert stats.loc[label, list(expected)].tolist() == pytest.approx(list(expected.values())), label
+
+def test_outliers_are_the_values_outside_the_fences(stats):
+    for label, values in GROUPS.items():
+        values, row = np.asarray(values), stats.loc[label]
+        expected = values[(values < row['lowerfence']) | (values > row['upperfence'])]
+        assert sorted(row['outliers']) == sorted(expected)
+    assert sorted(stats.loc['outliers', 'outliers']) == [-30.0, 40.0, 55.0]
+
+def test_outlier_sample_is_bounded_and_nulls_are_dropped():
+    values = np.concatenate([np.zeros(1000), np.arange(1, 501) * 100.0, [np.nan] * 10])
+    stats = box_stats(values, ['a'] * len(values), max_outliers=50)
+    assert stats.loc['a', 'n'] == 1500 and len(stats.loc['a', 'outliers']) == 50
+    assert set(stats.loc['a', 'outliers']) <= set(np.arange(1, 501) * 100.0)
+
+def test_figure_draws_the_precomputed_stats(stats):
+    fig = box_figure(stats, 'titulo', 'x', 'y')
+    box = fig.data[0]
+    assert list(box.x) == list(GROUPS)
+    for key in ('q1', 'median', 'q3', 'lowerfence', 'upperfence', 'mean'):
+        assert list(getattr(box, key)) == pytest.approx(stats[key].tolist())
+    points = pd.Series(fig.data[1].y, index=fig.data[1].x)
+    assert sorted(points.loc['outliers']) == [-30.0, 40.0, 55.0]
+    assert len(fig.data[1].y) == stats['outliers'].map(len).sum()
@@ -0,0 +1,15 @@
+from portfolio.data import build_store
+from conftest import write_csv
+
+def test_dedup_ignores_columns_outside_ingest_schema(games, tmp_path):
+    # Mesmo AppID com 'About the game' diferente é o mesmo jogo; AppIDs diferentes com os mesmos valores lidos, não
+    base = games.iloc[:50].assign(**{'About the game': "Primeira versão"})
+    rewritten = games.iloc[:10].assign(**{'About the game': "Texto revisado"})
+    renumbered = games.iloc[:10].assign(AppID=games['AppID'].iloc[:10] + 10**6, **{'About the game': "Primeira versão"})
+    csv_path = write_csv(tmp_path / "games.csv", base, rewritten, renumbered)
+    df, logs = build_store(csv_path, tmp_path / "store")
+    assert "Encontradas 10 linhas duplicadas (AppID repetido). Mantendo a última de cada jogo..." in logs
+    assert df['AppID'].is_unique
+    expected, _ = build_store(write_csv(tmp_path / "base.csv", base), tmp_path / "base")
+    renumbered_ids = set(expected['AppID']) & set(rewritten['AppID'])
+    assert set(df['AppID']) == set(expected['AppID']) | {app_id + 10**6 for app_id in renumbered_ids}
@@ -0,0 +1,27 @@
+from streamlit.testing.v1 import AppTest
+
+from portfolio.metrics import REGISTRY
+from conftest import PROJECT_ROOT
+
+PAGE = str(PROJECT_ROOT / "pages" / "4_Diagnóstico.py")
+ADMIN_BUTTONS = {"Verificar o CSV agora", "Zerar métricas"}
+
+def run_page():
+    return AppTest.from_file(PAGE, default_timeout=60).run()
+
+def test_admin_buttons_hidden_by_default(monkeypatch):
+    monkeypatch.delenv("PORTFOLIO_ADMIN", raising=False)
+    at = run_page()
+    assert not at.exception
+    assert not ADMIN_BUTTONS & {button.label for button in at.button}
+
+def test_admin_buttons_with_flag(monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_ADMIN", "1")
+    with REGISTRY.span("test.span"):
+        pass
+    at = run_page()
+    assert not at.exception
+    labels = {button.label for button in at.button}
+    assert ADMIN_BUTTONS <= labels
+    next(button for button in at.button if button.label == "Zerar métricas").click().run()
+    assert "test.span" not in REGISTRY.snapshot()["spans"]
@@ -0,0 +1,82 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from portfolio.explorer import EXPLORER_COLUMNS, export_chunks, export_file, ordered_rows, page_count, page_frame, sort_permutation
+
+@pytest.fixture
+def frame(state):
+    # O store não tem nulos nas colunas ordenáveis: alguns são inseridos para conferir a posição dos ausentes
+    df = state.df.copy()
+    rng = np.random.default_rng(11)
+    for column in ('Price', 'Metacritic score', 'Release date', 'Estimated owners'):
+        missing = rng.random(len(df)) < 0.1
+        df[column] = df[column].astype('float32') if column == 'Metacritic score' else df[column]
+        df.loc[missing, column] = None
+    return df
+
+@pytest.fixture
+def mask(frame):
+    return (frame['Release Year'] >= frame['Release Year'].median()).to_numpy()
+
+def expected_order(df, mask, column, descending):
+    # Referência: filtro e sort_values estável do pandas, com os ausentes no fim nas duas direções
+    return df[mask].sort_values(column, ascending=not descending, kind='stable', na_position='last')
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("column", ['Price', 'Metacritic score', 'Release date', 'Estimated owners', 'Release Year', 'Total_Reviews'])
+def test_pages_equal_the_sorted_selection(frame, mask, column, descending):
+    expected = expected_order(frame, mask, column, descending)
+    positions = ordered_rows(mask, sort_permutation(frame, column, descending))
+    assert frame.index[positions].tolist() == expected.index.tolist()
+    page_size = 25
+    pages = [page_frame(frame, positions, page, page_size, EXPLORER_COLUMNS) for page in range(1, page_count(len(positions), page_size) + 1)]
+    assert all(len(page) == page_size for page in pages[:-1]) and 0 < len(pages[-1]) <= page_size
+    pd.testing.assert_frame_equal(pd.concat(pages), expected[EXPLORER_COLUMNS])
+
+def test_missing_values_go_last_in_both_directions(frame, mask):
+    for descending in (False, True):
+        positions = ordered_rows(mask, sort_permutation(frame, 'Price', descending))
+        missing = frame['Price'].isna().to_numpy()[positions]
+        assert missing.any() and not missing[:np.argmax(missing)].any() and missing[np.argmax(missing):].all()
+
+def test_unsorted_pages_keep_dataset_order(frame, mask):
+    positions = ordered_rows(mask)
+    pd.testing.assert_frame_equal(page_frame(frame, positions, 2, 10, ['Name']), frame[mask][['Name']].iloc[10:20])
+    assert page_count(0, 25) == 1 and page_count(25, 25) == 1 and page_count(26, 25) == 2
+
+@pytest.mark.parametrize("chunk_rows", [7, 10_000])
+def test_csv_export_round_trips(frame, mask, chunk_rows):
+    expected = expected_order(frame, mask, 'Price', True)[EXPLORER_COLUMNS].reset_index(drop=True)
+    positions = ordered_rows(mask, sort_permutation(frame, 'Price', True))
+    chunks = list(export_chunks(frame, positions, EXPLORER_COLUMNS, 'csv', chunk_rows=chunk_rows))
+    assert len(chunks) >= -(-len(positions) // chunk_rows)
+    exported = pd.read_csv(io.BytesIO(b"".join(chunks)))
+    assert list(exported.columns) == EXPLORER_COLUMNS
+    pd.testing.assert_frame_equal(exported, expected, check_dtype=False, check_exact=False, rtol=1e-6)
+
+@pytest.mark.parametrize("chunk_rows", [7, 10_000])
+def test_parquet_export_round_trips(frame, mask, chunk_rows):
+    columns = EXPLORER_COLUMNS + ['Release date', 'Estimated owners']
+    expected = expected_order(frame, mask, 'Metacritic score', False)[columns].reset_index(drop=True)
+    positions = ordered_rows(mask, sort_permutation(frame, 'Metacritic score'))
+    data = b"".join(export_chunks(frame, positions, columns, 'parquet', chunk_rows=chunk_rows))
+    table = pq.read_table(io.BytesIO(data))
+    assert table.num_rows == len(expected) and pq.ParquetFile(io.BytesIO(data)).num_row_groups == -(-len(expected) // chunk_rows)
+    pd.testing.assert_frame_equal(table.to_pandas(), expected)
+
+@pytest.mark.parametrize("fmt", ['csv', 'parquet'])
+def test_empty_selection_exports_only_the_header(frame, fmt):
+    file = export_file(frame, np.zeros(0, dtype=np.int64), EXPLORER_COLUMNS, fmt)
+    data = file.read()
+    exported = pd.read_csv(io.BytesIO(data)) if fmt == 'csv' else pq.read_table(io.BytesIO(data)).to_pandas()
+    assert exported.empty and list(exported.columns) == EXPLORER_COLUMNS
+
+def test_unknown_format_and_column(frame):
+    with pytest.raises(ValueError):
+        list(export_chunks(frame, np.arange(3), EXPLORER_COLUMNS, 'xlsx'))
+    with pytest.raises(ValueError):
+        sort_permutation(frame, 'Name')
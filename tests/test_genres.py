@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from portfolio.genres import build_genre_index, filter_genres
+
+GENRES = pd.Series([
+    'Action,Indie', 'Action RPG', 'RPG,Strategy', 'Indie', 'Action,RPG,Indie', 'Casual', 'Strategy,Action RPG',
+])
+
+def old_filter(genres, selected_genres):
+    # Filtro da versão anterior da página (substring, linha a linha)
+    return genres.apply(lambda x: any(g in x for g in selected_genres)).to_numpy()
+
+def exact_filter(genres, selected_genres, mode):
+    tokens = genres.str.split(',').apply(lambda values: {value.strip() for value in values})
+    combine = all if mode == 'all' else any
+    return tokens.apply(lambda row: combine(g in row for g in selected_genres)).to_numpy()
+
+@pytest.fixture
+def index():
+    return build_genre_index(GENRES)
+
+@pytest.mark.parametrize("selected", [['Indie'], ['Casual', 'Strategy'], ['Strategy', 'Indie', 'Casual']])
+def test_any_matches_old_filter_without_substring_genres(index, selected):
+    # Sem um gênero contido em outro, o filtro novo e o antigo selecionam as mesmas linhas
+    assert filter_genres(index, selected, 'any').tolist() == old_filter(GENRES, selected).tolist()
+
+@pytest.mark.parametrize("mode", ['any', 'all'])
+@pytest.mark.parametrize("selected", [['Action'], ['RPG'], ['Action', 'Indie'], ['RPG', 'Action RPG'], ['Indie', 'Strategy']])
+def test_modes_compare_exact_tokens(index, selected, mode):
+    assert filter_genres(index, selected, mode).tolist() == exact_filter(GENRES, selected, mode).tolist()
+
+def test_exact_token_is_not_a_substring_match(index):
+    # O filtro antigo casava "Action" com "Action RPG" e "RPG" com "Action RPG"; o novo só casa o gênero exato
+    assert old_filter(GENRES, ['Action']).tolist() == [True, True, False, False, True, False, True]
+    assert filter_genres(index, ['Action']).tolist() == [True, False, False, False, True, False, False]
+    assert filter_genres(index, ['Action RPG']).tolist() == [False, True, False, False, False, False, True]
+    assert filter_genres(index, ['RPG']).tolist() == [False, False, True, False, True, False, False]
+
+def test_unknown_genre(index):
+    assert not filter_genres(index, ['Sports']).any()
+    assert filter_genres(index, ['Sports', 'Casual']).tolist() == old_filter(GENRES, ['Sports', 'Casual']).tolist()
+    # Em 'all', um gênero que nenhuma linha tem esvazia a seleção
+    assert not filter_genres(index, ['Casual', 'Sports'], 'all').any()
+
+def test_empty_selection_keeps_every_row(index):
+    for mode in ('any', 'all'):
+        assert filter_genres(index, [], mode).tolist() == [True] * len(GENRES)
+
+def test_unknown_mode(index):
+    with pytest.raises(ValueError):
+        filter_genres(index, ['Indie'], 'none')
@@ -0,0 +1,45 @@
+import pandas as pd
+
+from portfolio.data import build_store, load_games, read_store
+from conftest import games_frame, write_csv
+
+def append_csv(path, frame):
+    frame.to_csv(path, mode="a", header=False, index=False)
+
+def assert_append_matches_rebuild(csv_path, tmp_path):
+    appended, logs = load_games(csv_path, tmp_path / "store")
+    assert any("processando apenas o trecho acrescentado" in line for line in logs)
+    rebuilt, _ = build_store(csv_path, tmp_path / "rebuilt")
+    pd.testing.assert_frame_equal(read_store(tmp_path / "store"), read_store(tmp_path / "rebuilt"))
+    pd.testing.assert_frame_equal(appended, rebuilt)
+
+def test_append_keeps_store_dtypes(games, tmp_path):
+    # Um nulo em 'Achievements' no arquivo original deixa a coluna em float32; o trecho novo não tem nulos
+    base = games.copy()
+    base.loc[5, 'Achievements'] = None
+    csv_path = write_csv(tmp_path / "games.csv", base)
+    load_games(csv_path, tmp_path / "store")
+    append_csv(csv_path, games_frame(50, seed=1, first_id=10**6))
+    assert_append_matches_rebuild(csv_path, tmp_path)
+    assert read_store(tmp_path / "store")['Achievements'].dtype == 'float32'
+
+def test_append_turns_counts_into_int_when_nulls_are_gone(games, tmp_path):
+    # Sem nulos no arquivo inteiro as contagens são int32 na reconstrução completa; o trecho novo segue a mesma regra
+    csv_path = write_csv(tmp_path / "games.csv", games)
+    load_games(csv_path, tmp_path / "store")
+    delta = games_frame(50, seed=1, first_id=10**6)
+    delta.loc[3, 'Recommendations'] = None
+    append_csv(csv_path, delta)
+    assert_append_matches_rebuild(csv_path, tmp_path)
+    assert read_store(tmp_path / "store")['Recommendations'].dtype == 'float32'
+
+def test_append_replaces_rows_like_a_rebuild(games, tmp_path):
+    # Linhas acrescentadas com AppIDs já existentes substituem as anteriores, também na reconstrução completa
+    csv_path = write_csv(tmp_path / "games.csv", games)
+    load_games(csv_path, tmp_path / "store")
+    updated = games.iloc[10:30].assign(Price=0.0, Name="Atualizado")
+    append_csv(csv_path, pd.concat([updated, games_frame(20, seed=2, first_id=10**6)]))
+    assert_append_matches_rebuild(csv_path, tmp_path)
+    df = read_store(tmp_path / "store")
+    assert len(df) == len(read_store(tmp_path / "rebuilt")) and df['AppID'].is_unique
+    assert set(df.loc[df['AppID'].isin(updated['AppID']), 'Name']) == {"Atualizado"}
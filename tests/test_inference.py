@@ -0,0 +1,65 @@
+import itertools
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from portfolio.inference import bootstrap_mean_interval, correlation, moments, ols_line, permutation_test, t_interval, welch_test
+
+# Exemplo 1 de "Welch's t-test" (Wikipedia): t = -2.46, gl = 24.9, p = 0.021
+WELCH_A = [27.5, 21.0, 19.0, 23.6, 17.0, 17.9, 16.9, 20.1, 21.9, 22.6, 23.1, 19.6, 19.0, 21.7, 21.4]
+WELCH_B = [27.1, 22.0, 20.8, 23.4, 23.4, 23.5, 25.8, 22.0, 24.8, 20.2, 21.9, 22.1, 22.9, 20.5, 24.4]
+
+def test_t_interval_known_values():
+    # 1..10: média 5.5, s² = 55/6, t(0.975; 9) = 2.262157
+    lower, upper = t_interval(*moments(np.arange(1, 11)), 0.95)
+    assert lower == pytest.approx(3.334149410331831) and upper == pytest.approx(7.665850589668169)
+    assert t_interval(*moments([4.0]), 0.95) is None
+
+def test_welch_test_known_values():
+    t_stat, p_value = welch_test(moments(WELCH_A), moments(WELCH_B))
+    assert t_stat == pytest.approx(-2.455356, abs=1e-6) and p_value == pytest.approx(0.021378, abs=1e-6)
+    expected = stats.ttest_ind(WELCH_A, WELCH_B, equal_var=False)
+    assert (t_stat, p_value) == pytest.approx((expected.statistic, expected.pvalue), rel=1e-12)
+
+def test_correlation_from_sums_matches_corrcoef():
+    rng = np.random.default_rng(3)
+    x = rng.normal(70, 10, 500)
+    y = 0.3 * x + rng.normal(0, 5, 500)
+    sums = (len(x), x.sum(), y.sum(), (x * x).sum(), (y * y).sum(), (x * y).sum())
+    assert correlation(*sums) == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-9)
+    # x constante (1, 1, 1): sem correlação definida
+    assert np.isnan(correlation(3, 3.0, 6.0, 3.0, 14.0, 6.0))
+
+def test_ols_line_known_values():
+    x = np.arange(10.0)
+    assert ols_line(x, 2 * x + 1) == pytest.approx((2.0, 1.0))
+    rng = np.random.default_rng(4)
+    x, y = rng.random(200), rng.random(200)
+    assert ols_line(x, y) == pytest.approx(tuple(np.polyfit(x, y, 1)), rel=1e-9)
+    # Sem variação em x: reta horizontal na média
+    assert ols_line([2.0, 2.0, 2.0], [1.0, 2.0, 6.0]) == pytest.approx((0.0, 3.0))
+
+def test_bootstrap_interval_is_seeded_and_close_to_t_interval():
+    values = np.random.default_rng(42).normal(10, 2, 200)
+    interval = bootstrap_mean_interval(values, 0.95)
+    assert interval == pytest.approx((9.69282927301647, 10.183763674954273), rel=1e-12)
+    assert bootstrap_mean_interval(values, 0.95, seed=0) == interval
+    assert bootstrap_mean_interval(values, 0.95, seed=1) != interval
+    # Com 200 valores normais, o intervalo percentil fica perto do intervalo t
+    assert interval == pytest.approx(t_interval(*moments(values), 0.95), abs=0.02)
+    assert bootstrap_mean_interval([np.nan, 1.0], 0.95) is None
+
+def test_permutation_test_is_seeded():
+    observed, p_value = permutation_test(WELCH_A, WELCH_B)
+    assert observed == pytest.approx(np.mean(WELCH_A) - np.mean(WELCH_B))
+    assert p_value == pytest.approx(0.02097902097902098, rel=1e-12)
+    assert permutation_test(WELCH_A, WELCH_B, seed=0) == (observed, p_value)
+
+def test_permutation_test_approaches_the_exact_p_value():
+    # Grupos pequenos: o valor p exato sai de todas as C(12, 6) = 924 divisões
+    a, b = [12.1, 14.3, 13.8, 15.0, 12.9, 14.7], [11.2, 12.4, 11.9, 13.1, 12.0, 12.6]
+    pooled, observed = np.array(a + b), np.mean(a) - np.mean(b)
+    diffs = [pooled[list(split)].mean() - np.delete(pooled, split).mean() for split in itertools.combinations(range(12), 6)]
+    exact = np.mean(np.abs(diffs) >= abs(observed) - 1e-12)
+    assert permutation_test(a, b, n_permutations=20_000)[1] == pytest.approx(exact, abs=0.005)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio.owners import format_numbers, parse_owner_ranges
+
+# --- VERSÃO ANTERIOR (pages/3_Análise_de_dados.py), COMO REFERÊNCIA ---
+
+def format_number(n):
+    if n >= 1e9: return f'{n/1e9:.0f}B'
+    if n >= 1e6: return f'{n/1e6:.0f}M'
+    if n >= 1e3: return f'{n/1e3:.0f}K'
+    return str(n)
+
+def format_estimated_owners(owner_range):
+    parts = owner_range.replace(',', '').split(' - ')
+    if len(parts) == 2:
+        start, end = int(parts[0]), int(parts[1])
+        return f"{format_number(start)} - {format_number(end)}"
+    return owner_range.replace(',', '')
+
+def sort_key(s):
+    try:
+        if ' - ' in s:
+            parts = s.split(' - ')
+            start = int(parts[0].replace('K', '000').replace('M', '000000').replace('B', '000000000'))
+            end = int(parts[1].replace('K', '000').replace('M', '000000').replace('B', '000000000'))
+            return (start, end)
+        return (int(s.replace('K', '000').replace('M', '000000').replace('B', '000000000')), 0)
+    except:
+        return (9999999999, 9999999999)
+
+STEAM_RANGES = ['0 - 0', '0 - 20000', '20000 - 50000', '50000 - 100000', '100000 - 200000', '200000 - 500000',
+                '500000 - 1000000', '1000000 - 2000000', '2000000 - 5000000', '5000000 - 10000000',
+                '10000000 - 20000000', '20000000 - 50000000', '50000000 - 100000000', '100000000 - 200000000']
+
+def random_ranges(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lower = rng.integers(0, 10 ** rng.integers(1, 11, n))
+    upper = lower + rng.integers(0, 10 ** rng.integers(1, 11, n))
+    return [f"{a:,} - {b:,}" if i % 2 else f"{a} - {b}" for i, (a, b) in enumerate(zip(lower, upper))]
+
+# --- EQUIVALÊNCIA ---
+
+def test_format_numbers_matches_format_number():
+    values = np.r_[0, 1, 999, 1000, 1499, 1500, 2500, 999_499, 999_500, 10**6, 2_500_000, 10**9, 3_500_000_000,
+                   np.random.default_rng(1).integers(0, 10**11, 5000)]
+    assert format_numbers(values).tolist() == [format_number(int(v)) for v in values]
+
+@pytest.mark.parametrize("dtype", [object, 'category'])
+def test_labels_match_format_estimated_owners(dtype):
+    raw = pd.Series(random_ranges(20_000) + STEAM_RANGES, dtype=dtype)
+    labels = parse_owner_ranges(raw)['Estimated owners']
+    assert labels.astype(str).tolist() == [format_estimated_owners(value) for value in raw.astype(str)]
+
+def test_bounds_are_the_parsed_range():
+    parsed = parse_owner_ranges(pd.Series(['20,000 - 50,000', '0 - 0']))
+    assert parsed['Owners lower'].tolist() == [20000, 0]
+    assert parsed['Owners upper'].tolist() == [50000, 0]
+
+def test_category_order_matches_sort_key_on_steam_ranges():
+    raw = pd.Series(STEAM_RANGES[::-1], dtype='category')
+    categories = list(parse_owner_ranges(raw)['Estimated owners'].cat.categories)
+    assert categories == sorted({format_estimated_owners(value) for value in STEAM_RANGES}, key=sort_key)
+
+def test_malformed_ranges_and_nan():
+    raw = pd.Series(['20000 - 50000', 'abc', '1,500', None, '1 - x', '0 - 20000'], dtype=object)
+    parsed = parse_owner_ranges(raw)
+    labels = parsed['Estimated owners']
+    # Texto fora do formato "início - fim": mesmo rótulo da versão anterior (sem vírgulas) e limites -1
+    assert labels[1] == format_estimated_owners('abc') == 'abc'
+    assert labels[2] == format_estimated_owners('1,500') == '1500'
+    # A versão anterior falhava com NaN e com faixas não numéricas; agora viram rótulos sem limites
+    assert labels[3] == 'Desconhecido'
+    assert labels[4] == '1 - x'
+    with pytest.raises(ValueError):
+        format_estimated_owners('1 - x')
+    assert parsed['Owners lower'].tolist() == [20000, -1, -1, -1, -1, 0]
+    # Faixas reconhecidas primeiro, na ordem numérica; as demais por último. sort_key punha '1500' entre as faixas
+    # (como 1500 - 0) e as demais no fim, na ordem em que chegassem.
+    assert list(labels.cat.categories) == ['0 - 20K', '20K - 50K', '1 - x', '1500', 'Desconhecido', 'abc']
@@ -0,0 +1,28 @@
+import pandas as pd
+
+from portfolio.data import build_store, build_store_parallel, build_store_streaming
+from portfolio.parallel import csv_byte_ranges
+from conftest import write_csv
+
+def test_parallel_partition_with_only_repeated_rows(games, tmp_path):
+    # O arquivo termina com três cópias das 100 primeiras linhas: com partições pequenas, alguma fica só com duplicatas
+    csv_path = write_csv(tmp_path / "games.csv", games, *[games.iloc[:100]] * 3)
+    part_bytes = csv_path.stat().st_size // 8
+    _, ranges = csv_byte_ranges(csv_path, part_bytes)
+    assert len(ranges) >= 6
+    df, logs = build_store_parallel(csv_path, tmp_path / "parallel", workers=2, part_bytes=part_bytes)
+    expected, _ = build_store_streaming(csv_path, tmp_path / "streaming", chunk_rows=100)
+    assert "Encontradas 300 linhas duplicadas (AppID repetido). Mantendo a última de cada jogo..." in logs
+    assert df.equals(expected)
+
+def test_all_paths_keep_the_last_row_of_each_app_id(games, tmp_path):
+    # Linhas repetidas com conteúdo diferente: vale a última do arquivo, no processamento completo e nos em pedaços
+    updated = games.iloc[:40].assign(Price=games['Price'].iloc[:40] + 1, Name="Atualizado")
+    csv_path = write_csv(tmp_path / "games.csv", games.iloc[:150], updated, games.iloc[150:])
+    full, _ = build_store(csv_path, tmp_path / "full")
+    streaming, _ = build_store_streaming(csv_path, tmp_path / "streaming", chunk_rows=64)
+    parallel, _ = build_store_parallel(csv_path, tmp_path / "parallel", workers=2, part_bytes=csv_path.stat().st_size // 5)
+    pd.testing.assert_frame_equal(streaming, full)
+    pd.testing.assert_frame_equal(parallel, full)
+    assert full['AppID'].is_unique
+    assert set(full.loc[full['AppID'].isin(updated['AppID']), 'Name']) == {"Atualizado"}
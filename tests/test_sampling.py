@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio.sampling import row_priorities, sample_games, sample_positions
+from conftest import PROJECT_ROOT, games_frame
+
+@pytest.fixture(scope="module")
+def frame():
+    return games_frame(2000, seed=7)
+
+def test_priorities_are_splitmix64():
+    # Primeira saída do splitmix64 com estado 0 (o AppID 0 com semente 1 cai exatamente nesse estado)
+    assert row_priorities([0], seed=1)[0] == (0xE220A8397B1DCDAF >> 11) / 2**53
+    priorities = row_priorities(np.arange(100_000))
+    assert ((priorities >= 0) & (priorities < 1)).all() and len(np.unique(priorities)) == len(priorities)
+    assert 0.49 < priorities.mean() < 0.51
+
+def test_sample_is_the_same_on_every_rerun_and_process(frame):
+    sample = sample_games(frame, 100)['AppID'].tolist()
+    assert sample_games(frame, 100)['AppID'].tolist() == sample
+    # Outro processo, com outra semente de hash: mesma amostra
+    code = ("import sys; sys.path.insert(0, 'tests'); from conftest import games_frame; from portfolio.sampling import sample_games; "
+            "print(sample_games(games_frame(2000, seed=7), 100)['AppID'].tolist())")
+    output = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env={"PYTHONHASHSEED": "123"}, capture_output=True, text=True, check=True).stdout
+    assert output.strip() == str(sample)
+
+def test_sample_does_not_depend_on_row_order(frame):
+    shuffled = frame.sample(frac=1, random_state=3)
+    assert set(sample_games(shuffled, 100)['AppID']) == set(sample_games(frame, 100)['AppID'])
+
+def test_narrower_filter_keeps_the_sampled_rows(frame):
+    # Bottom-k: um jogo amostrado na seleção maior continua na amostra de qualquer subconjunto que o contenha
+    wide = set(sample_games(frame, 200)['AppID'])
+    for mask in (frame['Price'] > frame['Price'].median(), frame['Positive'] > 100, frame['AppID'] % 3 == 0):
+        narrow = frame[mask]
+        assert wide & set(narrow['AppID']) <= set(sample_games(narrow, 200)['AppID'])
+    assert set(sample_games(frame, 50)['AppID']) <= wide
+
+def test_sample_size_at_least_the_selection_returns_every_row(frame):
+    small = frame.iloc[:30]
+    for size in (30, 31, 1000):
+        pd.testing.assert_frame_equal(sample_games(small, size), small)
+    assert sample_positions(np.array([]), 10).tolist() == []
+    assert len(sample_games(frame, 29)) == 29
+
+def test_stratified_sample_gives_each_stratum_its_quota(frame):
+    sample = sample_games(frame, 200, stratify_by='Estimated owners')
+    counts = frame['Estimated owners'].value_counts()
+    sampled = sample['Estimated owners'].value_counts().reindex(counts.index, fill_value=0)
+    quotas = np.minimum(counts, np.maximum(1, np.floor(counts * 200 / len(frame))))
+    assert (sampled == quotas).all()
+    assert sample['AppID'].is_unique and sample.index.is_monotonic_increasing
@@ -0,0 +1,73 @@
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio.search import SEARCH_FIELDS, build_search_index, complete, search
+
+ACCENTED = pd.DataFrame({
+    'Name': ['Pokémon Café', 'Cafe Racer', 'Über Straße', 'Ça Ira', 'Naïve Art 2', 'The Witcher 3: Wild Hunt', None, 'AÇÃO Total'],
+    'Developers': ['Game Freak', 'Café Studio', 'Straße Games', 'Ubisoft', 'Naive Co', 'CD PROJEKT RED', 'Valve', 'Estúdio Ação'],
+    'Publishers': ['Nintendo', 'Indie', 'Über Verlag', 'Ubisoft', None, 'CD PROJEKT RED', 'Valve', 'Ação Ltda'],
+    'Tags': ['RPG,Cute', 'Racing,Indie', 'Simulation', 'Strategy,Historical', 'Casual,2D', 'RPG,Open World', 'FPS', 'Action,Ação'],
+})
+
+def normalize(text):
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in text if unicodedata.category(c) != "Mn")
+
+def naive_search(df, text, fields=None):
+    # Varredura linha a linha com str.contains: cada termo completo casa um token inteiro e o último, enquanto é
+    # digitado, o começo de um token, em algum dos campos
+    terms = re.findall(r"[^\W_]+", normalize(text))
+    if not terms:
+        return set()
+    typing = not text[-1:].isspace()
+    columns = [df[field].fillna('').map(normalize) for field in (fields or SEARCH_FIELDS)]
+    mask = np.ones(len(df), dtype=bool)
+    for i, term in enumerate(terms):
+        end = '' if typing and i == len(terms) - 1 else r'(?![^\W_])'
+        pattern = r'(?<![^\W_])' + re.escape(term) + end
+        mask &= np.logical_or.reduce([column.str.contains(pattern, regex=True).to_numpy() for column in columns])
+    return set(np.flatnonzero(mask))
+
+def found(index, text, fields=None):
+    rows, total = search(index, text, fields)
+    assert total == len(rows) and len(set(rows)) == len(rows)
+    return set(rows.tolist())
+
+@pytest.fixture(scope="module")
+def accented_index():
+    return build_search_index(ACCENTED)
+
+@pytest.mark.parametrize("text", ["", " ", "   ", "!!", "-"])
+def test_empty_query_finds_nothing(accented_index, text):
+    assert found(accented_index, text) == set() == naive_search(ACCENTED, text)
+    assert complete(accented_index, text) == []
+
+@pytest.mark.parametrize("text", ["cafe", "café", "CAFÉ", "pokemon", "pokémon ", "ubér", "straße", "strasse", "ca", "ça", "acao",
+                                  "ação total", "naive", "naïve art", "estudio", "witcher 3", "3 witcher", "wild hunt ", "cd projekt"])
+def test_accented_terms_match_the_naive_scan(accented_index, text):
+    assert found(accented_index, text) == naive_search(ACCENTED, text)
+
+@pytest.mark.parametrize("fields", [['Name'], ['Developers', 'Publishers'], ['Tags']])
+@pytest.mark.parametrize("text", ["cafe", "ubisoft", "rpg", "ação", "u"])
+def test_field_restriction_matches_the_naive_scan(accented_index, text, fields):
+    assert found(accented_index, text, fields) == naive_search(ACCENTED, text, fields)
+
+@pytest.mark.parametrize("text", ["g", "2", "a", "s", "game", "game ", "game 2", "lost 2 ", "sports game", "action game s", "zzz", "game zzz"])
+def test_prefixes_and_multi_term_queries_match_the_naive_scan(state, text):
+    # Termos completos exigem o token inteiro; só o último termo (sem espaço depois) casa por prefixo
+    assert found(state.search, text) == naive_search(state.df, text)
+
+def test_all_terms_are_required(state):
+    both = found(state.search, "game sports ")
+    assert both == found(state.search, "game ") & found(state.search, "sports ")
+    assert both and both < found(state.search, "game ")
+
+def test_within_restricts_to_the_selection(state):
+    within = (state.df['Price'] > state.df['Price'].median()).to_numpy()
+    rows, total = search(state.search, "game", within=within)
+    assert total == len(rows) and set(rows.tolist()) == found(state.search, "game") & set(np.flatnonzero(within))
@@ -0,0 +1,61 @@
+import threading
+
+import pandas as pd
+
+from portfolio.data import build_store, ingest_delta_csv, load_games, read_store
+from conftest import games_frame, write_csv
+
+def load_concurrently(csv_path, store_dir, n=4):
+    # flock vale por arquivo aberto: threads do mesmo processo disputam o lock como processos diferentes
+    barrier, logs = threading.Barrier(n), [None] * n
+
+    def worker(i):
+        barrier.wait()
+        logs[i] = load_games(csv_path, store_dir)[1]
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return logs
+
+def test_only_one_process_builds_the_store(games, tmp_path):
+    csv_path = write_csv(tmp_path / "games.csv", games)
+    logs = load_concurrently(csv_path, tmp_path / "store")
+    builds = [log for log in logs if any(line.startswith("Iniciando carregamento") for line in log[:1])]
+    assert len(builds) == 1
+    assert all(log[0].startswith("Dados carregados do cache colunar") for log in logs if log not in builds)
+
+def test_only_one_process_applies_an_append(games, tmp_path):
+    csv_path = write_csv(tmp_path / "games.csv", games.iloc[:200])
+    load_games(csv_path, tmp_path / "store")
+    games.iloc[200:].to_csv(csv_path, mode="a", header=False, index=False)
+    logs = load_concurrently(csv_path, tmp_path / "store")
+    appliers = [log for log in logs if not log[0].startswith("Dados carregados do cache colunar")]
+    assert len(appliers) == 1 and any("trecho acrescentado" in line for line in appliers[0])
+    # Os resumos por valor não foram contados duas vezes: o corte de preço é o mesmo de uma reconstrução
+    pd.testing.assert_frame_equal(read_store(tmp_path / "store"), build_store(csv_path, tmp_path / "rebuilt")[0])
+
+def test_concurrent_deltas_are_all_merged(games, tmp_path):
+    load_games(write_csv(tmp_path / "games.csv", games), tmp_path / "store")
+    deltas = [write_csv(tmp_path / f"delta{i}.csv", games_frame(20, seed=i + 1, first_id=10_000 * (i + 1))) for i in range(3)]
+    barrier, errors = threading.Barrier(len(deltas)), []
+
+    def worker(path):
+        barrier.wait()
+        try:
+            ingest_delta_csv(path, tmp_path / "store")
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker, args=(path,)) for path in deltas]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    # Cada mescla relê o store sob o lock: nenhuma perde as linhas gravadas pelas outras
+    stored = read_store(tmp_path / "store")
+    assert stored['AppID'].is_unique
+    assert set(stored['AppID']) >= set().union(*(set(pd.read_csv(path)['AppID']) for path in deltas))
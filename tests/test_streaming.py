@@ -0,0 +1,50 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from portfolio.data import build_store_streaming, read_store
+from portfolio.streaming import KeySet, last_occurrences
+from conftest import write_csv
+
+def test_key_set_ignores_empty_add():
+    seen = KeySet()
+    seen.add(np.array([3, 1, 2], dtype=np.uint64))
+    seen.add(np.array([], dtype=np.uint64))
+    assert seen.contains(np.array([1, 4], dtype=np.uint64)).tolist() == [True, False]
+
+def test_streaming_chunk_with_only_repeated_rows(games, tmp_path):
+    # Do fim para o começo: o segundo pedaço é todo repetido pelo terceiro, e o primeiro ainda é consultado depois dele
+    csv_path = write_csv(tmp_path / "games.csv", games.iloc[:100], games.iloc[100:200], games.iloc[100:200], games.iloc[200:])
+    df, logs = build_store_streaming(csv_path, tmp_path / "store", chunk_rows=100)
+    assert "Encontradas 100 linhas duplicadas (AppID repetido). Mantendo a última de cada jogo..." in logs
+    assert sorted(read_store(tmp_path / "store")['AppID']) == sorted(df['AppID'])
+    assert df['AppID'].is_unique
+    assert set(df['AppID']) <= set(games['AppID'])
+
+def test_key_set_last_occurrences():
+    keeps = last_occurrences([np.array([1, 2, 1]), np.array([3, 2]), np.array([], dtype=np.int64), np.array([4, 3])])
+    assert [keep.tolist() for keep in keeps] == [[False, False, True], [False, True], [], [True, True]]
+
+def test_concurrent_builds_keep_their_own_partitions(games, tmp_path):
+    # Duas montagens na mesma pasta de store (ex.: duas réplicas sem o lock de load_games) não apagam as partições
+    # uma da outra
+    csv_path = write_csv(tmp_path / "games.csv", games)
+    store_dir = tmp_path / "store"
+    results, errors = [], []
+
+    def build():
+        try:
+            results.append(build_store_streaming(csv_path, store_dir, chunk_rows=20)[0])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=build) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    pd.testing.assert_frame_equal(results[0], results[1])
+    pd.testing.assert_frame_equal(read_store(store_dir), results[0])
+    assert not list(store_dir.glob("games.parts*"))